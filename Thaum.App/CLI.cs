@@ -1,3 +1,4 @@
+using System.Runtime.CompilerServices;
 using Microsoft.Extensions.Logging;
 using McMaster.Extensions.CommandLineUtils;
 using Ratatui;
@@ -17,40 +18,65 @@ namespace Thaum.CLI;
 /// feedback where trace logging enables debugging through consciousness stream observation
 /// </summary>
 public partial class CLI {
-	private readonly ILogger<CLI>      _logger;
-	private readonly LLM               _llm;
-	private readonly Crawler           _crawler;
-	private readonly Prompter          _prompter;
-	private readonly Defragmentor      _defrag;
-	private readonly PerceptualColorer _colorer;
+	private readonly ILogger<CLI> _logger;
+
+	// Heavy services are constructed on first use so commands like ls-env and help
+	// never pay for tree-sitter grammars, the cache database or the HTTP stack
+	private LLM?               _llm;
+	private Crawler?           _crawler;
+	private Prompter?          _prompter;
+	private Defragmentor?      _defrag;
+	private PerceptualColorer? _colorer;
+	private ICache?            _resultCache;
+
+	private LLM               Llm      => _llm ??= CreateLlm();
+	private Crawler           Crawler  => _crawler ??= CreateCrawler();
+	private Prompter          Prompter => _prompter ??= new Prompter(Llm);
+	private Defragmentor      Defrag   => _defrag ??= CreateDefrag();
+	private PerceptualColorer Colorer  => _colorer ??= new PerceptualColorer();
+
+	private ICache ResultCache => _resultCache ??= CreateResultCache();
+
+	// Factories stay out of line so the getters can inline into command handlers without the JIT
+	// resolving HttpClient, the tree-sitter bindings or Microsoft.Data.Sqlite until construction
+	// actually runs where the equivalent of a function-local import defers those assembly loads
+	// The response cache (and its SQLite database) is only opened when LLM:CacheResponses opts in
+	[MethodImpl(MethodImplOptions.NoInlining)]
+	private LLM CreateLlm() {
+		LLM http = new HttpLLM(GLB.AppConfig);
+		return GLB.CacheLLMResponses ? new CachedLLM(http, ResultCache) : http;
+	}
+
+	[MethodImpl(MethodImplOptions.NoInlining)]
+	private static ICache CreateResultCache() => new Cache(GLB.AppConfig);
+
+	[MethodImpl(MethodImplOptions.NoInlining)]
+	private static Crawler CreateCrawler() => new TreeSitterCrawler();
+
+	[MethodImpl(MethodImplOptions.NoInlining)]
+	private Defragmentor CreateDefrag() {
+		// Defrag walks many templates so their reads overlap with crawling instead of each stalling later
+		// where PreloadAsync handles and logs its own failures so the discarded task never faults unobserved
+		PromptLoader prompts = new PromptLoader();
+		_ = prompts.PreloadAsync();
+		return new Defragmentor(Llm, Crawler, ResultCache, prompts);
+	}
 
 	/// <summary>
-	/// Initializes CLI with ambient services where HttpLLM provides AI capabilities where
-	/// TreeSitterCrawler enables code analysis where PerceptualColorer creates visual semantics
-	/// where EnvLoader enables hierarchical config where trace logging captures execution flow
+	/// Initializes CLI with ambient services where EnvLoader enables hierarchical config before any
+	/// component reads configuration where HttpLLM, TreeSitterCrawler and PerceptualColorer are
+	/// deferred until a command touches them where trace logging captures execution flow
 	/// </summary>
 	public CLI() {
-		HttpClient httpClient = new HttpClient();
-
-		_crawler = new TreeSitterCrawler();
-		_logger  = RatLog.Get<CLI>();
-		_colorer = new PerceptualColorer();
+		_logger = RatLog.Get<CLI>();
 
 		// Initialize trace logger first
 		Initialize(_logger);
 		tracein();
 
-		// Load .env files before constructing components that read configuration
+		// Load .env files before any lazily constructed component reads configuration
 		EnvLoader.LoadAndApply();
 
-		// Now construct LLM and dependent services with environment-applied configuration
-		_llm      = new HttpLLM(httpClient, GLB.AppConfig);
-		_prompter = new Prompter(_llm);
-
-		Cache        cache        = new Cache(GLB.AppConfig);
-		PromptLoader promptLoader = new PromptLoader();
-
-		_defrag = new Defragmentor(_llm, _crawler, cache, promptLoader);
 		traceout();
 	}
 
@@ -72,7 +98,8 @@ public partial class CLI {
 		// Default to help when no args provided
 		app.OnExecute(() => {
 			trace("No arguments provided, showing help");
-			app.ShowHelp();
+			// Render the full help text up front and emit it with one write instead of line by line
+			app.Out.Write(app.GetHelpText());
 			return 0;
 		});
 
@@ -41,7 +41,7 @@ public partial class CLI {
 		CodeMap codeMap = await AnsiConsole.Status()
 			.Spinner(Spinner.Known.Dots)
 			.SpinnerStyle(Style.Parse("green"))
-			.StartAsync("Scanning workspace for functions", async _ => await _crawler.CrawlDir(root));
+			.StartAsync("Scanning workspace for functions", async _ => await Crawler.CrawlDir(root));
 		List<CodeSymbol> symbols = codeMap.Where(s => s.Kind is SymbolKind.Method or SymbolKind.Function).ToList();
 		if (sampleN is int n and > 0 && n < symbols.Count) {
 			Random rng = seed is int s ? new Random(s) : Random.Shared;
@@ -67,7 +67,7 @@ public partial class CLI {
 			try {
 				if (cancellationToken.IsCancellationRequested) return;
 				Stopwatch symSw = Stopwatch.StartNew();
-				string    src   = await _crawler.GetCode(sym) ?? string.Empty;
+				string    src   = await Crawler.GetCode(sym) ?? string.Empty;
 				if (string.IsNullOrWhiteSpace(src)) {
 					errors.Add((sym.FilePath, sym.Name, "Empty source slice"));
 					return;
@@ -83,7 +83,7 @@ public partial class CLI {
 
 				// Stream and capture output
 				StringBuilder            sb     = new StringBuilder();
-				IAsyncEnumerable<string> stream = await _llm.StreamCompleteAsync(builtPrompt, GLB.CompressionOptions(model));
+				IAsyncEnumerable<string> stream = await Llm.StreamCompleteAsync(builtPrompt, GLB.CompressionOptions(model));
 				await foreach (string token in stream.WithCancellation(cancellationToken)) sb.Append(token);
 
 				// Parse triad and log a dense summary
@@ -141,7 +141,7 @@ public partial class CLI {
 				if (!complete && retryIncomplete > 0) {
 					for (int attempt = 1; attempt <= retryIncomplete && !complete; attempt++) {
 						// First try a repair pass (fill ONLY missing tags)
-						(FunctionTriad merged, string rawRepair) = await TriadRepairer.RepairAsync(_llm, sym, src, triad, GLB.CompressionOptions(model));
+						(FunctionTriad merged, string rawRepair) = await TriadRepairer.RepairAsync(Llm, sym, src, triad, GLB.CompressionOptions(model));
 						SessionSaveResult repRes = await ArtifactSaver.SaveSessionAsync(sym, sym.FilePath, builtPrompt, rawRepair, null, sessionRoot, fileSuffix: $"-repair{attempt}");
 						triad    = merged;
 						complete = triad.IsComplete;
@@ -163,7 +163,7 @@ public partial class CLI {
 
 						// Fallback: full re-roll
 						StringBuilder            sb2     = new StringBuilder();
-						IAsyncEnumerable<string> stream2 = await _llm.StreamCompleteAsync(builtPrompt, GLB.CompressionOptions(model));
+						IAsyncEnumerable<string> stream2 = await Llm.StreamCompleteAsync(builtPrompt, GLB.CompressionOptions(model));
 						await foreach (string token in stream2.WithCancellation(cancellationToken)) sb2.Append(token);
 						string rerollText = sb2.ToString();
 						triad    = TriadSerializer.ParseTriadText(rerollText, sym, sym.FilePath, null);
@@ -35,7 +35,7 @@ public partial class CLI {
 				ProgressTask task = ctx.AddTask($"Scanning files ({files.Count})", maxValue: files.Count);
 				foreach (string file in files) {
 					try {
-						CodeMap codeMap = await _crawler.CrawlFile(file);
+						CodeMap codeMap = await Crawler.CrawlFile(file);
 						foreach (CodeSymbol sym in codeMap.Where(s => s.Kind is SymbolKind.Method or SymbolKind.Function)) {
 							allSymbols.Add((file, sym));
 						}
@@ -96,7 +96,7 @@ public partial class CLI {
 				ProgressTask task = ctx.AddTask($"Evaluating ({allSymbols.Count})", maxValue: allSymbols.Count);
 				foreach ((string file, CodeSymbol sym) in allSymbols) {
 					try {
-						string         src   = await _crawler.GetCode(sym) ?? string.Empty;
+						string         src   = await Crawler.GetCode(sym) ?? string.Empty;
 						FunctionTriad? triad = null;
 						if (useTriads && triadsMap.TryGetValue((Path.GetFullPath(file), sym.Name), out triad)) matchedTriads++;
 						FidelityReport report = FidelityEvaluator.EvaluateFunction(sym, src, triad, lang);
@@ -65,7 +65,7 @@ public partial class CLI {
 		println($"Scanning {options.ProjectPath} for {options.Language} symbols...");
 
 		// Get symbols
-		CodeMap codeMap = await _crawler.CrawlDir(options.ProjectPath);
+		CodeMap codeMap = await Crawler.CrawlDir(options.ProjectPath);
 
 		if (codeMap.Count == 0) {
 			println("No symbols found.");
@@ -73,7 +73,7 @@ public partial class CLI {
 		}
 
 		// Build and display hierarchy
-		List<CoreTreeNode> hierarchy = CoreTreeNode.BuildHierarchy(codeMap.ToList(), _colorer);
+		List<CoreTreeNode> hierarchy = CoreTreeNode.BuildHierarchy(codeMap.ToList(), Colorer);
 		CoreTreeNode.DisplayHierarchy(hierarchy, options.MaxDepth);
 		println($"\nFound {codeMap.Count} symbols total");
 	}
@@ -192,8 +192,8 @@ public partial class CLI {
 	private static int RenderSection(string label, string color, IEnumerable<(FunctionTriad triad, string content)> items, string root, bool split) {
 		List<(FunctionTriad triad, string content)> list = items.ToList();
 		if (list.Count == 0) return 0;
-		AnsiConsole.MarkupLine($"└── [bold {color}]{label}[/]");
-		string basePrefix = "    ";
+		AnsiConsole.MarkupLine($"{CoreTreeNode.ConnectorLast}[bold {color}]{label}[/]");
+		string basePrefix = CoreTreeNode.PadLast;
 		int    totalWidth = GetConsoleWidth();
 		// Compute alignment column from longest left label (file::function:)
 		int maxRelSymLen = 0;
@@ -203,14 +203,14 @@ public partial class CLI {
 			int    len                           = rel.Length + 2 + sym.Length + 2; // "rel::sym: " (include trailing ': ')
 			if (len > maxRelSymLen) maxRelSymLen = len;
 		}
-		int connectorLen = "└── ".Length; // same visual width as "├── "
+		int connectorLen = CoreTreeNode.ConnectorLast.Length; // same visual width as ConnectorMid
 		int col          = Math.Min(totalWidth - 8, basePrefix.Length + connectorLen + maxRelSymLen);
 		for (int i = 0; i < list.Count; i++) {
 			(FunctionTriad triad, string? contentRaw) = list[i];
 			string rel       = Path.GetRelativePath(root, triad.FilePath);
 			string sym       = triad.SymbolName;
 			string content   = (contentRaw ?? string.Empty).Replace("\r", "\\r").Replace("\n", "\\n");
-			string connector = i == list.Count - 1 ? "└── " : "├── ";
+			string connector = CoreTreeNode.Connector(i == list.Count - 1);
 			string leftPlain = $"{basePrefix}{connector}{rel}::{sym}: ";
 			if (split) {
 				int    pad       = Math.Max(1, col - leftPlain.Length);
@@ -340,7 +340,7 @@ public partial class CLI {
 			}
 
 			// Build and display hierarchy
-			List<CoreTreeNode> tree = CoreTreeNode.BuildHierarchy(symbols, _colorer);
+			List<CoreTreeNode> tree = CoreTreeNode.BuildHierarchy(symbols, Colorer);
 			CoreTreeNode.DisplayHierarchy(tree, options.MaxDepth);
 			println($"\nFound {symbols.Count} types in assembly");
 		} catch (Exception ex) {
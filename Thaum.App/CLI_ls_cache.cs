@@ -1,3 +1,4 @@
+using System.Text;
 using System.Text.Json;
 using System.Diagnostics.CodeAnalysis;
 using Thaum.Core;
@@ -16,27 +17,28 @@ namespace Thaum.CLI;
 /// </summary>
 public partial class CLI {
 	// Cache entry record types
+	// Timestamps stay raw unix seconds from the cache row and are only formatted with --details
 	private record CachedOptimization {
-		public string         SymbolName   { get; init; } = "";
-		public string         FilePath     { get; init; } = "";
-		public int            Line         { get; init; }
-		public string         Compression  { get; init; } = "";
-		public string         Pattern      { get; init; } = "";
-		public string?        PromptName   { get; init; }
-		public string?        ModelName    { get; init; }
-		public string?        ProviderName { get; init; }
-		public DateTimeOffset CreatedAt    { get; init; }
-		public DateTimeOffset LastAccessed { get; init; }
+		public string  SymbolName       { get; init; } = "";
+		public string  FilePath         { get; init; } = "";
+		public int     Line             { get; init; }
+		public string  Compression      { get; init; } = "";
+		public string  Pattern          { get; init; } = "";
+		public string? PromptName       { get; init; }
+		public string? ModelName        { get; init; }
+		public string? ProviderName     { get; init; }
+		public long    CreatedAtUnix    { get; init; }
+		public long    LastAccessedUnix { get; init; }
 	}
 
 	private record CachedKey {
-		public int            Level        { get; init; }
-		public string         Pattern      { get; init; } = "";
-		public string?        PromptName   { get; init; }
-		public string?        ModelName    { get; init; }
-		public string?        ProviderName { get; init; }
-		public DateTimeOffset CreatedAt    { get; init; }
-		public DateTimeOffset LastAccessed { get; init; }
+		public int     Level            { get; init; }
+		public string  Pattern          { get; init; } = "";
+		public string? PromptName       { get; init; }
+		public string? ModelName        { get; init; }
+		public string? ProviderName     { get; init; }
+		public long    CreatedAtUnix    { get; init; }
+		public long    LastAccessedUnix { get; init; }
 	}
 
 	[RequiresUnreferencedCode("Uses reflection for cache deserialization")]
@@ -70,48 +72,67 @@ public partial class CLI {
 		try {
 			Cache cache = new Cache(GLB.AppConfig);
 
-			// Get all cache entries with prompt metadata
-			List<CacheEntryInfo> allEntries = await cache.GetAllEntriesAsync();
-			List<CachedOptimization> optimizations = allEntries
-				.Where(e => e.Key.StartsWith("optimization_"))
-				.Where(e => string.IsNullOrEmpty(pattern) || e.Key.Contains(pattern, StringComparison.OrdinalIgnoreCase))
-				.Select(ParseOptimizationEntry)
-				.Where(e => e != null)
-				.Cast<CachedOptimization>()
-				.ToList();
+			// Stream cache entries with prompt metadata and classify each one in a single pass where
+			// the first character picks the candidate prefix before any full prefix comparison
+			List<CachedOptimization> optimizations = new List<CachedOptimization>();
+			List<CachedKey>          keyEntries    = new List<CachedKey>();
+			await foreach (CacheEntryInfo entry in cache.StreamEntriesAsync()) {
+				string key = entry.Key;
+				if (key.Length == 0) continue;
+
+				switch (key[0]) {
+					case 'o' when key.StartsWith("optimization_", StringComparison.Ordinal):
+						if (!string.IsNullOrEmpty(pattern) && !key.Contains(pattern, StringComparison.OrdinalIgnoreCase)) continue;
+						if (ParseOptimizationEntry(entry) is { } opt) optimizations.Add(opt);
+						break;
+					case 'k' when key.StartsWith("key_L", StringComparison.Ordinal):
+						if (ParseKeyEntry(entry) is { } cachedKey) keyEntries.Add(cachedKey);
+						break;
+				}
+			}
+
+			// Each section is rendered into one buffer with inline ANSI colors and emitted with a single
+			// write where per-fragment Console.Write and ForegroundColor toggles cost a syscall each, and
+			// where redirected output or --no-colors drops every escape so pipes and files get plain text
+			bool          colors = !args.Contains("--no-colors") && !Console.IsOutputRedirected;
+			StringBuilder sb     = new StringBuilder();
+
+			string Ansi(string code) => colors ? code : "";
 
 			if (optimizations.Any()) {
-				ForegroundColor = ConsoleColor.Green;
-				println($"📦 CACHED OPTIMIZATIONS ({optimizations.Count} symbols)");
-				ResetColor();
-				println();
+				sb.Append(Ansi(AnsiGreen)).Append($"📦 CACHED OPTIMIZATIONS ({optimizations.Count} symbols)").Append(Ansi(AnsiReset)).Append('\n');
+				sb.Append('\n');
 
 				// Group by file path for hierarchical organization
+				string cwd = Directory.GetCurrentDirectory();
 				List<IGrouping<string, CachedOptimization>> groupedByFile = optimizations
-					.GroupBy(x => Path.GetRelativePath(Directory.GetCurrentDirectory(), x.FilePath))
+					.GroupBy(x => Path.GetRelativePath(cwd, x.FilePath))
 					.OrderBy(g => g.Key)
 					.ToList();
 
 				foreach (IGrouping<string, CachedOptimization> fileGroup in groupedByFile) {
 					// File header with color
-					ForegroundColor = ConsoleColor.Blue;
-					println($"📁 {fileGroup.Key}");
-					ResetColor();
+					sb.Append(Ansi(AnsiBlue)).Append($"📁 {fileGroup.Key}").Append(Ansi(AnsiReset)).Append('\n');
 
 					// One line per symbol with compression, prompt info, and model info
-					List<CachedOptimization> fileSymbols = fileGroup.OrderBy(x => x.SymbolName).ToList();
-					foreach (CachedOptimization opt in fileSymbols) {
-						string icon          = GLB.GetSymbolTypeIcon(opt.SymbolName);
-						string symbolDisplay = $"  {icon} ";
-
-						Write(symbolDisplay);
+					foreach (CachedOptimization opt in fileGroup.OrderBy(x => x.SymbolName)) {
+						string  symbolName    = opt.SymbolName;
+						string? promptName    = opt.PromptName;
+						string? providerName  = opt.ProviderName;
+						string? modelName     = opt.ModelName;
+						string  symbolDisplay = $"  {GLB.GetSymbolTypeIcon(symbolName)} ";
+						string  lineInfo      = opt.Line > 0 ? $":{opt.Line}" : "";
+						string  promptInfo    = !string.IsNullOrEmpty(promptName) ? $" [{promptName}]" : "";
+						string  modelInfo     = FormatModelInfo(providerName, modelName);
+						string  timestampInfo = showDetails ? FormatTimestamps(opt.CreatedAtUnix, opt.LastAccessedUnix) : "";
+
+						sb.Append(symbolDisplay);
 
 						// Use background coloring like ls command
-						SymbolKind symbolKind = InferSymbolKind(opt.SymbolName);
-						if (args.Contains("--no-colors")) {
-							Write(opt.SymbolName);
+						if (!colors) {
+							sb.Append(symbolName);
 						} else {
-							SemanticColorType semanticType = symbolKind switch {
+							SemanticColorType semanticType = InferSymbolKind(symbolName) switch {
 								SymbolKind.Function  => SemanticColorType.Function,
 								SymbolKind.Method    => SemanticColorType.Function,
 								SymbolKind.Class     => SemanticColorType.Class,
@@ -120,165 +141,64 @@ public partial class CLI {
 								SymbolKind.Namespace => SemanticColorType.Namespace,
 								_                    => SemanticColorType.Function
 							};
-							(int r, int g, int b) = _colorer.GenerateSemanticColor(opt.SymbolName, semanticType);
-							Write($"\e[48;2;{r};{g};{b}m\e[38;2;0;0;0m{opt.SymbolName}\e[0m");
-						}
-
-						if (opt.Line > 0) {
-							ForegroundColor = ConsoleColor.DarkGray;
-							Write($":{opt.Line}");
-							ResetColor();
-						}
-
-						// Show metadata in a structured way
-						List<string> metadataItems = [];
-
-						// Prompt info
-						if (!string.IsNullOrEmpty(opt.PromptName)) {
-							ForegroundColor = ConsoleColor.Magenta;
-							Write($" [{opt.PromptName}]");
-							ResetColor();
-						}
-
-						// Model and provider info with enhanced formatting
-						if (!string.IsNullOrEmpty(opt.ModelName) || !string.IsNullOrEmpty(opt.ProviderName)) {
-							ForegroundColor = ConsoleColor.DarkCyan;
-							Write(" (");
-							ForegroundColor = ConsoleColor.Cyan;
-							Write(opt.ProviderName ?? "unknown");
-							ForegroundColor = ConsoleColor.DarkGray;
-							Write(":");
-							ForegroundColor = ConsoleColor.Yellow;
-							Write(opt.ModelName ?? "unknown");
-							ForegroundColor = ConsoleColor.DarkCyan;
-							Write(")");
-							ResetColor();
+							(int r, int g, int b) = Colorer.GenerateSemanticColor(symbolName, semanticType);
+							sb.Append($"\e[48;2;{r};{g};{b}m\e[38;2;0;0;0m{symbolName}\e[0m");
 						}
 
-						// Show timestamp if details requested
-						if (showDetails) {
-							ForegroundColor = ConsoleColor.DarkGray;
-							Write($" ⏰{opt.CreatedAt:MM-dd HH:mm}");
-							if (opt.LastAccessed != opt.CreatedAt) {
-								Write($" (last: {opt.LastAccessed:MM-dd HH:mm})");
-							}
-							ResetColor();
-						}
+						if (lineInfo.Length > 0) sb.Append(Ansi(AnsiDarkGray)).Append(lineInfo).Append(Ansi(AnsiReset));
+						if (promptInfo.Length > 0) sb.Append(Ansi(AnsiMagenta)).Append(promptInfo).Append(Ansi(AnsiReset));
+						if (modelInfo.Length > 0) AppendModelInfo(sb, colors, " (", providerName, modelName, ")");
+						if (timestampInfo.Length > 0) sb.Append(Ansi(AnsiDarkGray)).Append(timestampInfo).Append(Ansi(AnsiReset));
 
 						// Calculate remaining space for compression - leave 1 char margin
-						string promptInfo = !string.IsNullOrEmpty(opt.PromptName) ? $" [{opt.PromptName}]" : "";
-						string modelInfo = !string.IsNullOrEmpty(opt.ModelName) || !string.IsNullOrEmpty(opt.ProviderName)
-							? $" ({opt.ProviderName ?? "unknown"}:{opt.ModelName ?? "unknown"})"
-							: "";
-						string timestampInfo = showDetails ? $" ⏰{opt.CreatedAt:MM-dd HH:mm}" : "";
-						if (showDetails && opt.LastAccessed != opt.CreatedAt) {
-							timestampInfo += $" (last: {opt.LastAccessed:MM-dd HH:mm})";
-						}
-						int usedSpace = symbolDisplay.Length + opt.SymbolName.Length +
-						                (opt.Line > 0 ? $":{opt.Line}".Length : 0) +
-						                promptInfo.Length + modelInfo.Length + timestampInfo.Length + 3; // +3 for " → "
-						int remainingSpace = consoleWidth - usedSpace - 1;                               // -1 for margin
-
-						ForegroundColor = ConsoleColor.DarkGray;
-						Write(" → ");
-						ResetColor();
-						ForegroundColor = ConsoleColor.Yellow;
-
-						// Truncate compression if too long, otherwise show full
-						if (opt.Compression.Length > remainingSpace) {
-							println($"{opt.Compression[..(remainingSpace - 3)]}...");
-						} else {
-							println(opt.Compression);
-						}
-						ResetColor();
+						int usedSpace      = symbolDisplay.Length + symbolName.Length + lineInfo.Length + promptInfo.Length + modelInfo.Length + timestampInfo.Length + 3; // +3 for " → "
+						int remainingSpace = consoleWidth - usedSpace - 1;                                                                                                 // -1 for margin
+
+						sb.Append(Ansi(AnsiDarkGray)).Append(" → ").Append(Ansi(AnsiReset)).Append(Ansi(AnsiYellow));
+						AppendTruncated(sb, opt.Compression, remainingSpace);
+						sb.Append(Ansi(AnsiReset)).Append('\n');
 					}
-					println(); // Space between files
+					sb.Append('\n'); // Space between files
 				}
 			}
 
 			// Show K1/K2 keys if requested or no optimizations found
 			if (showKeys || showAll || !optimizations.Any()) {
-				List<CachedKey> keyEntries = allEntries
-					.Where(e => e.Key.StartsWith("key_L"))
-					.Select(e => ParseKeyEntry(e))
-					.Where(e => e != null)
-					.Cast<CachedKey>()
-					.ToList();
-
 				if (keyEntries.Any()) {
-					ForegroundColor = ConsoleColor.DarkCyan;
-					println(new string('═', consoleWidth));
-					ForegroundColor = ConsoleColor.Green;
-					println("🔑 EXTRACTED ARCHITECTURAL KEYS");
-					ForegroundColor = ConsoleColor.DarkCyan;
-					println(new string('═', consoleWidth));
-					ResetColor();
-					println();
+					string rule = new string('═', consoleWidth);
+					sb.Append(Ansi(AnsiDarkCyan)).Append(rule).Append('\n');
+					sb.Append(Ansi(AnsiGreen)).Append("🔑 EXTRACTED ARCHITECTURAL KEYS").Append('\n');
+					sb.Append(Ansi(AnsiDarkCyan)).Append(rule).Append(Ansi(AnsiReset)).Append('\n');
+					sb.Append('\n');
 
 					foreach (CachedKey key in keyEntries.OrderBy(x => x.Level)) {
-						ForegroundColor = ConsoleColor.Green;
-						Write($"K{key.Level}");
-						ForegroundColor = ConsoleColor.DarkGray;
-						Write(" → ");
-						ResetColor();
-
-						// Show prompt info if available
-						if (!string.IsNullOrEmpty(key.PromptName)) {
-							ForegroundColor = ConsoleColor.Magenta;
-							Write($"[{key.PromptName}] ");
-							ResetColor();
-						}
-
-						// Show model and provider info with enhanced formatting
-						if (!string.IsNullOrEmpty(key.ModelName) || !string.IsNullOrEmpty(key.ProviderName)) {
-							ForegroundColor = ConsoleColor.DarkCyan;
-							Write("(");
-							ForegroundColor = ConsoleColor.Cyan;
-							Write(key.ProviderName ?? "unknown");
-							ForegroundColor = ConsoleColor.DarkGray;
-							Write(":");
-							ForegroundColor = ConsoleColor.Yellow;
-							Write(key.ModelName ?? "unknown");
-							ForegroundColor = ConsoleColor.DarkCyan;
-							Write(") ");
-							ResetColor();
-						}
-
-						// Show timestamp if details requested
-						if (showDetails) {
-							ForegroundColor = ConsoleColor.DarkGray;
-							Write($"⏰{key.CreatedAt:MM-dd HH:mm} ");
-							if (key.LastAccessed != key.CreatedAt) {
-								Write($"(last: {key.LastAccessed:MM-dd HH:mm}) ");
-							}
-							ResetColor();
-						}
-
-						ForegroundColor = ConsoleColor.Green;
+						string? promptName    = key.PromptName;
+						string? providerName  = key.ProviderName;
+						string? modelName     = key.ModelName;
+						string  levelInfo     = $"K{key.Level}";
+						string  promptInfo    = !string.IsNullOrEmpty(promptName) ? $"[{promptName}] " : "";
+						string  modelInfo     = FormatModelInfo(providerName, modelName);
+						string  timestampInfo = showDetails ? FormatTimestamps(key.CreatedAtUnix, key.LastAccessedUnix) : "";
+
+						sb.Append(Ansi(AnsiGreen)).Append(levelInfo).Append(Ansi(AnsiDarkGray)).Append(" → ").Append(Ansi(AnsiReset));
+						if (promptInfo.Length > 0) sb.Append(Ansi(AnsiMagenta)).Append(promptInfo).Append(Ansi(AnsiReset));
+						if (modelInfo.Length > 0) AppendModelInfo(sb, colors, "(", providerName, modelName, ") ");
+						if (timestampInfo.Length > 0) sb.Append(Ansi(AnsiDarkGray)).Append(timestampInfo.TrimStart()).Append(' ').Append(Ansi(AnsiReset));
 
 						// Calculate remaining space for key pattern - leave 1 char margin
-						string promptInfo = !string.IsNullOrEmpty(key.PromptName) ? $"[{key.PromptName}] " : "";
-						string modelInfo = !string.IsNullOrEmpty(key.ModelName) || !string.IsNullOrEmpty(key.ProviderName)
-							? $"({key.ProviderName ?? "unknown"}:{key.ModelName ?? "unknown"}) "
-							: "";
-						string timestampInfo = showDetails ? $"⏰{key.CreatedAt:MM-dd HH:mm} " : "";
-						if (showDetails && key.LastAccessed != key.CreatedAt) {
-							timestampInfo += $"(last: {key.LastAccessed:MM-dd HH:mm}) ";
-						}
-						int usedSpace      = $"K{key.Level} → ".Length + promptInfo.Length + modelInfo.Length + timestampInfo.Length;
+						int usedSpace      = levelInfo.Length + 3 + promptInfo.Length + modelInfo.Length + timestampInfo.Length;
 						int remainingSpace = consoleWidth - usedSpace - 1; // -1 for margin
 
-						if (key.Pattern.Length > remainingSpace) {
-							println($"{key.Pattern[..(remainingSpace - 3)]}...");
-						} else {
-							println(key.Pattern);
-						}
-						ResetColor();
+						sb.Append(Ansi(AnsiGreen));
+						AppendTruncated(sb, key.Pattern, remainingSpace);
+						sb.Append(Ansi(AnsiReset)).Append('\n');
 					}
-					println();
+					sb.Append('\n');
 				}
 			}
 
+			Out.Write(sb.ToString());
+
 			if (!optimizations.Any() && !showKeys) {
 				ForegroundColor = ConsoleColor.DarkYellow;
 				println("⚠️  No cached optimizations found. Run 'summarize' first to populate cache.");
@@ -293,28 +213,88 @@ public partial class CLI {
 		}
 	}
 
-	[RequiresUnreferencedCode("Calls System.Text.Json.JsonSerializer.Deserialize<TValue>(String, JsonSerializerOptions)")]
-	private static CachedOptimization? ParseOptimizationEntry(CacheEntryInfo entry) {
-		try {
-			// FIXME this is a major problem, all that information should be separated already in entry
-			// Parse key format: optimization_{symbolName}_{filePath}_{line}_{level}
-			string[] keyParts = entry.Key.Split('_', 3);
-			if (keyParts.Length < 3) return null;
+	// ANSI equivalents of the ConsoleColor values used by the cache browser
+	private const string AnsiReset    = "\e[0m";
+	private const string AnsiDarkGray = "\e[90m";
+	private const string AnsiDarkCyan = "\e[36m";
+	private const string AnsiCyan     = "\e[96m";
+	private const string AnsiGreen    = "\e[92m";
+	private const string AnsiBlue     = "\e[94m";
+	private const string AnsiMagenta  = "\e[95m";
+	private const string AnsiYellow   = "\e[93m";
+
+	/// <summary>
+	/// Plain-text " (provider:model)" fragment used for width accounting where an empty string
+	/// means neither provider nor model is known
+	/// </summary>
+	private static string FormatModelInfo(string? provider, string? model) {
+		if (string.IsNullOrEmpty(model) && string.IsNullOrEmpty(provider)) return "";
+		return $" ({provider ?? "unknown"}:{model ?? "unknown"})";
+	}
 
-			string remainder = keyParts[2]; // Everything after "optimization_"
+	private static string FormatTimestamps(long createdAtUnix, long lastAccessedUnix) {
+		DateTimeOffset createdAt = DateTimeOffset.FromUnixTimeSeconds(createdAtUnix);
+		return lastAccessedUnix != createdAtUnix
+			? $" ⏰{createdAt:MM-dd HH:mm} (last: {DateTimeOffset.FromUnixTimeSeconds(lastAccessedUnix):MM-dd HH:mm})"
+			: $" ⏰{createdAt:MM-dd HH:mm}";
+	}
 
-			int iLastUnderscore = remainder.LastIndexOf('_');
-			if (iLastUnderscore == -1)
-				return null;
+	private static void AppendModelInfo(StringBuilder sb, bool colors, string open, string? provider, string? model, string close) {
+		if (!colors) {
+			sb.Append(open).Append(provider ?? "unknown").Append(':').Append(model ?? "unknown").Append(close);
+			return;
+		}
+
+		sb.Append(AnsiDarkCyan).Append(open)
+			.Append(AnsiCyan).Append(provider ?? "unknown")
+			.Append(AnsiDarkGray).Append(':')
+			.Append(AnsiYellow).Append(model ?? "unknown")
+			.Append(AnsiDarkCyan).Append(close)
+			.Append(AnsiReset);
+	}
 
-			int secondLastUnderscoreIndex = remainder.LastIndexOf('_', iLastUnderscore - 1);
-			if (secondLastUnderscoreIndex == -1) return null;
+	private static void AppendTruncated(StringBuilder sb, string text, int maxLength) {
+		// Truncate if too long, otherwise show full
+		if (text.Length > maxLength) {
+			sb.Append(text, 0, Math.Max(0, maxLength - 3)).Append("...");
+		} else {
+			sb.Append(text);
+		}
+	}
 
-			string symbolName = remainder[..secondLastUnderscoreIndex];
-			string filePath   = remainder[(secondLastUnderscoreIndex + 1)..iLastUnderscore];
-			string lineStr    = remainder[(iLastUnderscore + 1)..];
+	[RequiresUnreferencedCode("Calls System.Text.Json.JsonSerializer.Deserialize<TValue>(String, JsonSerializerOptions)")]
+	private static CachedOptimization? ParseOptimizationEntry(CacheEntryInfo entry) {
+		try {
+			// FIXME this is a major problem, all that information should be separated already in entry
+			// Parse key format: optimization_{symbolName}_{filePath}_{line}_{level} (see Defragmentor)
+			// where level and line are peeled off the end since names and paths may contain '_'
+			const string prefix = "optimization_";
+			if (!entry.Key.StartsWith(prefix, StringComparison.Ordinal)) return null;
+
+			string remainder = entry.Key[prefix.Length..]; // Everything after "optimization_"
+
+			int iLevel = remainder.LastIndexOf('_');
+			if (iLevel <= 0) return null;
+
+			int iLine = remainder.LastIndexOf('_', iLevel - 1);
+			if (iLine <= 0) return null;
+
+			if (!int.TryParse(remainder.AsSpan(iLevel + 1), out _)) return null;
+			if (!int.TryParse(remainder.AsSpan(iLine + 1, iLevel - iLine - 1), out int line)) return null;
+
+			// The symbol/path boundary is the first '_' followed by a rooted path, else the first '_'
+			ReadOnlySpan<char> nameAndPath = remainder.AsSpan(0, iLine);
+			int                iPath       = nameAndPath.IndexOf('_');
+			if (iPath < 0) return null;
+			for (int i = iPath; i < nameAndPath.Length; i++) {
+				if (nameAndPath[i] == '_' && Path.IsPathRooted(nameAndPath[(i + 1)..])) {
+					iPath = i;
+					break;
+				}
+			}
 
-			if (!int.TryParse(lineStr, out int line)) return null;
+			string symbolName = nameAndPath[..iPath].ToString();
+			string filePath   = nameAndPath[(iPath + 1)..].ToString();
 
 			// Deserialize the cached value
 			string compression = entry.TypeName == "System.String" && JsonSerializer.Deserialize<string>(entry.Value) is { } value
@@ -322,15 +302,15 @@ public partial class CLI {
 				: "[Invalid Cache Value]";
 
 			return new CachedOptimization {
-				SymbolName   = symbolName,
-				FilePath     = filePath,
-				Line         = line,
-				Compression  = compression,
-				PromptName   = entry.PromptDisplayName ?? entry.PromptName,
-				ModelName    = entry.ModelName,
-				ProviderName = entry.ProviderName,
-				CreatedAt    = entry.CreatedAt,
-				LastAccessed = entry.LastAccessed
+				SymbolName       = symbolName,
+				FilePath         = filePath,
+				Line             = line,
+				Compression      = compression,
+				PromptName       = entry.PromptDisplayName ?? entry.PromptName,
+				ModelName        = entry.ModelName,
+				ProviderName     = entry.ProviderName,
+				CreatedAtUnix    = entry.CreatedAtUnix,
+				LastAccessedUnix = entry.LastAccessedUnix
 			};
 		} catch {
 			return null;
@@ -341,11 +321,15 @@ public partial class CLI {
 	private static CachedKey? ParseKeyEntry(CacheEntryInfo entry) {
 		try {
 			// Parse key format: key_L{level}_{hash}
-			string[] keyParts = entry.Key.Split('_');
-			if (keyParts.Length < 2 || !keyParts[1].StartsWith('L')) return null;
+			// Parse the level straight from the key span instead of splitting on every underscore
+			const string       prefix = "key_L";
+			ReadOnlySpan<char> key    = entry.Key;
+			if (!key.StartsWith(prefix, StringComparison.Ordinal)) return null;
 
-			string levelStr = keyParts[1][1..]; // Remove 'L' prefix
-			if (!int.TryParse(levelStr, out int level)) return null;
+			ReadOnlySpan<char> levelSpan = key[prefix.Length..];
+			int                iEnd      = levelSpan.IndexOf('_');
+			if (iEnd >= 0) levelSpan = levelSpan[..iEnd];
+			if (!int.TryParse(levelSpan, out int level)) return null;
 
 			// Deserialize the cached value
 			string pattern = entry.TypeName == "System.String" && JsonSerializer.Deserialize<string>(entry.Value) is { } value
@@ -353,13 +337,13 @@ public partial class CLI {
 				: "[Invalid Cache Value]";
 
 			return new CachedKey {
-				Level        = level,
-				Pattern      = pattern,
-				PromptName   = entry.PromptDisplayName ?? entry.PromptName,
-				ModelName    = entry.ModelName,
-				ProviderName = entry.ProviderName,
-				CreatedAt    = entry.CreatedAt,
-				LastAccessed = entry.LastAccessed
+				Level            = level,
+				Pattern          = pattern,
+				PromptName       = entry.PromptDisplayName ?? entry.PromptName,
+				ModelName        = entry.ModelName,
+				ProviderName     = entry.ProviderName,
+				CreatedAtUnix    = entry.CreatedAtUnix,
+				LastAccessedUnix = entry.LastAccessedUnix
 			};
 		} catch {
 			return null;
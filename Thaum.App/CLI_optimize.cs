@@ -24,7 +24,7 @@ public partial class CLI {
 
 		try {
 			DateTime        startTime = DateTime.UtcNow;
-			SymbolHierarchy hierarchy = await _defrag.ProcessCodebaseAsync(options.ProjectPath, options.Language, options.DefaultPromptName);
+			SymbolHierarchy hierarchy = await Defrag.ProcessCodebaseAsync(options.ProjectPath, options.Language, options.DefaultPromptName);
 			TimeSpan        duration  = DateTime.UtcNow - startTime;
 
 			// Display extracted keys
@@ -198,7 +198,7 @@ public partial class CLI {
 					["filePath"]       = filePath,
 					["symbolName"]     = symbolName,
 					["customPrompt"]   = customPrompt ?? "",
-					["languageServer"] = _crawler
+					["languageServer"] = Crawler
 				}
 			};
 
@@ -232,7 +232,7 @@ public partial class CLI {
 			println();
 
 			// Get symbols from file
-			var codeMap = await _crawler.CrawlFile(filepath);
+			var codeMap = await Crawler.CrawlFile(filepath);
 			CodeSymbol? targetSymbol = codeMap.GetSymbolByName(targetName);
 
 			if (targetSymbol == null) {
@@ -248,7 +248,7 @@ public partial class CLI {
 			println();
 
 			// Get source code
-			string src = await _crawler.GetCode(targetSymbol);
+			string src = await Crawler.GetCode(targetSymbol);
 			if (string.IsNullOrEmpty(src)) {
 				println("Failed to extract source code for symbol");
 				return;
@@ -273,14 +273,13 @@ public partial class CLI {
                 // Single compression
                 println($"Using prompt: {promptName}");
                 println();
-                Prompter prompter = new Prompter(new HttpLLM(new HttpClient(), GLB.AppConfig));
-                await prompter.Compress(src, promptName, targetSymbol);
+                await Prompter.Compress(src, promptName, targetSymbol);
             } else {
                 // Multiple rollouts with fusion
                 println($"Multiple rollouts ({nRollouts}) with fusion");
                 println($"Using prompt: {promptName}");
                 println();
-                await _prompter.CompressWithFusion(src, promptName, targetSymbol, nRollouts);
+                await Prompter.CompressWithFusion(src, promptName, targetSymbol, nRollouts);
             }
         } catch (Exception ex) {
             println($"Error during prompt test: {ex.Message}");
@@ -305,7 +304,7 @@ public partial class CLI {
         tracein(parameters: new { filePath, symbolName, triadPath });
 
         // Locate symbol via TreeSitter
-        var codeMap = await _crawler.CrawlFile(filePath);
+        var codeMap = await Crawler.CrawlFile(filePath);
         var symbol  = codeMap.GetSymbolByName(symbolName);
         if (symbol is null) {
             println($"Symbol '{symbolName}' not found in {filePath}");
@@ -313,7 +312,7 @@ public partial class CLI {
             return;
         }
 
-        string src = await _crawler.GetCode(symbol) ?? string.Empty;
+        string src = await Crawler.GetCode(symbol) ?? string.Empty;
         Thaum.Core.Triads.FunctionTriad? triad = null;
         if (!string.IsNullOrWhiteSpace(triadPath) && File.Exists(triadPath)) {
             string json = await File.ReadAllTextAsync(triadPath);
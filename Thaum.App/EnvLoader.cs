@@ -46,6 +46,9 @@ public static class EnvLoader {
 				Environment.SetEnvironmentVariable(kvp.Key, kvp.Value);
 			}
 		}
+
+		// Configuration snapshots environment variables at build time
+		GLB.ReloadConfig();
 	}
 
 	/// <summary>
@@ -219,17 +222,25 @@ public static class EnvLoader {
 				return value;
 			// For typical API keys, show first 3-4 chars + stars + last 3-4 chars
 			case >= 8: {
-				string start     = value[..Math.Min(4, length / 3)];
-				string end       = value[^Math.Min(4, length / 3)..];
-				int    starCount = Math.Max(8, length - start.Length - end.Length);
-				return $"{start}{'*'.ToString().PadRight(starCount, '*')}{end}";
+				int visible   = Math.Min(4, length / 3);
+				int starCount = Math.Max(8, length - 2 * visible);
+
+				// Single allocation where the mask is filled in place instead of padding a temporary string
+				return string.Create(2 * visible + starCount, (value, visible), static (span, state) => {
+					(string v, int n) = state;
+					v.AsSpan(0, n).CopyTo(span);
+					span[n..^n].Fill('*');
+					v.AsSpan(v.Length - n).CopyTo(span[^n..]);
+				});
 			}
 		}
 
 		// For medium length values, show first few chars + stars
-		int    visibleChars = Math.Max(1, length / 4);
-		string prefix       = value[..visibleChars];
-		string stars        = "*".PadRight(length - visibleChars, '*');
-		return $"{prefix}{stars}";
+		int visibleChars = Math.Max(1, length / 4);
+		return string.Create(length, (value, visibleChars), static (span, state) => {
+			(string v, int n) = state;
+			v.AsSpan(0, n).CopyTo(span);
+			span[n..].Fill('*');
+		});
 	}
 }
\ No newline at end of file
@@ -21,17 +21,11 @@ public static class Program {
 			try {
 				await cliApp.RunAsync(args);
 			} catch (Exception ex) {
-				// Log to both console and file
-				string errorMsg = $"Error: {ex.Message}";
-				string stackMsg = $"Stack trace: {ex.StackTrace}";
+				// One console write for the whole report instead of one per line
+				println($"Error: {ex.Message}{Environment.NewLine}Stack trace: {ex.StackTrace}");
 
-				println(errorMsg);
-				println(stackMsg);
-
-				// Also log to Serilog file
+				// The fatal event already carries the message and stack trace into the Serilog file
 				Log.Fatal(ex, "Application crashed");
-				Log.Information("Error details: {ErrorMessage}", errorMsg);
-				Log.Information("Stack trace: {StackTrace}", stackMsg);
 
 				Environment.Exit(1);
 			} finally {
@@ -0,0 +1,4 @@
+using System.Runtime.CompilerServices;
+
+// GenerateAssemblyInfo is off for this project so the attribute is declared here rather than in the csproj
+[assembly: InternalsVisibleTo("Thaum.Tests")]
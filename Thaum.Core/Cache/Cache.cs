@@ -1,6 +1,9 @@
-using System.Diagnostics.CodeAnalysis;
+using System.Buffers;
+using System.IO.Compression;
+using System.Runtime.CompilerServices;
 using System.Security.Cryptography;
 using System.Text.Json;
+using System.Text.Json.Serialization.Metadata;
 using Microsoft.Data.Sqlite;
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.Logging;
@@ -17,23 +20,96 @@ namespace Thaum.Core.Cache;
 public class Cache : ICache {
 	private readonly ILogger<Cache>        _logger;
 	private readonly SqliteConnection      _con;
+	private readonly SqliteConnection      _readCon;
 	private readonly JsonSerializerOptions _jsonOptions;
 
+	// SqliteConnection is not safe for concurrent use where every statement on the read-write
+	// connection (including GetAsync, which stamps last_accessed) goes through _writeLock where
+	// pure reads use a separate read-only connection under its own lock so WAL lets them
+	// proceed while a write is committing
+	private readonly SemaphoreSlim _writeLock = new SemaphoreSlim(1, 1);
+	private readonly SemaphoreSlim _readLock  = new SemaphoreSlim(1, 1);
+
+	private const int HOT_ENTRY_CAPACITY = 4096;
+
+	// PRAGMA auto_vacuum reports 2 for INCREMENTAL where each step frees at most 1000 pages
+	private const long   AUTO_VACUUM_INCREMENTAL = 2;
+	private const string INCREMENTAL_VACUUM_SQL  = "PRAGMA incremental_vacuum(1000)";
+
+	// Serialized values past this size are Brotli-compressed into a BLOB where the type_name
+	// suffix marks them so older uncompressed rows keep reading as plain TEXT
+	private const int    COMPRESS_THRESHOLD = 4096;
+	private const int    BROTLI_QUALITY     = 4;
+	private const int    BROTLI_WINDOW      = 22;
+	private const string COMPRESSED_SUFFIX  = "+br";
+
+	private readonly HotEntryCache _hot = new HotEntryCache(HOT_ENTRY_CAPACITY);
+
+	// Expired rows are already invisible to reads where this background loop deletes them in
+	// bounded batches so no foreground call ever pays for expiry cleanup
+	private static readonly TimeSpan SWEEP_INTERVAL   = TimeSpan.FromSeconds(60);
+	private const           int      SWEEP_BATCH_SIZE = 10000;
+
+	private readonly CancellationTokenSource _sweeperCts = new CancellationTokenSource();
+	private readonly Task                    _sweeper;
+
+	// Hot statements compiled once at startup and rebound per call where the locks above make
+	// sharing a single prepared command safe where SQLite skips re-parsing the SQL every call
+	private readonly SqliteCommand _getCommand;
+	private readonly SqliteCommand _upsertCommand;
+	private readonly SqliteCommand _storePromptCommand;
+	private readonly SqliteCommand _existsCommand;
+	private readonly SqliteCommand _removeCommand;
+	private readonly SqliteCommand _sizeCommand;
+	private readonly SqliteCommand _getPromptCommand;
+
+	private const string SQL_GET = """
+	                               UPDATE cache_entries 
+	                               SET last_accessed = @now 
+	                               WHERE key = @key 
+	                               AND (expires_at IS NULL OR expires_at > @now)
+	                               RETURNING value, type_name, expires_at
+	                               """;
+
+	private const string SQL_UPSERT = """
+	                                  INSERT OR REPLACE INTO cache_entries 
+	                                  (key, value, type_name, created_at, expires_at, last_accessed, prompt_name, prompt_hash, model_name, provider_name)
+	                                  VALUES (@key, @value, @typeName, @now, @expiresAt, @now, @promptName, @promptHash, @modelName, @providerName)
+	                                  """;
+
+	private const string SQL_STORE_PROMPT = """
+	                                        INSERT OR IGNORE INTO prompts 
+	                                        (hash, name, content, created_at)
+	                                        VALUES (@hash, @name, @content, @now)
+	                                        """;
+
+	private const string SQL_EXISTS = """
+	                                  SELECT 1 FROM cache_entries 
+	                                  WHERE key = @key 
+	                                  AND (expires_at IS NULL OR expires_at > @now)
+	                                  LIMIT 1
+	                                  """;
+
 	/// <summary>
 	/// Initializes cache with platform-appropriate directory where temp path fallback ensures
 	/// universal compatibility where SQLite provides lightweight persistence without external
 	/// dependencies where JSON serialization preserves type fidelity across cache boundaries
 	/// </summary>
-	public Cache(IConfiguration configuration) {
+	public Cache(IConfiguration configuration) : this(GLB.CacheDbPath) { }
+
+	/// <summary>
+	/// Opens (creating if needed) the cache database at an explicit path where tests and tools
+	/// point it at a scratch file instead of the shared per-user cache
+	/// </summary>
+	public Cache(string dbPath) {
 		_logger = RatLog.Get<Cache>();
 
 		// Simple cache directory - works on all platforms
-		string cacheDir = GLB.CacheDir;
+		string cacheDir = Path.GetDirectoryName(Path.GetFullPath(dbPath))!;
 
 		_logger.LogDebug("Creating cache directory: {CacheDir}", cacheDir);
 		Directory.CreateDirectory(cacheDir);
 
-		string dbPath           = GLB.CacheDbPath;
 		string connectionString = $"Data Source={dbPath}";
 
 		_con = new SqliteConnection(connectionString);
@@ -42,151 +118,261 @@ public class Cache : ICache {
 		_jsonOptions = GLB.CacheJsonOptions;
 
 		InitializeDatabase();
-	}
 
-	/// <summary>
-	/// Creates/migrates SQLite schema where backward compatibility preserves existing caches
-	/// where column detection enables graceful upgrades where indexes optimize common queries
-	/// where prompts table deduplicates identical prompt content saving storage
-	/// </summary>
-	private void InitializeDatabase() {
-		// First, create the basic cache_entries table if it doesn't exist
-		const string CREATE_BASIC_TABLE_SQL = """
-		                                      CREATE TABLE IF NOT EXISTS cache_entries (
-		                                          key TEXT PRIMARY KEY,
-		                                          value TEXT NOT NULL,
-		                                          type_name TEXT NOT NULL,
-		                                          created_at INTEGER NOT NULL,
-		                                          expires_at INTEGER,
-		                                          last_accessed INTEGER NOT NULL
-		                                      );
-		                                      """;
-
-		using (SqliteCommand command = new SqliteCommand(CREATE_BASIC_TABLE_SQL, _con)) {
+		// Opened after initialization so the database file and its WAL exist
+		_readCon = new SqliteConnection($"Data Source={dbPath};Mode=ReadOnly");
+		_readCon.Open();
+		using (SqliteCommand command = new SqliteCommand(CONNECTION_PRAGMAS_SQL, _readCon)) {
 			command.ExecuteNonQuery();
 		}
 
-		// Check if new columns exist, and add them if they don't
-		string checkColumnsSql = "PRAGMA table_info(cache_entries)";
-		bool   hasPromptName   = false;
-		bool   hasPromptHash   = false;
-		bool   hasModelName    = false;
-		bool   hasProviderName = false;
+		_getCommand         = PrepareCommand(_con, SQL_GET, "@key", "@now");
+		_upsertCommand      = PrepareCommand(_con, SQL_UPSERT, "@key", "@value", "@typeName", "@now", "@expiresAt", "@promptName", "@promptHash", "@modelName", "@providerName");
+		_storePromptCommand = PrepareCommand(_con, SQL_STORE_PROMPT, "@hash", "@name", "@content", "@now");
+		_existsCommand      = PrepareCommand(_readCon, SQL_EXISTS, "@key", "@now");
+		_removeCommand      = PrepareCommand(_con, "DELETE FROM cache_entries WHERE key = @key", "@key");
+		_sizeCommand        = PrepareCommand(_readCon, "SELECT COUNT(*) FROM cache_entries");
+		_getPromptCommand   = PrepareCommand(_readCon, "SELECT name, content FROM prompts WHERE hash = @hash", "@hash");
 
-		using (SqliteCommand command = new SqliteCommand(checkColumnsSql, _con))
-		using (SqliteDataReader reader = command.ExecuteReader()) {
-			while (reader.Read()) {
-				string columnName = reader.GetString(1); // column name is at index 1
-				switch (columnName) {
-					case "prompt_name":
-						hasPromptName = true;
-						break;
-					case "prompt_hash":
-						hasPromptHash = true;
-						break;
-					case "model_name":
-						hasModelName = true;
-						break;
-					case "provider_name":
-						hasProviderName = true;
-						break;
-				}
+		_sweeper = Task.Run(() => SweepExpiredLoopAsync(_sweeperCts.Token));
+	}
+
+	private static SqliteCommand PrepareCommand(SqliteConnection con, string sql, params string[] parameterNames) {
+		SqliteCommand command = new SqliteCommand(sql, con);
+		foreach (string name in parameterNames) {
+			command.Parameters.Add(new SqliteParameter { ParameterName = name });
+		}
+		command.Prepare();
+		return command;
+	}
+
+	// Per-connection tuning shared by the read-write and read-only connections
+	private const string CONNECTION_PRAGMAS_SQL = """
+	                                              PRAGMA temp_store=MEMORY;
+	                                              PRAGMA cache_size=-65536;
+	                                              PRAGMA mmap_size=268435456;
+	                                              PRAGMA busy_timeout=5000;
+	                                              """;
+
+	/// <summary>
+	/// Tunes the connection for a write-heavy local cache where WAL lets readers proceed while a
+	/// write commits where synchronous=NORMAL drops the per-commit fsync that WAL makes safe to
+	/// skip where a larger page cache, in-memory temp store and mmap keep lookups off the disk
+	/// where busy_timeout absorbs brief contention between concurrent cache instances
+	/// </summary>
+	private void ConfigureConnection() {
+		// Must precede the switch to WAL, which writes the header of a new file and freezes its
+		// auto_vacuum mode where on an existing database this only records the mode for the next
+		// VACUUM so incremental compaction frees pages in bounded steps
+		ExecuteNonQuery("PRAGMA auto_vacuum = INCREMENTAL");
+
+		using (SqliteCommand command = new SqliteCommand("PRAGMA journal_mode=WAL;", _con)) {
+			string? mode = command.ExecuteScalar() as string;
+			if (!string.Equals(mode, "wal", StringComparison.OrdinalIgnoreCase)) {
+				_logger.LogWarning("SQLite WAL mode unavailable, journal mode is {JournalMode}", mode);
 			}
 		}
 
-		// Add missing columns
-		if (!hasPromptName) {
-			using SqliteCommand command = new SqliteCommand("ALTER TABLE cache_entries ADD COLUMN prompt_name TEXT", _con);
+		using (SqliteCommand command = new SqliteCommand("PRAGMA synchronous=NORMAL;", _con)) {
 			command.ExecuteNonQuery();
 		}
 
-		if (!hasPromptHash) {
-			using SqliteCommand command = new SqliteCommand("ALTER TABLE cache_entries ADD COLUMN prompt_hash TEXT", _con);
+		using (SqliteCommand command = new SqliteCommand(CONNECTION_PRAGMAS_SQL, _con)) {
 			command.ExecuteNonQuery();
 		}
+	}
 
-		if (!hasModelName) {
-			using SqliteCommand command = new SqliteCommand("ALTER TABLE cache_entries ADD COLUMN model_name TEXT", _con);
-			command.ExecuteNonQuery();
+	/// <summary>
+	/// Bumped whenever the schema or its migrations change where databases already at this
+	/// version skip the whole migration path on startup
+	/// </summary>
+	private const int SCHEMA_VERSION = 2;
+
+	private const string CREATE_SCHEMA_SQL = """
+	                                         CREATE TABLE IF NOT EXISTS cache_entries (
+	                                             key TEXT PRIMARY KEY,
+	                                             value TEXT NOT NULL,
+	                                             type_name TEXT NOT NULL,
+	                                             created_at INTEGER NOT NULL,
+	                                             expires_at INTEGER,
+	                                             last_accessed INTEGER NOT NULL,
+	                                             prompt_name TEXT,
+	                                             prompt_hash TEXT,
+	                                             model_name TEXT,
+	                                             provider_name TEXT
+	                                         );
+	                                         CREATE TABLE IF NOT EXISTS prompts (
+	                                             hash TEXT PRIMARY KEY,
+	                                             name TEXT NOT NULL,
+	                                             content TEXT NOT NULL,
+	                                             created_at INTEGER NOT NULL
+	                                         );
+	                                         """;
+
+	// Expiry scans only ever look at expiring rows so the partial index leaves NULLs out, and
+	// key lookups/ranges already ride the primary key's own index
+	private const string CREATE_INDEXES_SQL = """
+	                                          DROP INDEX IF EXISTS idx_expires_at;
+	                                          DROP INDEX IF EXISTS idx_key_pattern;
+	                                          CREATE INDEX IF NOT EXISTS idx_expires_at_partial ON cache_entries(expires_at) WHERE expires_at IS NOT NULL;
+	                                          CREATE INDEX IF NOT EXISTS idx_last_accessed ON cache_entries(last_accessed);
+	                                          CREATE INDEX IF NOT EXISTS idx_prompt_name ON cache_entries(prompt_name);
+	                                          CREATE INDEX IF NOT EXISTS idx_prompt_hash ON cache_entries(prompt_hash);
+	                                          CREATE INDEX IF NOT EXISTS idx_model_name ON cache_entries(model_name);
+	                                          CREATE INDEX IF NOT EXISTS idx_prompt_name_lookup ON prompts(name);
+	                                          """;
+
+	/// <summary>
+	/// Creates/migrates SQLite schema where PRAGMA user_version gates the work so a current
+	/// database costs a single pragma read where older caches are upgraded in one transaction
+	/// (column detection preserves pre-versioned databases) where indexes optimize common queries
+	/// where prompts table deduplicates identical prompt content saving storage
+	/// </summary>
+	private void InitializeDatabase() {
+		ConfigureConnection();
+
+		long version;
+		using (SqliteCommand command = new SqliteCommand("PRAGMA user_version", _con)) {
+			version = (long)(command.ExecuteScalar() ?? 0L);
 		}
 
-		if (!hasProviderName) {
-			using SqliteCommand command = new SqliteCommand("ALTER TABLE cache_entries ADD COLUMN provider_name TEXT", _con);
-			command.ExecuteNonQuery();
+		if (version >= SCHEMA_VERSION) {
+			_logger.LogDebug("Cache database schema is current (v{Version})", version);
+			return;
 		}
 
-		// Create prompts table
-		string createPromptsTableSql = """
-		                               CREATE TABLE IF NOT EXISTS prompts (
-		                                   hash TEXT PRIMARY KEY,
-		                                   name TEXT NOT NULL,
-		                                   content TEXT NOT NULL,
-		                                   created_at INTEGER NOT NULL
-		                               );
-		                               """;
-
-		using (SqliteCommand command = new SqliteCommand(createPromptsTableSql, _con)) {
-			command.ExecuteNonQuery();
+		using SqliteTransaction transaction = _con.BeginTransaction();
+
+		ExecuteNonQuery(CREATE_SCHEMA_SQL, transaction);
+
+		// Columns added after the original schema; fresh tables already have them but pre-versioned
+		// databases may lack any of them
+		HashSet<string> columns = new HashSet<string>();
+		using (SqliteCommand command = new SqliteCommand("PRAGMA table_info(cache_entries)", _con, transaction))
+		using (SqliteDataReader reader = command.ExecuteReader()) {
+			while (reader.Read()) {
+				columns.Add(reader.GetString(1)); // column name is at index 1
+			}
 		}
 
-		// Create indexes
-		string createIndexesSql = """
-		                          CREATE INDEX IF NOT EXISTS idx_expires_at ON cache_entries(expires_at);
-		                          CREATE INDEX IF NOT EXISTS idx_last_accessed ON cache_entries(last_accessed);
-		                          CREATE INDEX IF NOT EXISTS idx_key_pattern ON cache_entries(key);
-		                          CREATE INDEX IF NOT EXISTS idx_prompt_name ON cache_entries(prompt_name);
-		                          CREATE INDEX IF NOT EXISTS idx_prompt_hash ON cache_entries(prompt_hash);
-		                          CREATE INDEX IF NOT EXISTS idx_model_name ON cache_entries(model_name);
-		                          CREATE INDEX IF NOT EXISTS idx_prompt_name_lookup ON prompts(name);
-		                          """;
-
-		using (SqliteCommand command = new SqliteCommand(createIndexesSql, _con)) {
-			command.ExecuteNonQuery();
+		foreach (string column in new[] { "prompt_name", "prompt_hash", "model_name", "provider_name" }) {
+			if (!columns.Contains(column)) {
+				ExecuteNonQuery($"ALTER TABLE cache_entries ADD COLUMN {column} TEXT", transaction);
+			}
 		}
 
-		_logger.LogDebug("Cache database initialized with prompt and model tracking");
+		ExecuteNonQuery(CREATE_INDEXES_SQL, transaction);
+		ExecuteNonQuery("ANALYZE", transaction);
+		ExecuteNonQuery($"PRAGMA user_version = {SCHEMA_VERSION}", transaction);
+
+		transaction.Commit();
+
+		_logger.LogDebug("Cache database migrated from v{From} to v{To}", version, SCHEMA_VERSION);
+	}
+
+	private void ExecuteNonQuery(string sql, SqliteTransaction? transaction = null) {
+		using SqliteCommand command = new SqliteCommand(sql, _con, transaction);
+		command.ExecuteNonQuery();
 	}
 
 	/// <summary>
-	/// Retrieves cached value checking expiration where last-accessed tracking enables LRU
-	/// eviction strategies where generic deserialization preserves type safety where null
+	/// Retrieves cached value checking expiration where the in-process hot set answers recent keys
+	/// without touching SQLite where misses fall through to a single UPDATE ... RETURNING that both
+	/// touches last_accessed and reads the row before promoting it into the hot set where null
 	/// return indicates miss enabling caller to decide fallback strategy
 	/// </summary>
-	[RequiresUnreferencedCode("Uses reflection for JSON deserialization")]
 	public async Task<T?> GetAsync<T>(string key) where T : class {
-		try {
-			long now = DateTimeOffset.UtcNow.ToUnixTimeSeconds();
-
-			string sql = """
-			             SELECT value, type_name 
-			             FROM cache_entries 
-			             WHERE key = @key 
-			             AND (expires_at IS NULL OR expires_at > @now)
-			             """;
+		long now = DateTimeOffset.UtcNow.ToUnixTimeSeconds();
+		if (_hot.TryGet(key, now, out string hotJson)) {
+			try {
+				return JsonSerializer.Deserialize(hotJson, GetTypeInfo<T>());
+			} catch (Exception ex) {
+				_logger.LogError(ex, "Error getting cached value for key {Key}", key);
+				return null;
+			}
+		}
 
-			await using SqliteCommand command = new SqliteCommand(sql, _con);
-			command.Parameters.AddWithValue("@key", key);
-			command.Parameters.AddWithValue("@now", now);
+		await _writeLock.WaitAsync();
+		await ThreadPoolHop.Yield();
+		try {
+			_getCommand.Parameters["@key"].Value = key;
+			_getCommand.Parameters["@now"].Value = now;
 
-			await using SqliteDataReader reader = await command.ExecuteReaderAsync();
+			await using SqliteDataReader reader = await _getCommand.ExecuteReaderAsync();
 
 			if (!await reader.ReadAsync()) {
 				return null;
 			}
 
-			string value    = reader.GetString(0);
-			string typeName = reader.GetString(1);
-
-			// Update last accessed time
-			await UpdateLastAccessedAsync(key, now);
+			string value     = ReadValue(reader, 0, reader.GetString(1));
+			long?  expiresAt = reader.IsDBNull(2) ? null : reader.GetInt64(2);
+			_hot.Set(key, value, expiresAt);
 
-			return JsonSerializer.Deserialize<T>(value, _jsonOptions);
+			return JsonSerializer.Deserialize(value, GetTypeInfo<T>());
 		} catch (Exception ex) {
 			_logger.LogError(ex, "Error getting cached value for key {Key}", key);
 			return null;
+		} finally {
+			_writeLock.Release();
 		}
 	}
 
+	/// <summary>
+	/// Resolves the source-generated metadata for T once per closed generic where each call then
+	/// serializes through JsonTypeInfo directly skipping the options' per-call type lookup
+	/// </summary>
+	private JsonTypeInfo<T> GetTypeInfo<T>() {
+		return TypeInfoCache<T>.Info ??= (JsonTypeInfo<T>)_jsonOptions.GetTypeInfo(typeof(T));
+	}
+
+	private static class TypeInfoCache<T> {
+		public static JsonTypeInfo<T>? Info;
+	}
+
+	/// <summary>
+	/// Returns the JSON as-is when small where larger payloads become a Brotli BLOB only if that
+	/// actually saves space so incompressible values are never stored bigger than they started
+	/// </summary>
+	private static object EncodeValue(string json, out bool compressed) {
+		compressed = false;
+		if (json.Length < COMPRESS_THRESHOLD) return json;
+
+		byte[] raw    = System.Text.Encoding.UTF8.GetBytes(json);
+		byte[] rented = ArrayPool<byte>.Shared.Rent(BrotliEncoder.GetMaxCompressedLength(raw.Length));
+		try {
+			if (!BrotliEncoder.TryCompress(raw, rented, out int written, BROTLI_QUALITY, BROTLI_WINDOW) || written >= raw.Length)
+				return json;
+
+			compressed = true;
+			return rented.AsSpan(0, written).ToArray();
+		} finally {
+			ArrayPool<byte>.Shared.Return(rented);
+		}
+	}
+
+	private static string ReadValue(SqliteDataReader reader, int ordinal, string typeName) {
+		if (!typeName.EndsWith(COMPRESSED_SUFFIX, StringComparison.Ordinal))
+			return reader.GetString(ordinal);
+
+		using MemoryStream blob    = new MemoryStream(reader.GetFieldValue<byte[]>(ordinal));
+		using BrotliStream brotli  = new BrotliStream(blob, CompressionMode.Decompress);
+		using StreamReader decoded = new StreamReader(brotli, System.Text.Encoding.UTF8);
+		return decoded.ReadToEnd();
+	}
+
+	private static string StripCompressedSuffix(string typeName) {
+		return typeName.EndsWith(COMPRESSED_SUFFIX, StringComparison.Ordinal) ? typeName[..^COMPRESSED_SUFFIX.Length] : typeName;
+	}
+
+	/// <summary>
+	/// Per-type constant for the type_name column where the static generic is resolved by the JIT
+	/// at the call site so the set path reads a field instead of walking reflection every call
+	/// </summary>
+	private static class TypeNameCache<T> {
+		public static readonly string Name           = typeof(T).FullName ?? typeof(T).Name;
+		public static readonly string CompressedName = Name + COMPRESSED_SUFFIX;
+	}
+
 	public async Task<T?> TryGetAsync<T>(string key) where T : class {
 		return await GetAsync<T>(key);
 	}
@@ -196,57 +382,84 @@ public class Cache : ICache {
 	/// where model/provider tracking enables cache analysis where expiration enables automatic
 	/// cleanup where atomic upsert prevents race conditions in concurrent scenarios
 	/// </summary>
-	[RequiresUnreferencedCode("Uses reflection for JSON serialization")]
 	public async Task SetAsync<T>(string key, T value, TimeSpan? expiration = null, string? promptName = null, string? promptContent = null, string? modelName = null, string? providerName = null) where T : class {
+		await SetManyAsync([(key, value)], expiration, promptName, promptContent, modelName, providerName);
+	}
+
+	/// <summary>
+	/// Stores many values sharing the same metadata inside one transaction where a single
+	/// prepared upsert is rebound per row where the whole batch costs one commit instead of
+	/// one per entry where SetAsync routes through here so both paths share the same statement
+	/// </summary>
+	public async Task SetManyAsync<T>(IReadOnlyList<(string Key, T Value)> items, TimeSpan? expiration = null, string? promptName = null, string? promptContent = null, string? modelName = null, string? providerName = null) where T : class {
+		if (items.Count == 0) return;
+
+		await _writeLock.WaitAsync();
+		await ThreadPoolHop.Yield();
 		try {
 			long  now       = DateTimeOffset.UtcNow.ToUnixTimeSeconds();
 			long? expiresAt = expiration.HasValue ? now + (long)expiration.Value.TotalSeconds : (long?)null;
+			string typeName = TypeNameCache<T>.Name;
 
-			string json     = JsonSerializer.Serialize(value, _jsonOptions);
-			string typeName = typeof(T).FullName ?? typeof(T).Name;
+			// A lone entry commits on its own so the single-set path keeps autocommit semantics
+			await using SqliteTransaction? transaction = items.Count > 1 ? (SqliteTransaction)await _con.BeginTransactionAsync() : null;
 
 			string? promptHash = null;
 
 			// Store prompt metadata if provided
 			if (!string.IsNullOrEmpty(promptName) && !string.IsNullOrEmpty(promptContent)) {
-				promptHash = await StorePromptAsync(promptName, promptContent);
+				promptHash = await StorePromptAsync(promptName, promptContent, transaction);
 			}
 
-			string sql = """
-			             INSERT OR REPLACE INTO cache_entries 
-			             (key, value, type_name, created_at, expires_at, last_accessed, prompt_name, prompt_hash, model_name, provider_name)
-			             VALUES (@key, @value, @typeName, @now, @expiresAt, @now, @promptName, @promptHash, @modelName, @providerName)
-			             """;
-
-			await using SqliteCommand command = new SqliteCommand(sql, _con);
-			command.Parameters.AddWithValue("@key", key);
-			command.Parameters.AddWithValue("@value", json);
-			command.Parameters.AddWithValue("@typeName", typeName);
-			command.Parameters.AddWithValue("@now", now);
-			command.Parameters.AddWithValue("@expiresAt", expiresAt.HasValue ? expiresAt.Value : DBNull.Value);
-			command.Parameters.AddWithValue("@promptName", promptName ?? (object)DBNull.Value);
-			command.Parameters.AddWithValue("@promptHash", promptHash ?? (object)DBNull.Value);
-			command.Parameters.AddWithValue("@modelName", modelName ?? (object)DBNull.Value);
-			command.Parameters.AddWithValue("@providerName", providerName ?? (object)DBNull.Value);
+			SqliteCommand             command    = _upsertCommand;
+			SqliteParameterCollection parameters = command.Parameters;
+			command.Transaction               = transaction;
+			parameters["@now"].Value          = now;
+			parameters["@expiresAt"].Value    = expiresAt.HasValue ? expiresAt.Value : DBNull.Value;
+			parameters["@promptName"].Value   = promptName ?? (object)DBNull.Value;
+			parameters["@promptHash"].Value   = promptHash ?? (object)DBNull.Value;
+			parameters["@modelName"].Value    = modelName ?? (object)DBNull.Value;
+			parameters["@providerName"].Value = providerName ?? (object)DBNull.Value;
+
+			SqliteParameter pKey      = parameters["@key"];
+			SqliteParameter pValue    = parameters["@value"];
+			SqliteParameter pTypeName = parameters["@typeName"];
+			JsonTypeInfo<T> typeInfo  = GetTypeInfo<T>();
+			string[]        jsons     = new string[items.Count];
+			for (int i = 0; i < items.Count; i++) {
+				jsons[i]        = JsonSerializer.Serialize(items[i].Value, typeInfo);
+				pKey.Value      = items[i].Key;
+				pValue.Value    = EncodeValue(jsons[i], out bool compressed);
+				pTypeName.Value = compressed ? TypeNameCache<T>.CompressedName : typeName;
+				await command.ExecuteNonQueryAsync();
+			}
 
-			await command.ExecuteNonQueryAsync();
+			if (transaction != null) await transaction.CommitAsync();
 
-			_logger.LogTrace("Cached value for key {Key} with prompt {PromptName}, model {ModelName}, provider {ProviderName}",
-				key, promptName, modelName, providerName);
+			// Only promote once the rows are durable so a rolled-back batch never shows up in memory
+			for (int i = 0; i < items.Count; i++) {
+				_hot.Set(items[i].Key, jsons[i], expiresAt);
+			}
+
+			_logger.LogTrace("Cached {Count} values with prompt {PromptName}, model {ModelName}, provider {ProviderName}",
+				items.Count, promptName, modelName, providerName);
 		} catch (Exception ex) {
-			_logger.LogError(ex, "Error caching value for key {Key}", key);
+			_logger.LogError(ex, "Error caching {Count} values starting at key {Key}", items.Count, items[0].Key);
 			throw;
+		} finally {
+			_writeLock.Release();
 		}
 	}
 
 	public async Task RemoveAsync(string key) {
+		await _writeLock.WaitAsync();
+		await ThreadPoolHop.Yield();
 		try {
-			string sql = "DELETE FROM cache_entries WHERE key = @key";
+			_hot.Remove(key);
 
-			await using SqliteCommand command = new SqliteCommand(sql, _con);
-			command.Parameters.AddWithValue("@key", key);
+			_removeCommand.Parameters["@key"].Value = key;
 
-			int rowsAffected = await command.ExecuteNonQueryAsync();
+			int rowsAffected = await _removeCommand.ExecuteNonQueryAsync();
 
 			if (rowsAffected > 0) {
 				_logger.LogTrace("Removed cached entry for key {Key}", key);
@@ -254,22 +467,32 @@ public class Cache : ICache {
 		} catch (Exception ex) {
 			_logger.LogError(ex, "Error removing cached value for key {Key}", key);
 			throw;
+		} finally {
+			_writeLock.Release();
 		}
 	}
 
 	/// <summary>
 	/// Removes entries matching wildcard pattern where * matches any sequence where ? matches
-	/// single character where pattern-based clearing enables targeted invalidation without
-	/// full cache flush preserving unrelated cached results
+	/// single character where LIKE's own metacharacters in the pattern are escaped so keys such as
+	/// optimization_Foo match literally where pattern-based clearing enables targeted invalidation
+	/// without full cache flush preserving unrelated cached results
 	/// </summary>
 	public async Task InvalidatePatternAsync(string pattern) {
+		await _writeLock.WaitAsync();
+		await ThreadPoolHop.Yield();
 		try {
-			// Convert simple wildcard pattern to SQL LIKE pattern
-			string likePattern = pattern.Replace("*", "%").Replace("?", "_");
+			_hot.RemoveMatching(pattern);
 
-			string sql = "DELETE FROM cache_entries WHERE key LIKE @pattern";
+			// Convert simple wildcard pattern to SQL LIKE pattern (ASCII case-insensitive like the hot tier)
+			string likePattern = pattern
+				.Replace(@"\", @"\\")
+				.Replace("%", @"\%")
+				.Replace("_", @"\_")
+				.Replace("*", "%")
+				.Replace("?", "_");
 
-			await using SqliteCommand command = new SqliteCommand(sql, _con);
+			await using SqliteCommand command = new SqliteCommand(@"DELETE FROM cache_entries WHERE key LIKE @pattern ESCAPE '\'", _con);
 			command.Parameters.AddWithValue("@pattern", likePattern);
 
 			int rowsAffected = await command.ExecuteNonQueryAsync();
@@ -278,66 +501,84 @@ public class Cache : ICache {
 		} catch (Exception ex) {
 			_logger.LogError(ex, "Error invalidating cache entries with pattern {Pattern}", pattern);
 			throw;
+		} finally {
+			_writeLock.Release();
 		}
 	}
 
+	/// <summary>
+	/// Wipes every cache entry by dropping and recreating the table from the shared schema DDL
+	/// (which carries the full current column set so the indexes and upserts find every column)
+	/// where freed pages are unlinked wholesale instead of logging each row's delete into the WAL
+	/// where the prompts table is left intact and the WAL is truncated afterwards
+	/// </summary>
 	public async Task ClearAsync() {
+		await _writeLock.WaitAsync();
+		await ThreadPoolHop.Yield();
 		try {
-			string sql = "DELETE FROM cache_entries";
+			_hot.Clear();
+
+			await using (SqliteTransaction transaction = (SqliteTransaction)await _con.BeginTransactionAsync()) {
+				ExecuteNonQuery("DROP TABLE IF EXISTS cache_entries", transaction);
+				ExecuteNonQuery(CREATE_SCHEMA_SQL, transaction);
+				ExecuteNonQuery(CREATE_INDEXES_SQL, transaction);
+				await transaction.CommitAsync();
+			}
 
-			await using SqliteCommand command      = new SqliteCommand(sql, _con);
-			int                       rowsAffected = await command.ExecuteNonQueryAsync();
+			ExecuteNonQuery("PRAGMA wal_checkpoint(TRUNCATE)");
 
-			_logger.LogInformation("Cleared {Count} cache entries", rowsAffected);
+			_logger.LogInformation("Cleared all cache entries");
 		} catch (Exception ex) {
 			_logger.LogError(ex, "Error clearing cache");
 			throw;
+		} finally {
+			_writeLock.Release();
 		}
 	}
 
 	public async Task<bool> ExistsAsync(string key) {
-		try {
-			long now = DateTimeOffset.UtcNow.ToUnixTimeSeconds();
-
-			string sql = """
-			             SELECT 1 FROM cache_entries 
-			             WHERE key = @key 
-			             AND (expires_at IS NULL OR expires_at > @now)
-			             LIMIT 1
-			             """;
+		long now = DateTimeOffset.UtcNow.ToUnixTimeSeconds();
+		if (_hot.TryGet(key, now, out _)) return true;
 
-			await using SqliteCommand command = new SqliteCommand(sql, _con);
-			command.Parameters.AddWithValue("@key", key);
-			command.Parameters.AddWithValue("@now", now);
+		await _readLock.WaitAsync();
+		await ThreadPoolHop.Yield();
+		try {
+			_existsCommand.Parameters["@key"].Value = key;
+			_existsCommand.Parameters["@now"].Value = now;
 
-			await using SqliteDataReader reader = await command.ExecuteReaderAsync();
+			await using SqliteDataReader reader = await _existsCommand.ExecuteReaderAsync();
 			return await reader.ReadAsync();
 		} catch (Exception ex) {
 			_logger.LogError(ex, "Error checking if key exists {Key}", key);
 			return false;
+		} finally {
+			_readLock.Release();
 		}
 	}
 
 	public async Task<long> GetSizeAsync() {
+		await _readLock.WaitAsync();
+		await ThreadPoolHop.Yield();
 		try {
-			string sql = "SELECT COUNT(*) FROM cache_entries";
-
-			await using SqliteCommand command = new SqliteCommand(sql, _con);
-			object?                   result  = await command.ExecuteScalarAsync();
+			object? result = await _sizeCommand.ExecuteScalarAsync();
 
 			return Convert.ToInt64(result);
 		} catch (Exception ex) {
 			_logger.LogError(ex, "Error getting cache size");
 			return 0;
+		} finally {
+			_readLock.Release();
 		}
 	}
 
 	/// <summary>
-	/// Removes expired entries and reclaims storage where VACUUM rebuilds database eliminating
-	/// fragmentation where periodic compaction maintains cache performance where automatic
-	/// expiration cleanup prevents unbounded growth
+	/// Removes expired entries and reclaims storage where incremental_vacuum frees a bounded number
+	/// of pages instead of rewriting the whole file where a database created before incremental
+	/// auto-vacuum gets one full VACUUM to convert it where the WAL is truncated afterwards
 	/// </summary>
 	public async Task CompactAsync() {
+		await _writeLock.WaitAsync();
+		await ThreadPoolHop.Yield();
 		try {
 			long now = DateTimeOffset.UtcNow.ToUnixTimeSeconds();
 
@@ -348,30 +589,27 @@ public class Cache : ICache {
 			cleanupCommand.Parameters.AddWithValue("@now", now);
 			int expiredCount = await cleanupCommand.ExecuteNonQueryAsync();
 
-			// Vacuum database to reclaim space
-			string                    vacuumSql     = "VACUUM";
-			await using SqliteCommand vacuumCommand = new SqliteCommand(vacuumSql, _con);
-			await vacuumCommand.ExecuteNonQueryAsync();
+			// Reclaim space in bounded steps once the file is in incremental mode
+			long autoVacuum;
+			await using (SqliteCommand modeCommand = new SqliteCommand("PRAGMA auto_vacuum", _con)) {
+				autoVacuum = (long)(await modeCommand.ExecuteScalarAsync() ?? 0L);
+			}
+
+			if (autoVacuum == AUTO_VACUUM_INCREMENTAL) {
+				ExecuteNonQuery(INCREMENTAL_VACUUM_SQL);
+			} else {
+				// The mode is re-asserted on this connection right before the one converting VACUUM
+				ExecuteNonQuery("PRAGMA auto_vacuum = INCREMENTAL");
+				ExecuteNonQuery("VACUUM");
+			}
+			ExecuteNonQuery("PRAGMA wal_checkpoint(TRUNCATE)");
 
 			_logger.LogInformation("Cache compaction completed: removed {ExpiredCount} expired entries", expiredCount);
 		} catch (Exception ex) {
 			_logger.LogError(ex, "Error compacting cache");
 			throw;
-		}
-	}
-
-	private async Task UpdateLastAccessedAsync(string key, long timestamp) {
-		try {
-			string sql = "UPDATE cache_entries SET last_accessed = @timestamp WHERE key = @key";
-
-			await using SqliteCommand command = new SqliteCommand(sql, _con);
-			command.Parameters.AddWithValue("@key", key);
-			command.Parameters.AddWithValue("@timestamp", timestamp);
-
-			await command.ExecuteNonQueryAsync();
-		} catch (Exception ex) {
-			_logger.LogTrace(ex, "Error updating last accessed time for key {Key}", key);
-			// Non-critical error, don't throw
+		} finally {
+			_writeLock.Release();
 		}
 	}
 
@@ -380,24 +618,19 @@ public class Cache : ICache {
 	/// where hash enables content-based lookup where INSERT OR IGNORE prevents duplicates
 	/// where prompt tracking enables analysis of which prompts produce best compressions
 	/// </summary>
-	private async Task<string> StorePromptAsync(string promptName, string promptContent) {
+	private async Task<string> StorePromptAsync(string promptName, string promptContent, SqliteTransaction? transaction = null) {
 		try {
 			// Generate hash for the prompt content
 			string promptHash = GeneratePromptHash(promptContent);
 			long   now        = DateTimeOffset.UtcNow.ToUnixTimeSeconds();
 
 			// Insert or ignore (if hash already exists, we don't need to store it again)
-			string sql = """
-			             INSERT OR IGNORE INTO prompts 
-			             (hash, name, content, created_at)
-			             VALUES (@hash, @name, @content, @now)
-			             """;
-
-			await using SqliteCommand command = new SqliteCommand(sql, _con);
-			command.Parameters.AddWithValue("@hash", promptHash);
-			command.Parameters.AddWithValue("@name", promptName);
-			command.Parameters.AddWithValue("@content", promptContent);
-			command.Parameters.AddWithValue("@now", now);
+			SqliteCommand command = _storePromptCommand;
+			command.Transaction                  = transaction;
+			command.Parameters["@hash"].Value    = promptHash;
+			command.Parameters["@name"].Value    = promptName;
+			command.Parameters["@content"].Value = promptContent;
+			command.Parameters["@now"].Value     = now;
 
 			await command.ExecuteNonQueryAsync();
 
@@ -408,20 +641,43 @@ public class Cache : ICache {
 		}
 	}
 
+	/// <summary>
+	/// Prompt hashes memoized by string identity where the same loaded prompt instance is passed
+	/// for every symbol of a run so its content is hashed once where entries die with the string
+	/// </summary>
+	private static readonly ConditionalWeakTable<string, string> _promptHashes = new ConditionalWeakTable<string, string>();
+
 	private static string GeneratePromptHash(string promptContent) {
-		using SHA256 sha256    = SHA256.Create();
-		byte[]       hashBytes = sha256.ComputeHash(System.Text.Encoding.UTF8.GetBytes(promptContent));
-		return Convert.ToHexString(hashBytes).ToLowerInvariant();
+		return _promptHashes.GetValue(promptContent, ComputePromptHash);
 	}
 
-	public async Task<(string Name, string Content)?> GetPromptAsync(string promptHash) {
+	/// <summary>
+	/// SHA-256 stays the hash so existing prompt rows keep matching where the one-shot HashData
+	/// uses the platform's hardware-accelerated path and small prompts encode on the stack
+	/// </summary>
+	private static string ComputePromptHash(string promptContent) {
+		const int STACK_LIMIT = 4096;
+
+		int        maxBytes = System.Text.Encoding.UTF8.GetMaxByteCount(promptContent.Length);
+		byte[]?    rented   = maxBytes > STACK_LIMIT ? ArrayPool<byte>.Shared.Rent(maxBytes) : null;
+		Span<byte> buffer   = rented != null ? rented : stackalloc byte[STACK_LIMIT];
 		try {
-			string sql = "SELECT name, content FROM prompts WHERE hash = @hash";
+			int        written = System.Text.Encoding.UTF8.GetBytes(promptContent, buffer);
+			Span<byte> hash    = stackalloc byte[SHA256.HashSizeInBytes];
+			SHA256.HashData(buffer[..written], hash);
+			return Convert.ToHexStringLower(hash);
+		} finally {
+			if (rented != null) ArrayPool<byte>.Shared.Return(rented);
+		}
+	}
 
-			await using SqliteCommand command = new SqliteCommand(sql, _con);
-			command.Parameters.AddWithValue("@hash", promptHash);
+	public async Task<(string Name, string Content)?> GetPromptAsync(string promptHash) {
+		await _readLock.WaitAsync();
+		await ThreadPoolHop.Yield();
+		try {
+			_getPromptCommand.Parameters["@hash"].Value = promptHash;
 
-			await using SqliteDataReader reader = await command.ExecuteReaderAsync();
+			await using SqliteDataReader reader = await _getPromptCommand.ExecuteReaderAsync();
 
 			if (await reader.ReadAsync()) {
 				return (reader.GetString(0), reader.GetString(1));
@@ -431,6 +687,8 @@ public class Cache : ICache {
 		} catch (Exception ex) {
 			_logger.LogError(ex, "Error getting prompt for hash {Hash}", promptHash);
 			return null;
+		} finally {
+			_readLock.Release();
 		}
 	}
 
@@ -441,43 +699,125 @@ public class Cache : ICache {
 	/// </summary>
 	public async Task<List<CacheEntryInfo>> GetAllEntriesAsync() {
 		try {
-			string sql = """
-			             SELECT ce.key, ce.type_name, ce.value, ce.created_at, ce.expires_at, ce.last_accessed, 
-			                    ce.prompt_name, p.name as prompt_display_name, ce.model_name, ce.provider_name
-			             FROM cache_entries ce
-			             LEFT JOIN prompts p ON ce.prompt_hash = p.hash
-			             ORDER BY ce.last_accessed DESC
-			             """;
-
-			await using SqliteCommand    command = new SqliteCommand(sql, _con);
-			await using SqliteDataReader reader  = await command.ExecuteReaderAsync();
-
 			List<CacheEntryInfo> entries = new List<CacheEntryInfo>();
+			await foreach (CacheEntryInfo entry in StreamEntriesAsync()) {
+				entries.Add(entry);
+			}
+			return entries;
+		} catch (Exception ex) {
+			_logger.LogError(ex, "Error getting all cache entries");
+			return new List<CacheEntryInfo>();
+		}
+	}
 
-			while (await reader.ReadAsync()) {
-				entries.Add(new CacheEntryInfo {
+	/// <summary>
+	/// Streams cache entries row by row as the reader produces them where consumers overlap
+	/// their own parsing and formatting with database reads where no intermediate list holds
+	/// the whole cache in memory where timestamps stay raw unix seconds until read where
+	/// ordering matches GetAllEntriesAsync
+	/// </summary>
+	public async IAsyncEnumerable<CacheEntryInfo> StreamEntriesAsync([EnumeratorCancellation] CancellationToken cancellationToken = default) {
+		const string sql = """
+		                   SELECT ce.key, ce.type_name, ce.value, ce.created_at, ce.expires_at, ce.last_accessed, 
+		                          ce.prompt_name, p.name as prompt_display_name, ce.model_name, ce.provider_name
+		                   FROM cache_entries ce
+		                   LEFT JOIN prompts p ON ce.prompt_hash = p.hash
+		                   ORDER BY ce.last_accessed DESC
+		                   """;
+
+		// The read connection stays held for the whole enumeration so don't issue reads from inside the loop
+		await _readLock.WaitAsync(cancellationToken);
+		await ThreadPoolHop.Yield();
+		try {
+			await using SqliteCommand    command = new SqliteCommand(sql, _readCon);
+			await using SqliteDataReader reader  = await command.ExecuteReaderAsync(cancellationToken);
+
+			while (await reader.ReadAsync(cancellationToken)) {
+				yield return new CacheEntryInfo {
 					Key               = reader.GetString(0),
-					TypeName          = reader.GetString(1),
-					Value             = reader.GetString(2),
-					CreatedAt         = DateTimeOffset.FromUnixTimeSeconds(reader.GetInt64(3)),
-					ExpiresAt         = reader.IsDBNull(4) ? null : DateTimeOffset.FromUnixTimeSeconds(reader.GetInt64(4)),
-					LastAccessed      = DateTimeOffset.FromUnixTimeSeconds(reader.GetInt64(5)),
+					TypeName          = StripCompressedSuffix(reader.GetString(1)),
+					Value             = ReadValue(reader, 2, reader.GetString(1)),
+					CreatedAtUnix     = reader.GetInt64(3),
+					ExpiresAtUnix     = reader.IsDBNull(4) ? null : reader.GetInt64(4),
+					LastAccessedUnix  = reader.GetInt64(5),
 					PromptName        = reader.IsDBNull(6) ? null : reader.GetString(6),
 					PromptDisplayName = reader.IsDBNull(7) ? null : reader.GetString(7),
 					ModelName         = reader.IsDBNull(8) ? null : reader.GetString(8),
 					ProviderName      = reader.IsDBNull(9) ? null : reader.GetString(9)
-				});
+				};
 			}
+		} finally {
+			_readLock.Release();
+		}
+	}
 
-			return entries;
+	/// <summary>
+	/// Periodically deletes expired rows in batches of SWEEP_BATCH_SIZE under the write lock where
+	/// each batch is its own short statement so concurrent sets interleave between batches
+	/// </summary>
+	private async Task SweepExpiredLoopAsync(CancellationToken cancellationToken) {
+		const string SQL = """
+		                   DELETE FROM cache_entries WHERE rowid IN (
+		                       SELECT rowid FROM cache_entries
+		                       WHERE expires_at IS NOT NULL AND expires_at <= @now
+		                       LIMIT @limit
+		                   )
+		                   """;
+
+		using PeriodicTimer timer = new PeriodicTimer(SWEEP_INTERVAL);
+		try {
+			while (await timer.WaitForNextTickAsync(cancellationToken)) {
+				int deleted;
+				int total = 0;
+				do {
+					await _writeLock.WaitAsync(cancellationToken);
+					try {
+						await using SqliteCommand command = new SqliteCommand(SQL, _con);
+						command.Parameters.AddWithValue("@now", DateTimeOffset.UtcNow.ToUnixTimeSeconds());
+						command.Parameters.AddWithValue("@limit", SWEEP_BATCH_SIZE);
+						deleted = await command.ExecuteNonQueryAsync(cancellationToken);
+					} finally {
+						_writeLock.Release();
+					}
+
+					if (deleted > 0) {
+						_logger.LogTrace("Swept {Count} expired cache entries", deleted);
+					}
+					total += deleted;
+				} while (deleted == SWEEP_BATCH_SIZE && !cancellationToken.IsCancellationRequested);
+
+				// Hand the freed pages back a step at a time so the file shrinks without a full VACUUM
+				if (total > 0) {
+					await _writeLock.WaitAsync(cancellationToken);
+					try {
+						ExecuteNonQuery(INCREMENTAL_VACUUM_SQL);
+					} finally {
+						_writeLock.Release();
+					}
+				}
+			}
+		} catch (OperationCanceledException) {
+			// Disposal
 		} catch (Exception ex) {
-			_logger.LogError(ex, "Error getting all cache entries");
-			return new List<CacheEntryInfo>();
+			_logger.LogError(ex, "Expiry sweeper stopped");
 		}
 	}
 
 	public void Dispose() {
 		try {
+			_sweeperCts.Cancel();
+			_sweeper.Wait(TimeSpan.FromSeconds(5));
+			_sweeperCts.Dispose();
+
+			_getCommand.Dispose();
+			_upsertCommand.Dispose();
+			_storePromptCommand.Dispose();
+			_existsCommand.Dispose();
+			_removeCommand.Dispose();
+			_sizeCommand.Dispose();
+			_getPromptCommand.Dispose();
+			_readCon?.Close();
+			_readCon?.Dispose();
 			_con?.Close();
 			_con?.Dispose();
 		} catch (Exception ex) {
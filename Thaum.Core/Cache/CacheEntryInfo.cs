@@ -1,14 +1,23 @@
 namespace Thaum.Core.Cache;
 
+/// <summary>
+/// One row of cache_entries as streamed by ICache.StreamEntriesAsync where timestamps are kept
+/// as the raw unix seconds stored in SQLite and only become DateTimeOffset when a consumer reads
+/// them so scans that never display times skip the conversion entirely
+/// </summary>
 public class CacheEntryInfo {
-	public required string          Key               { get; init; }
-	public required string          TypeName          { get; init; }
-	public required string          Value             { get; init; }
-	public          DateTimeOffset  CreatedAt         { get; init; }
-	public          DateTimeOffset? ExpiresAt         { get; init; }
-	public          DateTimeOffset  LastAccessed      { get; init; }
-	public          string?         PromptName        { get; init; }
-	public          string?         PromptDisplayName { get; init; }
-	public          string?         ModelName         { get; init; }
-	public          string?         ProviderName      { get; init; }
-}
\ No newline at end of file
+	public required string  Key               { get; init; }
+	public required string  TypeName          { get; init; }
+	public required string  Value             { get; init; }
+	public          long    CreatedAtUnix     { get; init; }
+	public          long?   ExpiresAtUnix     { get; init; }
+	public          long    LastAccessedUnix  { get; init; }
+	public          string? PromptName        { get; init; }
+	public          string? PromptDisplayName { get; init; }
+	public          string? ModelName         { get; init; }
+	public          string? ProviderName      { get; init; }
+
+	public DateTimeOffset  CreatedAt    => DateTimeOffset.FromUnixTimeSeconds(CreatedAtUnix);
+	public DateTimeOffset? ExpiresAt    => ExpiresAtUnix is { } expiresAt ? DateTimeOffset.FromUnixTimeSeconds(expiresAt) : null;
+	public DateTimeOffset  LastAccessed => DateTimeOffset.FromUnixTimeSeconds(LastAccessedUnix);
+}
@@ -0,0 +1,96 @@
+using System.IO.Enumeration;
+
+namespace Thaum.Core.Cache;
+
+/// <summary>
+/// Bounded in-process LRU of serialized cache values in front of SQLite where the recent working
+/// set is answered without touching the database where entries keep their expires_at so TTL is
+/// honoured identically to the SQL filter where a single lock guards the map and recency list
+/// since callers arrive from arbitrary thread-pool threads
+/// </summary>
+internal sealed class HotEntryCache {
+	private readonly record struct Entry(string Key, string Json, long? ExpiresAt);
+
+	private readonly int                                       _capacity;
+	private readonly Dictionary<string, LinkedListNode<Entry>> _map;
+	private readonly LinkedList<Entry>                         _recency = new LinkedList<Entry>();
+	private readonly object                                    _lock    = new object();
+
+	public HotEntryCache(int capacity) {
+		_capacity = capacity;
+		_map      = new Dictionary<string, LinkedListNode<Entry>>(capacity);
+	}
+
+	public bool TryGet(string key, long now, out string json) {
+		lock (_lock) {
+			if (_map.TryGetValue(key, out LinkedListNode<Entry>? node)) {
+				if (node.Value.ExpiresAt is { } expiresAt && expiresAt <= now) {
+					_map.Remove(key);
+					_recency.Remove(node);
+				} else {
+					_recency.Remove(node);
+					_recency.AddFirst(node);
+					json = node.Value.Json;
+					return true;
+				}
+			}
+		}
+
+		json = "";
+		return false;
+	}
+
+	public void Set(string key, string json, long? expiresAt) {
+		lock (_lock) {
+			if (_map.TryGetValue(key, out LinkedListNode<Entry>? node)) {
+				node.Value = new Entry(key, json, expiresAt);
+				_recency.Remove(node);
+				_recency.AddFirst(node);
+				return;
+			}
+
+			if (_map.Count >= _capacity && _recency.Last is { } oldest) {
+				_map.Remove(oldest.Value.Key);
+				_recency.RemoveLast();
+			}
+
+			_map[key] = _recency.AddFirst(new Entry(key, json, expiresAt));
+		}
+	}
+
+	public void Remove(string key) {
+		lock (_lock) {
+			if (_map.Remove(key, out LinkedListNode<Entry>? node)) {
+				_recency.Remove(node);
+			}
+		}
+	}
+
+	/// <summary>
+	/// Evicts keys matching a * / ? wildcard pattern case-insensitively where this mirrors the
+	/// ASCII case folding of the SQL LIKE used for the same invalidation on disk where a backslash
+	/// is doubled first since MatchesSimpleExpression treats it as an escape while the SQL side
+	/// matches it literally (Windows paths inside optimization keys)
+	/// </summary>
+	public void RemoveMatching(string pattern) {
+		string expression = pattern.Replace(@"\", @"\\");
+		lock (_lock) {
+			LinkedListNode<Entry>? node = _recency.First;
+			while (node != null) {
+				LinkedListNode<Entry>? next = node.Next;
+				if (FileSystemName.MatchesSimpleExpression(expression, node.Value.Key, ignoreCase: true)) {
+					_map.Remove(node.Value.Key);
+					_recency.Remove(node);
+				}
+				node = next;
+			}
+		}
+	}
+
+	public void Clear() {
+		lock (_lock) {
+			_map.Clear();
+			_recency.Clear();
+		}
+	}
+}
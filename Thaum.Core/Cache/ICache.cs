@@ -4,6 +4,7 @@ public interface ICache : IDisposable {
 	Task<T?>                   GetAsync<T>(string            key) where T : class;
 	Task<T?>                   TryGetAsync<T>(string         key) where T : class;
 	Task                       SetAsync<T>(string            key, T value, TimeSpan? expiration = null, string? promptName = null, string? promptContent = null, string? modelName = null, string? providerName = null) where T : class;
+	Task                       SetManyAsync<T>(IReadOnlyList<(string Key, T Value)> items, TimeSpan? expiration = null, string? promptName = null, string? promptContent = null, string? modelName = null, string? providerName = null) where T : class;
 	Task                       RemoveAsync(string            key);
 	Task                       InvalidatePatternAsync(string pattern);
 	Task                       ClearAsync();
@@ -11,4 +12,6 @@ public interface ICache : IDisposable {
 	Task<long>                 GetSizeAsync();
 	Task                       CompactAsync();
 	Task<List<CacheEntryInfo>> GetAllEntriesAsync();
+
+	IAsyncEnumerable<CacheEntryInfo> StreamEntriesAsync(CancellationToken cancellationToken = default);
 }
\ No newline at end of file
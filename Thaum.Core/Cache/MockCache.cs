@@ -1,3 +1,4 @@
+using System.Runtime.CompilerServices;
 using Microsoft.Extensions.Logging;
 
 namespace Thaum.Core.Cache;
@@ -11,9 +12,10 @@ public class MockCache : ICache {
 		_logger.LogInformation("Using no-op cache service - no persistence");
 	}
 
-	public Task<T?>                   GetAsync<T>(string            key) where T : class                                                                                                                                                       => Task.FromResult<T?>(null);
-	public Task<T?>                   TryGetAsync<T>(string         key) where T : class                                                                                                                                                       => Task.FromResult<T?>(null);
+	public Task<T?>                   GetAsync<T>(string            key) where T : class                                                                                                                                                       => Miss<T>.Task;
+	public Task<T?>                   TryGetAsync<T>(string         key) where T : class                                                                                                                                                       => Miss<T>.Task;
 	public Task                       SetAsync<T>(string            key, T value, TimeSpan? expiration = null, string? promptName = null, string? promptContent = null, string? modelName = null, string? providerName = null) where T : class => Task.CompletedTask;
+	public Task                       SetManyAsync<T>(IReadOnlyList<(string Key, T Value)> items, TimeSpan? expiration = null, string? promptName = null, string? promptContent = null, string? modelName = null, string? providerName = null) where T : class => Task.CompletedTask;
 	public Task                       RemoveAsync(string            key)     => Task.CompletedTask;
 	public Task                       InvalidatePatternAsync(string pattern) => Task.CompletedTask;
 	public Task                       ClearAsync()                           => Task.CompletedTask;
@@ -22,4 +24,14 @@ public class MockCache : ICache {
 	public Task                       CompactAsync()                         => Task.CompletedTask;
 	public Task<List<CacheEntryInfo>> GetAllEntriesAsync()                   => Task.FromResult(new List<CacheEntryInfo>());
 	public void                       Dispose()                              { }
+
+	// Completed miss shared per T so lookups against the mock allocate nothing
+	private static class Miss<T> where T : class {
+		public static readonly Task<T?> Task = System.Threading.Tasks.Task.FromResult<T?>(null);
+	}
+
+	public async IAsyncEnumerable<CacheEntryInfo> StreamEntriesAsync([EnumeratorCancellation] CancellationToken cancellationToken = default) {
+		await Task.CompletedTask;
+		yield break;
+	}
 }
\ No newline at end of file
@@ -0,0 +1,22 @@
+using System.Runtime.CompilerServices;
+
+namespace Thaum.Core.Cache;
+
+/// <summary>
+/// Awaitable that resumes the awaiting method on a thread-pool thread where Microsoft.Data.Sqlite's
+/// *Async methods actually run synchronously so hopping first keeps disk I/O off UI and other
+/// context-bound callers where awaiting from a context-free pool thread completes inline
+/// </summary>
+internal readonly struct ThreadPoolHop : ICriticalNotifyCompletion {
+	public static ThreadPoolHop Yield() => default;
+
+	public ThreadPoolHop GetAwaiter() => this;
+
+	public bool IsCompleted => Thread.CurrentThread.IsThreadPoolThread && SynchronizationContext.Current == null;
+
+	public void GetResult() { }
+
+	public void OnCompleted(Action continuation) => ThreadPool.QueueUserWorkItem(static c => c(), continuation, preferLocal: false);
+
+	public void UnsafeOnCompleted(Action continuation) => ThreadPool.UnsafeQueueUserWorkItem(static c => c(), continuation, preferLocal: false);
+}
@@ -0,0 +1,150 @@
+using System.Collections.Concurrent;
+using System.Security.Cryptography;
+using System.Text;
+using Microsoft.Extensions.Logging;
+using Ratatui;
+using Thaum.Core.Cache;
+
+namespace Thaum.Core;
+
+/// <summary>
+/// Exact-match response cache in front of another LLM where near-deterministic requests
+/// (temperature at most 0.1) hash provider/model/temperature/max tokens/stop/system/prompt into a
+/// cache key where hits return from the persistent ICache without a provider round trip where
+/// sampled requests pass straight through uncached since their output is expected to vary (re-rolls
+/// and rollouts depend on fresh draws) where wrapping itself is opt-in through GLB.CacheLLMResponses
+/// </summary>
+[LoggingIntrinsics]
+public partial class CachedLLM : LLM {
+	private static readonly TimeSpan Expiration = TimeSpan.FromDays(7);
+
+	private const double MAX_CACHEABLE_TEMPERATURE = 0.1;
+
+	private readonly LLM                _inner;
+	private readonly ICache             _cache;
+	private readonly string?            _provider;
+	private readonly ILogger<CachedLLM> _logger;
+
+	private readonly ConcurrentDictionary<string, Task<string>> _inflight = new();
+
+	public CachedLLM(LLM inner, ICache cache, string? provider = null) {
+		_inner    = inner;
+		_cache    = cache;
+		_provider = provider ?? GLB.AppConfig["LLM:Provider"];
+		_logger   = RatLog.Get<CachedLLM>();
+	}
+
+	public override async Task<string> CompleteAsync(string prompt, LLMOptions? options = null) {
+		options ??= new LLMOptions();
+		if (!IsCacheable(options))
+			return await _inner.CompleteAsync(prompt, options);
+
+		string key = GetCacheKey(options, null, prompt);
+		return await CompleteCoalesced(key, options.Model, () => _inner.CompleteAsync(prompt, options));
+	}
+
+	public override async Task<string> CompleteWithSystemAsync(string systemPrompt, string userPrompt, LLMOptions? options = null) {
+		options ??= new LLMOptions();
+		if (!IsCacheable(options))
+			return await _inner.CompleteWithSystemAsync(systemPrompt, userPrompt, options);
+
+		string key = GetCacheKey(options, systemPrompt, userPrompt);
+		return await CompleteCoalesced(key, options.Model, () => _inner.CompleteWithSystemAsync(systemPrompt, userPrompt, options));
+	}
+
+	public override async Task<IAsyncEnumerable<string>> StreamCompleteAsync(string prompt, LLMOptions? options = null) {
+		options ??= new LLMOptions();
+		if (!IsCacheable(options))
+			return await _inner.StreamCompleteAsync(prompt, options);
+
+		string key = GetCacheKey(options, null, prompt);
+		if (await _cache.TryGetAsync<string>(key) is { } cached) {
+			trace("LLM cache hit: {Key}", key);
+			return AsyncEnumerableFromSingle(cached);
+		}
+
+		IAsyncEnumerable<string> stream = await _inner.StreamCompleteAsync(prompt, options);
+		return TeeToCache(stream, key, options.Model);
+	}
+
+	/// <summary>
+	/// Cache lookup followed by a single provider call per key where concurrent identical requests
+	/// that miss together join the first caller's task instead of each hitting the provider where
+	/// the in-flight entry is only dropped after the response is stored so later callers hit the
+	/// cache where a failure propagates to every joined caller and is not cached
+	/// </summary>
+	private async Task<string> CompleteCoalesced(string key, string? model, Func<Task<string>> complete) {
+		if (await _cache.TryGetAsync<string>(key) is { } cached) {
+			trace("LLM cache hit: {Key}", key);
+			return cached;
+		}
+
+		TaskCompletionSource<string> owner    = new TaskCompletionSource<string>(TaskCreationOptions.RunContinuationsAsynchronously);
+		Task<string>                 inflight = _inflight.GetOrAdd(key, owner.Task);
+		if (inflight != owner.Task) {
+			trace("LLM in-flight join: {Key}", key);
+			return await inflight;
+		}
+
+		try {
+			string response = await complete();
+			await _cache.SetAsync(key, response, Expiration, modelName: model, providerName: _provider);
+			owner.SetResult(response);
+			return response;
+		} catch (Exception ex) {
+			owner.SetException(ex);
+			throw;
+		} finally {
+			_inflight.TryRemove(new KeyValuePair<string, Task<string>>(key, owner.Task));
+		}
+	}
+
+	/// <summary>
+	/// Forwards tokens as they arrive while accumulating the full response where the cache entry
+	/// is only written once the stream completes so partial responses are never stored
+	/// </summary>
+	private async IAsyncEnumerable<string> TeeToCache(IAsyncEnumerable<string> stream, string key, string? model) {
+		StringBuilder sb = new StringBuilder();
+		await foreach (string token in stream) {
+			sb.Append(token);
+			yield return token;
+		}
+		await _cache.SetAsync(key, sb.ToString(), Expiration, modelName: model, providerName: _provider);
+	}
+
+	private static bool IsCacheable(LLMOptions options) => options.Temperature <= MAX_CACHEABLE_TEMPERATURE;
+
+	private string GetCacheKey(LLMOptions options, string? systemPrompt, string prompt) {
+		string stop     = options.StopSequences is { Count: > 0 } stops ? string.Join('\u001f', stops) : "";
+		string material = $"{_provider}|{options.Model}|{options.Temperature}|{options.MaxTokens}|{stop}|{Canonicalize(systemPrompt)}|{Canonicalize(prompt)}";
+		return $"llm_{Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(material))).ToLowerInvariant()}";
+	}
+
+	/// <summary>
+	/// Folds prompt variants that differ only in line endings, trailing whitespace per line or
+	/// leading/trailing blank space onto one key where such edits cannot change what the prompt
+	/// asks so re-saved templates and CRLF checkouts still hit where indentation and interior
+	/// whitespace are kept since they are meaningful in source code
+	/// </summary>
+	private static string? Canonicalize(string? text) {
+		if (string.IsNullOrEmpty(text)) return text;
+
+		StringBuilder      sb   = new StringBuilder(text.Length);
+		ReadOnlySpan<char> rest = text.AsSpan().Trim();
+		while (!rest.IsEmpty) {
+			int                iEnd = rest.IndexOfAny('\r', '\n');
+			ReadOnlySpan<char> line = iEnd < 0 ? rest : rest[..iEnd];
+			sb.Append(line.TrimEnd());
+
+			if (iEnd < 0) break;
+			sb.Append('\n');
+			rest = rest[iEnd..].StartsWith("\r\n") ? rest[(iEnd + 2)..] : rest[(iEnd + 1)..];
+		}
+		return sb.ToString();
+	}
+
+	private static async IAsyncEnumerable<string> AsyncEnumerableFromSingle(string value) {
+		yield return value;
+		await Task.CompletedTask;
+	}
+}
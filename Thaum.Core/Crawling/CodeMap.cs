@@ -1,4 +1,5 @@
 using System.Collections;
+using System.Runtime.InteropServices;
 
 namespace Thaum.Core.Crawling;
 
@@ -40,11 +41,9 @@ public class CodeMap : IEnumerable<CodeSymbol> {
 	public CodeMap AddSymbol(CodeSymbol symbol) {
 		_allSymbols.Add(symbol);
 
-		// Index by file path
-		if (!_symbolsByFile.ContainsKey(symbol.FilePath)) {
-			_symbolsByFile[symbol.FilePath] = new List<CodeSymbol>();
-		}
-		_symbolsByFile[symbol.FilePath].Add(symbol);
+		// Index by file path (single hash lookup for both insert and append)
+		ref List<CodeSymbol>? fileSymbols = ref CollectionsMarshal.GetValueRefOrAddDefault(_symbolsByFile, symbol.FilePath, out _);
+		(fileSymbols ??= new List<CodeSymbol>()).Add(symbol);
 
 		// Index by name (latest wins for duplicates)
 		_symbolsByName[symbol.Name] = symbol;
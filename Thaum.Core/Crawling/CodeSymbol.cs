@@ -21,7 +21,8 @@ public record CodeSymbol(
 	public bool HasExtractedKey => !string.IsNullOrEmpty(ExtractedKey);
 }
 
-public enum SymbolKind {
+// Byte-backed so kind columns and per-symbol storage stay one byte wide
+public enum SymbolKind : byte {
 	Function,
 	Method,
 	Constructor,
@@ -37,7 +38,8 @@ public enum SymbolKind {
 	Parameter
 }
 
-public record CodeLoc(int Line, int Character);
+// Value type so every symbol stores its two locations inline instead of as two extra heap objects
+public readonly record struct CodeLoc(int Line, int Character);
 
 public record SymbolHierarchy(
 	string                     ProjectPath,
@@ -0,0 +1,171 @@
+using System.Collections.Concurrent;
+using System.Security.Cryptography;
+using System.Text.Json;
+using Microsoft.Data.Sqlite;
+using Microsoft.Extensions.Logging;
+using Ratatui;
+
+namespace Thaum.Core.Crawling;
+
+/// <summary>
+/// Persistent map from (file path, SHA-256 of file bytes) to the symbols extracted from it where an
+/// unchanged file skips tree-sitter entirely on repeat crawls where lookups run on the parse workers
+/// under one lock while new results are queued and flushed in a single transaction per crawl where a
+/// path keeps only its latest hash so the table stays bounded by the number of files seen
+/// </summary>
+internal sealed class ParseCache : IDisposable {
+	/// <summary>
+	/// Bumped whenever symbol queries or CodeSymbol shape change where a database stamped with an older
+	/// version is wiped on open so stale symbol lists are never served
+	/// </summary>
+	private const int SCHEMA_VERSION = 1;
+
+	private const string CREATE_SCHEMA_SQL = """
+	                                         CREATE TABLE IF NOT EXISTS parse_cache (
+	                                             path TEXT NOT NULL,
+	                                             hash BLOB NOT NULL,
+	                                             symbols BLOB NOT NULL,
+	                                             PRIMARY KEY (path, hash)
+	                                         ) WITHOUT ROWID;
+	                                         """;
+
+	private const string SQL_GET = "SELECT symbols FROM parse_cache WHERE path = @path AND hash = @hash";
+
+	private const string SQL_PRUNE = "DELETE FROM parse_cache WHERE path = @path AND hash <> @hash";
+
+	private const string SQL_UPSERT = """
+	                                  INSERT OR REPLACE INTO parse_cache (path, hash, symbols)
+	                                  VALUES (@path, @hash, @symbols)
+	                                  """;
+
+	private readonly ILogger<ParseCache> _logger;
+	private readonly SqliteConnection    _con;
+	private readonly SqliteCommand       _getCommand;
+	private readonly object              _lock = new object();
+
+	private readonly ConcurrentQueue<(string path, byte[] hash, byte[] symbols)> _pending = new();
+
+	private static readonly Lazy<ParseCache?> s_shared = new Lazy<ParseCache?>(() => TryOpen(GLB.ParseCachePath));
+
+	/// <summary>
+	/// Process-wide cache under the Thaum cache directory or null when the database cannot be opened
+	/// where crawling then simply parses every file as before
+	/// </summary>
+	public static ParseCache? Shared => s_shared.Value;
+
+	private ParseCache(string dbPath) {
+		_logger = RatLog.Get<ParseCache>();
+		_con    = new SqliteConnection($"Data Source={dbPath}");
+		_con.Open();
+
+		Execute("PRAGMA journal_mode=WAL;");
+		Execute("PRAGMA synchronous=NORMAL;");
+		Execute("PRAGMA busy_timeout=5000;");
+
+		using (SqliteCommand command = new SqliteCommand("PRAGMA user_version;", _con)) {
+			if (Convert.ToInt32(command.ExecuteScalar()) != SCHEMA_VERSION) {
+				Execute("DROP TABLE IF EXISTS parse_cache;");
+				Execute(CREATE_SCHEMA_SQL);
+				Execute($"PRAGMA user_version={SCHEMA_VERSION};");
+			}
+		}
+
+		_getCommand = new SqliteCommand(SQL_GET, _con);
+		_getCommand.Parameters.Add(new SqliteParameter { ParameterName = "@path" });
+		_getCommand.Parameters.Add(new SqliteParameter { ParameterName = "@hash" });
+		_getCommand.Prepare();
+	}
+
+	internal static ParseCache? TryOpen(string dbPath) {
+		try {
+			Directory.CreateDirectory(Path.GetDirectoryName(dbPath)!);
+			return new ParseCache(dbPath);
+		} catch (Exception ex) {
+			RatLog.Get<ParseCache>().LogWarning(ex, "Parse cache unavailable at {DbPath}, parsing without it", dbPath);
+			return null;
+		}
+	}
+
+	public static byte[] Hash(ReadOnlySpan<byte> source) => SHA256.HashData(source);
+
+	public bool TryGet(string path, byte[] hash, out List<CodeSymbol> symbols) {
+		try {
+			byte[]? blob;
+			lock (_lock) {
+				_getCommand.Parameters["@path"].Value = path;
+				_getCommand.Parameters["@hash"].Value = hash;
+				blob = _getCommand.ExecuteScalar() as byte[];
+			}
+
+			if (blob != null && JsonSerializer.Deserialize(blob, JsonContext.Default.ListCodeSymbol) is { } cached) {
+				// Deserialization gives every symbol its own copy of the path where a fresh parse shares
+				// one string per file so the rows are repointed at the caller's instance
+				for (int i = 0; i < cached.Count; i++) {
+					cached[i] = cached[i] with { FilePath = path };
+				}
+				symbols = cached;
+				return true;
+			}
+		} catch (Exception ex) {
+			_logger.LogDebug(ex, "Parse cache read failed for {FilePath}", path);
+		}
+
+		symbols = [];
+		return false;
+	}
+
+	/// <summary>
+	/// Queues a freshly parsed file for the next Flush where serialization happens here on the parse
+	/// worker so the flush itself only binds parameters
+	/// </summary>
+	public void Set(string path, byte[] hash, List<CodeSymbol> symbols) {
+		_pending.Enqueue((path, hash, JsonSerializer.SerializeToUtf8Bytes(symbols, JsonContext.Default.ListCodeSymbol)));
+	}
+
+	/// <summary>
+	/// Writes every queued result in one transaction and drops older hashes of the same paths where
+	/// one commit per crawl replaces one fsync-bound commit per file
+	/// </summary>
+	public void Flush() {
+		if (_pending.IsEmpty) return;
+
+		lock (_lock) {
+			try {
+				using SqliteTransaction transaction = _con.BeginTransaction();
+				using SqliteCommand     prune       = new SqliteCommand(SQL_PRUNE, _con, transaction);
+				using SqliteCommand     upsert      = new SqliteCommand(SQL_UPSERT, _con, transaction);
+				SqliteParameter         prunePath   = prune.Parameters.Add("@path", SqliteType.Text);
+				SqliteParameter         pruneHash   = prune.Parameters.Add("@hash", SqliteType.Blob);
+				SqliteParameter         path        = upsert.Parameters.Add("@path", SqliteType.Text);
+				SqliteParameter         hash        = upsert.Parameters.Add("@hash", SqliteType.Blob);
+				SqliteParameter         symbols     = upsert.Parameters.Add("@symbols", SqliteType.Blob);
+
+				int count = 0;
+				while (_pending.TryDequeue(out (string path, byte[] hash, byte[] symbols) entry)) {
+					prunePath.Value = path.Value = entry.path;
+					pruneHash.Value = hash.Value = entry.hash;
+					symbols.Value   = entry.symbols;
+					prune.ExecuteNonQuery();
+					upsert.ExecuteNonQuery();
+					count++;
+				}
+
+				transaction.Commit();
+				_logger.LogDebug("Parse cache stored {Count} files", count);
+			} catch (Exception ex) {
+				_logger.LogWarning(ex, "Parse cache flush failed");
+			}
+		}
+	}
+
+	private void Execute(string sql) {
+		using SqliteCommand command = new SqliteCommand(sql, _con);
+		command.ExecuteNonQuery();
+	}
+
+	public void Dispose() {
+		Flush();
+		_getCommand.Dispose();
+		_con.Dispose();
+	}
+}
@@ -1,6 +1,9 @@
+using System.Buffers;
 using System.Collections.Concurrent;
+using System.IO.Enumeration;
 using System.Text;
 using Microsoft.Extensions.Logging;
+using Microsoft.Win32.SafeHandles;
 using Ratatui;
 using Thaum.Core.Utils;
 using TreeSitter;
@@ -28,13 +31,17 @@ public static class TreeSitterQueries {
 /// for C#/Python/JavaScript/TypeScript/Go/Rust enabling polyglot analysis through unified interface
 /// </summary>
 public class TreeSitterCrawler : Crawler {
-	private readonly ILogger<TreeSitterCrawler>                   _logger;
-	private readonly Dictionary<string, TreeSitterLanguageConfig> _languageConfigs;
-	private readonly int                                          _maxDegreeOfParallelism;
+	private readonly ILogger<TreeSitterCrawler> _logger;
+	private readonly int                        _maxDegreeOfParallelism;
+
+	// Language tables are fixed for the process so every crawler shares one copy where single-language
+	// crawls memoize their extension table per language id instead of rebuilding it per call
+	private static readonly Dictionary<string, TreeSitterLanguageConfig>             s_languageConfigs    = InitializeLanguageConfigs();
+	private static readonly Dictionary<string, string>                               s_extensionLanguages = BuildExtensionLanguages(s_languageConfigs.Keys);
+	private static readonly ConcurrentDictionary<string, Dictionary<string, string>> s_languageExtensions = new(StringComparer.OrdinalIgnoreCase);
 
 	public TreeSitterCrawler() {
 		_logger                 = RatLog.Get<TreeSitterCrawler>();
-		_languageConfigs        = InitializeLanguageConfigs();
 		_maxDegreeOfParallelism = GetMaxDegreeOfParallelism();
 	}
 
@@ -43,21 +50,13 @@ public class TreeSitterCrawler : Crawler {
 		codeMap ??= CodeMap.Create();
 
 		try {
-			List<string> files = Directory.GetFiles(dirpath, "*.*", SearchOption.AllDirectories)
-				.Where(LangUtil.IsSourceFile)
-				.ToList();
-
-			IEnumerable<IGrouping<string, string>> byLang = files
-				.Select(f => new { file = f, lang = LangUtil.DetectLanguageFromFile(f).ToLowerInvariant() })
-				.GroupBy(t => t.lang, t => t.file);
-
-			foreach (IGrouping<string, string> group in byLang) {
-				string lang = group.Key;
-				if (_languageConfigs.ContainsKey(lang)) {
-					_logger.LogDebug("Scanning {Count} {Language} files...", group.Count(), lang);
-					await CrawlDir(lang, dirpath, codeMap);
-				}
-			}
+			// One walk tags every file with its language so all languages parse in a single parallel
+			// pass instead of one sequential pass (and one directory re-walk) per language where the
+			// extension table both filters and dispatches so each file costs one lookup
+			IEnumerable<(string file, string lang)> work = WalkSourceFiles(dirpath, null, s_extensionLanguages);
+
+			int count = await ParseFilesAsync(work, codeMap);
+			_logger.LogDebug("Parsed {Count} source files", count);
 		} catch (Exception ex) {
 			_logger.LogError(ex, "Error scanning workspace for symbols at {Dir}", dirpath);
 		}
@@ -70,6 +69,7 @@ public class TreeSitterCrawler : Crawler {
 		string language = LangUtil.DetectLanguageFromFile(filepath);
 		codeMap ??= CodeMap.Create();
 		List<CodeSymbol> symbols = await ExtractSymbolsFromFile(filepath, language);
+		ParseCache.Shared?.Flush();
 		codeMap.AddSymbols(symbols);
 		return codeMap;
 	}
@@ -136,30 +136,10 @@ public class TreeSitterCrawler : Crawler {
 		codeMap ??= CodeMap.Create();
 
 		try {
-			List<string> sourceFiles = Directory.GetFiles(dirpath, "*.*", SearchOption.AllDirectories)
-				.Where(f => LangUtil.IsSourceFileForLanguage(f, lang))
-				.Where(f => !ProjectExclusions.ShouldExclude(f, dirpath, lang))
-				.ToList();
-
-			_logger.LogDebug("Found {Count} {Language} files to parse", sourceFiles.Count, lang);
-
-			ConcurrentDictionary<string, List<CodeSymbol>> results = new ConcurrentDictionary<string, List<CodeSymbol>>();
-			ParallelOptions                                options = new ParallelOptions { MaxDegreeOfParallelism = _maxDegreeOfParallelism };
-
-			await Parallel.ForEachAsync(sourceFiles, options, async (filePath, ct) => {
-				try {
-					List<CodeSymbol> fileSymbols = await ExtractSymbolsFromFile(filePath, lang);
-					results[filePath] = fileSymbols;
-				} catch (Exception ex) {
-					_logger.LogWarning(ex, "Failed to parse file: {FilePath}", filePath);
-				}
-			});
+			IEnumerable<(string file, string lang)> work = WalkSourceFiles(dirpath, lang, s_languageExtensions.GetOrAdd(lang, static l => BuildExtensionLanguages([l])));
 
-			foreach (string filePath in sourceFiles) {
-				if (results.TryGetValue(filePath, out List<CodeSymbol>? fileSymbols)) {
-					codeMap.AddSymbols(fileSymbols);
-				}
-			}
+			int count = await ParseFilesAsync(work, codeMap);
+			_logger.LogDebug("Parsed {Count} {Language} files", count, lang);
 
 			_logger.LogDebug("Extracted {Count} symbols from {Language} files", codeMap.Count, lang);
 		} catch (Exception ex) {
@@ -169,17 +149,74 @@ public class TreeSitterCrawler : Crawler {
 		return codeMap;
 	}
 
+	/// <summary>
+	/// Single-pass recursive walk yielding matching files lazily where excluded directories (.git,
+	/// bin, obj, node_modules, gitignored paths ...) are pruned before they are entered instead of
+	/// listing their whole contents and filtering afterwards where the caller consumes the sequence
+	/// while it is produced so parsing starts on the first files as the walk continues where files
+	/// are matched by looking up the extension span of the bare file name in the precomputed table
+	/// so non-source files are rejected without building their full path where exclusion rules
+	/// (including .gitignore) are resolved once per walk and then applied to directories and files
+	/// </summary>
+	private static IEnumerable<(string file, string lang)> WalkSourceFiles(string root, string? lang, Dictionary<string, string> extensionLanguages) {
+		Dictionary<string, string>.AlternateLookup<ReadOnlySpan<char>> byExtension = extensionLanguages.GetAlternateLookup<ReadOnlySpan<char>>();
+		ProjectExclusions.Rules                                        exclusions  = ProjectExclusions.For(root);
+
+		EnumerationOptions options = new EnumerationOptions {
+			RecurseSubdirectories = true,
+			IgnoreInaccessible    = true,
+			AttributesToSkip      = 0
+		};
+
+		return new FileSystemEnumerable<(string file, string lang)>(root, (ref FileSystemEntry entry) => (entry.ToFullPath(), byExtension[Path.GetExtension(entry.FileName)]), options) {
+			ShouldRecursePredicate = (ref FileSystemEntry entry) => !exclusions.ShouldExclude(entry.ToFullPath(), lang),
+			ShouldIncludePredicate = (ref FileSystemEntry entry) => !entry.IsDirectory
+			                                                        && byExtension.TryGetValue(Path.GetExtension(entry.FileName), out string? fileLang)
+			                                                        && !exclusions.ShouldExclude(entry.ToFullPath(), fileLang)
+		};
+	}
+
+	/// <summary>
+	/// Parses files of any mix of languages across the thread pool where each file is CPU-bound
+	/// native parse + query work so throughput scales with cores where the input is pulled lazily
+	/// so a directory walk feeds workers as it goes where results are keyed by input position so
+	/// symbols are added to the map in walk order regardless of completion order
+	/// </summary>
+	private async Task<int> ParseFilesAsync(IEnumerable<(string file, string lang)> files, CodeMap codeMap) {
+		ConcurrentDictionary<int, List<CodeSymbol>> results = new ConcurrentDictionary<int, List<CodeSymbol>>();
+		ParallelOptions                             options = new ParallelOptions { MaxDegreeOfParallelism = _maxDegreeOfParallelism };
+
+		int count = 0;
+		await Parallel.ForEachAsync(files.Select((f, i) => (f.file, f.lang, index: i)), options, async (item, ct) => {
+			Interlocked.Increment(ref count);
+			try {
+				results[item.index] = await ExtractSymbolsFromFile(item.file, item.lang);
+			} catch (Exception ex) {
+				_logger.LogWarning(ex, "Failed to parse file: {FilePath}", item.file);
+			}
+		});
+
+		foreach (KeyValuePair<int, List<CodeSymbol>> fileSymbols in results.OrderBy(kv => kv.Key)) {
+			codeMap.AddSymbols(fileSymbols.Value);
+		}
+
+		ParseCache.Shared?.Flush();
+		return count;
+	}
+
 	public async Task<List<CodeSymbol>> CrawlFile(string lang, string filePath) {
 		if (!File.Exists(filePath)) {
 			return [];
 		}
 
-		return await ExtractSymbolsFromFile(filePath, lang);
+		List<CodeSymbol> symbols = await ExtractSymbolsFromFile(filePath, lang);
+		ParseCache.Shared?.Flush();
+		return symbols;
 	}
 
 	public async Task<string?> GetDefinitionAt(string lang, string filePath, CodeLoc codeLoc) {
 		// Enhanced TreeSitter-based symbol definition lookup
-		if (!_languageConfigs.TryGetValue(lang.ToLowerInvariant(), out TreeSitterLanguageConfig? config)) {
+		if (!s_languageConfigs.TryGetValue(lang.ToLowerInvariant(), out TreeSitterLanguageConfig? config)) {
 			return null;
 		}
 
@@ -198,7 +235,7 @@ public class TreeSitterCrawler : Crawler {
 
 	public async Task<List<string>> GetReferencesAt(string lang, string filePath, CodeLoc codeLoc) {
 		// Enhanced TreeSitter-based symbol reference lookup
-		if (!_languageConfigs.TryGetValue(lang.ToLowerInvariant(), out TreeSitterLanguageConfig? config)) {
+		if (!s_languageConfigs.TryGetValue(lang.ToLowerInvariant(), out TreeSitterLanguageConfig? config)) {
 			return [filePath];
 		}
 
@@ -269,28 +306,43 @@ public class TreeSitterCrawler : Crawler {
 	// 	}
 	// }
 
-	private static readonly HashSet<string> s_missingGrammars = new(StringComparer.OrdinalIgnoreCase);
+	// Written from parallel parse workers so it must tolerate concurrent adds
+	private static readonly ConcurrentDictionary<string, bool> s_missingGrammars = new(StringComparer.OrdinalIgnoreCase);
 
 	private async Task<List<CodeSymbol>> ExtractSymbolsFromFile(string filePath, string language) {
 		List<CodeSymbol> symbols = [];
 
 		try {
-			string content = await File.ReadAllTextAsync(filePath);
-
 			// Get the TreeSitter language configuration
-			if (_languageConfigs.TryGetValue(language, out TreeSitterLanguageConfig? config)) {
-				if (s_missingGrammars.Contains(config.Language)) {
-					// Grammar previously detected as missing; skip quietly
+			if (s_languageConfigs.TryGetValue(language, out TreeSitterLanguageConfig? config)) {
+				if (s_missingGrammars.ContainsKey(config.Language)) {
+					// Grammar previously detected as missing; skip quietly without reading the file
 					return symbols;
 				}
 
+				// The raw bytes only live long enough to hash and decode so they go in a pooled buffer where
+				// an unchanged file is answered from the persistent parse cache before any decoding happens
+				(byte[] buffer, int length) = await ReadPooledAsync(filePath);
+				byte[]      hash;
+				string      content;
+				ParseCache? cache = ParseCache.Shared;
+				try {
+					hash = ParseCache.Hash(buffer.AsSpan(0, length));
+					if (cache != null && cache.TryGet(filePath, hash, out List<CodeSymbol> cached)) {
+						return cached;
+					}
+					content = DecodeSource(buffer.AsSpan(0, length));
+				} finally {
+					ArrayPool<byte>.Shared.Return(buffer);
+				}
+
 				try {
-					using Parser parser = new Parser(config.Language);
-					symbols = parser.Parse(content, filePath);
+					symbols = Parser.ForCurrentThread(config.Language).Parse(content, filePath);
+					cache?.Set(filePath, hash, symbols);
 					_logger.LogDebug("Extracted {Count} symbols from {FilePath} using TreeSitter", symbols.Count, filePath);
 				} catch (DllNotFoundException dllEx) {
 					// Native parser library for this language is not available. Remember and downgrade noise.
-					s_missingGrammars.Add(config.Language);
+					s_missingGrammars.TryAdd(config.Language, true);
 					_logger.LogWarning(dllEx, "Tree-sitter grammar not found for language '{Language}'. Skipping files for this language.", config.Language);
 				}
 			} else {
@@ -303,7 +355,47 @@ public class TreeSitterCrawler : Crawler {
 		return symbols;
 	}
 
-	private Dictionary<string, TreeSitterLanguageConfig> InitializeLanguageConfigs() {
+	/// <summary>
+	/// Reads a whole file into a buffer rented from the shared pool where a parallel crawl reuses a
+	/// small set of buffers instead of allocating a fresh array per file (large-object heap for
+	/// anything past 85 KB) where the caller must return the buffer once it is done with the bytes
+	/// </summary>
+	private static async Task<(byte[] buffer, int length)> ReadPooledAsync(string filePath) {
+		using SafeFileHandle handle = File.OpenHandle(filePath);
+
+		long   size   = RandomAccess.GetLength(handle);
+		byte[] buffer = ArrayPool<byte>.Shared.Rent(checked((int)size));
+		int    read   = 0;
+		try {
+			while (read < size) {
+				int n = await RandomAccess.ReadAsync(handle, buffer.AsMemory(read, (int)size - read), read);
+				if (n == 0) break;
+				read += n;
+			}
+		} catch {
+			ArrayPool<byte>.Shared.Return(buffer);
+			throw;
+		}
+		return (buffer, read);
+	}
+
+	/// <summary>
+	/// Decodes raw file bytes in one shot where ReadAllText would stream them through a
+	/// StreamReader and StringBuilder copying every char twice where BOM detection matches
+	/// ReadAllText (UTF-8 by default, UTF-16 LE/BE when marked) so parsed text is unchanged
+	/// </summary>
+	private static string DecodeSource(ReadOnlySpan<byte> bytes) {
+		if (bytes.StartsWith(Utf8Bom)) return Encoding.UTF8.GetString(bytes[Utf8Bom.Length..]);
+		if (bytes.StartsWith(Utf16LeBom)) return Encoding.Unicode.GetString(bytes[Utf16LeBom.Length..]);
+		if (bytes.StartsWith(Utf16BeBom)) return Encoding.BigEndianUnicode.GetString(bytes[Utf16BeBom.Length..]);
+		return Encoding.UTF8.GetString(bytes);
+	}
+
+	private static ReadOnlySpan<byte> Utf8Bom    => [0xEF, 0xBB, 0xBF];
+	private static ReadOnlySpan<byte> Utf16LeBom => [0xFF, 0xFE];
+	private static ReadOnlySpan<byte> Utf16BeBom => [0xFE, 0xFF];
+
+	private static Dictionary<string, TreeSitterLanguageConfig> InitializeLanguageConfigs() {
 		return new Dictionary<string, TreeSitterLanguageConfig> {
 			["c-sharp"] = new TreeSitterLanguageConfig {
 				// Use hyphenated id to match native lib name: libtree-sitter-c-sharp.so
@@ -327,6 +419,21 @@ public class TreeSitterCrawler : Crawler {
 		};
 	}
 
+	/// <summary>
+	/// Extension to language id for every configured language where extensions match
+	/// case-insensitively like the per-language checks in LangUtil where the table is built once
+	/// and probed by span during the walk instead of re-running the extension switch per file
+	/// </summary>
+	private static Dictionary<string, string> BuildExtensionLanguages(IEnumerable<string> languages) {
+		Dictionary<string, string> table = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
+		foreach (string language in languages) {
+			foreach (string extension in LangUtil.GetExtensionsForLanguage(language)) {
+				table.TryAdd(extension, language);
+			}
+		}
+		return table;
+	}
+
 	public record TreeSitterLanguageConfig {
 		public required string Language { get; init; }
 	}
@@ -341,40 +448,74 @@ public class TreeSitterCrawler : Crawler {
 
 	public class Parser : IDisposable {
 		private readonly TreeSitter.Parser _parser;
-		private readonly Language          _language;
+		private readonly Grammar           _grammar;
 		private readonly ILogger<Parser>   _logger;
 
+		/// <summary>
+		/// Loaded grammar and its compiled symbol query for one language id where both are immutable
+		/// once built so every Parser and thread shares them where the query is compiled once per
+		/// language instead of once per parsed file and the native library is bound once per process
+		/// </summary>
+		private sealed record Grammar(Language Language, Query Query);
+
+		private static readonly ConcurrentDictionary<string, Lazy<Grammar>> s_grammars = new();
+
 		public Parser(string language) {
-			_logger                 = RatLog.Get<Parser>();
-			(string lib, string fn) = ResolveLanguageBinding(language);
-			_language               = new Language(lib, fn);
-			_parser                 = new TreeSitter.Parser(_language);
-			_languageId             = language.ToLowerInvariant();
+			_logger  = RatLog.Get<Parser>();
+			_grammar = GetGrammar(language.ToLowerInvariant());
+			_parser  = new TreeSitter.Parser(_grammar.Language);
+		}
+
+		// Native parsers are stateful and not thread-safe but reset on every parse so each worker
+		// thread keeps one per language for its lifetime instead of creating and freeing one per file
+		[ThreadStatic]
+		private static Dictionary<string, Parser>? t_parsers;
+
+		/// <summary>
+		/// Parser for a language owned by the calling thread where callers must finish with it before
+		/// yielding the thread (no await between fetching it and the end of Parse) and must not dispose it
+		/// </summary>
+		public static Parser ForCurrentThread(string language) {
+			Dictionary<string, Parser> parsers = t_parsers ??= new Dictionary<string, Parser>(StringComparer.OrdinalIgnoreCase);
+			if (!parsers.TryGetValue(language, out Parser? parser)) {
+				parser            = new Parser(language);
+				parsers[language] = parser;
+			}
+			return parser;
+		}
+
+		private static Grammar GetGrammar(string languageId) {
+			return s_grammars.GetOrAdd(languageId, static id => new Lazy<Grammar>(() => {
+				(string lib, string fn) = ResolveLanguageBinding(id);
+				Language language = new Language(lib, fn);
+				return new Grammar(language, new Query(language, GetQueryForLanguage(id)));
+			})).Value;
 		}
 
 		public List<CodeSymbol> Parse(string sourceCode, string filePath) {
 			List<CodeSymbol> symbols = new List<CodeSymbol>();
 			using Tree?      tree    = _parser.Parse(sourceCode);
-			string           qtext   = GetQueryForLanguage(_languageId);
-			using Query      query   = new Query(_language, qtext);
-			List<QueryMatch> matches = query.Execute(tree.RootNode).Matches.ToList();
 
-			foreach (QueryMatch match in matches) {
-				Node? nameNode = null;
-				Node? bodyNode = null;
+			// Matches arrive already grouped per pattern so one pass over each match's captures finds
+			// the name/body pair and the symbol kind without re-scanning or buffering
+			foreach (QueryMatch match in _grammar.Query.Execute(tree.RootNode).Matches) {
+				Node?      nameNode   = null;
+				Node?      bodyNode   = null;
+				SymbolKind symbolKind = SymbolKind.Variable;
 
 				foreach (QueryCapture capture in match.Captures) {
-					if (capture.Name.EndsWith(".name")) {
-						nameNode = capture.Node;
+					if (s_kindByCapture.TryGetValue(capture.Name, out SymbolKind kind)) {
+						nameNode   = capture.Node;
+						symbolKind = kind;
+					} else if (capture.Name.EndsWith(".name")) {
+						nameNode   = capture.Node;
+						symbolKind = SymbolKind.Variable;
 					} else if (capture.Name.EndsWith(".body")) {
 						bodyNode = capture.Node;
 					}
 				}
 
 				if (nameNode != null && bodyNode != null) {
-					string     captureName = match.Captures.First(c => c.Name.EndsWith(".name")).Name;
-					SymbolKind symbolKind  = GetSymbolKind(captureName);
-
 					symbols.Add(new CodeSymbol(
 						Name: nameNode.Text,
 						Kind: symbolKind,
@@ -395,31 +536,20 @@ public class TreeSitterCrawler : Crawler {
 			return (lib, fn);
 		}
 
-		private SymbolKind GetSymbolKind(string captureName) {
-			if (captureName.StartsWith("namespace")) {
-				return SymbolKind.Namespace;
-			} else if (captureName.StartsWith("function")) {
-				return SymbolKind.Function;
-			} else if (captureName.StartsWith("method")) {
-				return SymbolKind.Method;
-			} else if (captureName.StartsWith("constructor")) {
-				return SymbolKind.Constructor;
-			} else if (captureName.StartsWith("property")) {
-				return SymbolKind.Property;
-			} else if (captureName.StartsWith("field")) {
-				return SymbolKind.Field;
-			} else if (captureName.StartsWith("interface")) {
-				return SymbolKind.Interface;
-			} else if (captureName.StartsWith("class")) {
-				return SymbolKind.Class;
-			} else if (captureName.StartsWith("enum_member")) {
-				return SymbolKind.EnumMember;
-			} else if (captureName.StartsWith("enum")) {
-				return SymbolKind.Enum;
-			} else {
-				return SymbolKind.Variable;
-			}
-		}
+		// Full name-capture to kind so the match loop resolves a symbol's kind with one lookup where
+		// name captures outside this table fall back to Variable
+		private static readonly Dictionary<string, SymbolKind> s_kindByCapture = new Dictionary<string, SymbolKind> {
+			["namespace.name"]   = SymbolKind.Namespace,
+			["function.name"]    = SymbolKind.Function,
+			["method.name"]      = SymbolKind.Method,
+			["constructor.name"] = SymbolKind.Constructor,
+			["property.name"]    = SymbolKind.Property,
+			["field.name"]       = SymbolKind.Field,
+			["interface.name"]   = SymbolKind.Interface,
+			["class.name"]       = SymbolKind.Class,
+			["enum_member.name"] = SymbolKind.EnumMember,
+			["enum.name"]        = SymbolKind.Enum
+		};
 
 		private static string GetQueryForLanguage(string id) {
 			switch (id) {
@@ -460,7 +590,5 @@ public class TreeSitterCrawler : Crawler {
 		public void Dispose() {
 			_parser.Dispose();
 		}
-
-		private readonly string _languageId;
 	}
 }
\ No newline at end of file
@@ -47,12 +47,17 @@ public partial class Defragmentor {
 	private readonly PromptLoader          _promptLoader;
 	private readonly ILogger<Defragmentor> _logger;
 
+	// Bounds in-flight LLM work per phase where every symbol is still scheduled up front but only
+	// MaxLLMConcurrency of them read source and hold a provider request at any moment
+	private readonly SemaphoreSlim _throttler;
+
 	public Defragmentor(LLM llm, Crawler crawler, ICache cache, PromptLoader promptLoader) {
 		_llm          = llm;
 		_crawler      = crawler;
 		_cache        = cache;
 		_promptLoader = promptLoader;
 		_logger       = RatLog.Get<Defragmentor>();
+		_throttler    = new SemaphoreSlim(GLB.MaxLLMConcurrency);
 	}
 
 	/// <summary>
@@ -150,13 +155,13 @@ public partial class Defragmentor {
 			.Columns(new SpinnerColumn(), new TaskDescriptionColumn(), new ProgressBarColumn(), new PercentageColumn(), new RemainingTimeColumn())
 			.StartAsync(async ctx => {
 				ProgressTask task = ctx.AddTask($"Functions ({functions.Count})", maxValue: functions.Count);
-				string[] results = await Task.WhenAll(functions.Select(async function => {
+				string[] results = await Task.WhenAll(functions.Select(function => ThrottledAsync(async () => {
 					string              sourceCode = await GetSymbolSourceCode(function);
 					OptimizationContext context    = new OptimizationContext(Level: 1, AvailableKeys: [], PromptName: defaultPromptName);
 					string              summary    = await OptimizeSymbolWithStreamAsync(function, context, sourceCode);
 					task.Increment(1);
 					return summary;
-				}));
+				})));
 				functionOptimizations.AddRange(results);
 			});
 
@@ -175,12 +180,12 @@ public partial class Defragmentor {
 			.Columns(new SpinnerColumn(), new TaskDescriptionColumn(), new ProgressBarColumn(), new PercentageColumn(), new RemainingTimeColumn())
 			.StartAsync(async ctx => {
 				ProgressTask task = ctx.AddTask($"Functions ({functions.Count})", maxValue: functions.Count);
-				await Task.WhenAll(functions.Select(async function => {
+				await Task.WhenAll(functions.Select(function => ThrottledAsync(async () => {
 					string              sourceCode = await GetSymbolSourceCode(function);
 					OptimizationContext context    = new OptimizationContext(Level: 1, AvailableKeys: [k1], PromptName: defaultPromptName);
 					await OptimizeSymbolWithStreamAsync(function, context, sourceCode);
 					task.Increment(1);
-				}));
+				})));
 			});
 
 		// Phase 4: Optimize classes with K1
@@ -192,13 +197,13 @@ public partial class Defragmentor {
 			.Columns(new SpinnerColumn(), new TaskDescriptionColumn(), new ProgressBarColumn(), new PercentageColumn(), new RemainingTimeColumn())
 			.StartAsync(async ctx => {
 				ProgressTask task = ctx.AddTask($"Classes ({classes.Count})", maxValue: classes.Count);
-				string[] results = await Task.WhenAll(classes.Select(async cls => {
+				string[] results = await Task.WhenAll(classes.Select(cls => ThrottledAsync(async () => {
 					string              sourceCode = await GetSymbolSourceCode(cls);
 					OptimizationContext context    = new OptimizationContext(Level: 2, AvailableKeys: [k1], PromptName: defaultPromptName);
 					string              summary    = await OptimizeSymbolWithStreamAsync(cls, context, sourceCode);
 					task.Increment(1);
 					return summary;
-				}));
+				})));
 				classOptimizations.AddRange(results);
 			});
 
@@ -218,7 +223,7 @@ public partial class Defragmentor {
 			.Columns(new SpinnerColumn(), new TaskDescriptionColumn(), new ProgressBarColumn(), new PercentageColumn(), new RemainingTimeColumn())
 			.StartAsync(async ctx => {
 				ProgressTask task = ctx.AddTask($"Symbols ({all.Count})", maxValue: all.Count);
-				await Task.WhenAll(all.Select(async symbol => {
+				await Task.WhenAll(all.Select(symbol => ThrottledAsync(async () => {
 					string sourceCode = await GetSymbolSourceCode(symbol);
 					OptimizationContext context = new OptimizationContext(
 						Level: symbol.Kind is SymbolKind.Function or SymbolKind.Method ? 1 : 2,
@@ -226,7 +231,7 @@ public partial class Defragmentor {
 						PromptName: defaultPromptName);
 					await OptimizeSymbolWithStreamAsync(symbol, context, sourceCode);
 					task.Increment(1);
-				}));
+				})));
 			});
 
 		using IDisposable p7          = RatLog.Scope("Hierarchy Construction");
@@ -236,6 +241,24 @@ public partial class Defragmentor {
 		return new SymbolHierarchy(projectPath, rootSymbols, extractedKeys, DateTime.UtcNow);
 	}
 
+	private async Task<T> ThrottledAsync<T>(Func<Task<T>> work) {
+		await _throttler.WaitAsync();
+		try {
+			return await work();
+		} finally {
+			_throttler.Release();
+		}
+	}
+
+	private async Task ThrottledAsync(Func<Task> work) {
+		await _throttler.WaitAsync();
+		try {
+			await work();
+		} finally {
+			_throttler.Release();
+		}
+	}
+
 	public async Task<SymbolHierarchy> UpdateHierarchyAsync(SymbolHierarchy existing, List<CodeChange> changes) {
 		// Implement incremental update logic
 		foreach (CodeChange change in changes) {
@@ -23,11 +23,20 @@ public static class GLB {
 	public static int CompressTokens => 1024;
 	public static int KeyTokens      => 512;
 
+	// Maximum concurrent LLM requests for batch pipelines where LLM:MaxConcurrency overrides
+	// where the default keeps remote providers busy without tripping their rate limits
+	public static int MaxLLMConcurrency => int.TryParse(AppConfig["LLM:MaxConcurrency"], out int n) && n > 0 ? n : 10;
+
+	// Response caching is opt-in through LLM:CacheResponses where near-deterministic requests
+	// (temperature at most 0.1) replay stored completions and sampled ones always stay live
+	public static bool CacheLLMResponses => bool.TryParse(AppConfig["LLM:CacheResponses"], out bool on) && on;
+
 	// Standard directories where prompts provides template directory where cache provides storage
 	// where these paths follow platform conventions while maintaining consistency
-	public static string PromptsDir  => Path.Combine(Directory.GetCurrentDirectory(), "prompts");
-	public static string CacheDir    => AppConfig["Cache:Directory"] ?? Path.Combine(Path.GetTempPath(), "Thaum");
-	public static string CacheDbPath => Path.Combine(CacheDir, "cache.db");
+	public static string PromptsDir     => Path.Combine(Directory.GetCurrentDirectory(), "prompts");
+	public static string CacheDir       => AppConfig["Cache:Directory"] ?? Path.Combine(Path.GetTempPath(), "Thaum");
+	public static string CacheDbPath    => Path.Combine(CacheDir, "cache.db");
+	public static string ParseCachePath => Path.Combine(CacheDir, "ast-cache.db");
 
 	// Standard filenames where interactive log captures TUI sessions where output log handles general logging
 	// where env file provides environment configuration where app settings provides JSON configuration
@@ -56,11 +65,29 @@ public static class GLB {
 	// Ambient configuration access eliminating ceremonial injection patterns where truly global
 	// configuration deserves global access where the pattern recognizes that application config
 	// is genuinely singular where fighting this with DI creates friction without benefit
-	public static IConfigurationRoot AppConfig => new ConfigurationBuilder()
-		.SetBasePath(Directory.GetCurrentDirectory())
-		.AddJsonFile(AppSettingsFile, optional: true)
-		.AddEnvironmentVariables()
-		.Build();
+	// Built once and reused where every property above reads through it where ReloadConfig
+	// rebuilds after the process environment changes (e.g. once .env files are applied)
+	public static IConfigurationRoot AppConfig => _appConfig ??= BuildConfig();
+
+	private static IConfigurationRoot? _appConfig;
+
+	public static void ReloadConfig() => _appConfig = null;
+
+	private static IConfigurationRoot BuildConfig() {
+		ConfigurationBuilder builder = new ConfigurationBuilder();
+
+		// Read appsettings in a single call instead of probing for it first where a missing
+		// file simply contributes no keys the same way optional: true did
+		try {
+			byte[] json = File.ReadAllBytes(Path.Combine(Directory.GetCurrentDirectory(), AppSettingsFile));
+			builder.AddJsonStream(new MemoryStream(json, writable: false));
+		} catch (FileNotFoundException) {
+		} catch (DirectoryNotFoundException) { }
+
+		return builder
+			.AddEnvironmentVariables()
+			.Build();
+	}
 
 	/// <summary>
 	/// Gets default prompt name for symbol type with environment override capability
@@ -124,10 +151,10 @@ public static class GLB {
 
 	/// <summary>
 	/// JSON serialization options for cache with type info resolver where JsonContext provides
-	/// type metadata for efficient serialization where cached serialization options
-	/// maintain consistency across cache operations
+	/// type metadata for efficient serialization where a single shared instance keeps the
+	/// resolved metadata warm across every Cache instance instead of rebuilding it per access
 	/// </summary>
-	public static JsonSerializerOptions CacheJsonOptions => new JsonSerializerOptions {
+	public static JsonSerializerOptions CacheJsonOptions { get; } = new JsonSerializerOptions {
 		PropertyNamingPolicy   = JsonNamingPolicy.CamelCase,
 		WriteIndented          = false,
 		DefaultIgnoreCondition = System.Text.Json.Serialization.JsonIgnoreCondition.WhenWritingNull,
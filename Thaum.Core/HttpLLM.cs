@@ -1,203 +1,249 @@
-using System.Diagnostics.CodeAnalysis;
+using System.Diagnostics;
+using System.Net;
+using System.Net.Http.Headers;
+using System.Net.Http.Json;
 using System.Text;
 using System.Text.Json;
 using System.Text.Json.Serialization;
+using System.Text.Json.Serialization.Metadata;
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.Logging;
 using Ratatui;
 
 namespace Thaum.Core;
 
-// TODO there seems to be a lot of code duplication here
-
 [LoggingIntrinsics]
 public partial class HttpLLM : LLM {
 	private readonly HttpClient       _client;
 	private readonly IConfiguration   _configuration;
 	private readonly ILogger<HttpLLM> _logger;
 
+	/// <summary>
+	/// Process-wide connection pool shared by every HttpLLM where repeated calls reuse warm
+	/// TCP/TLS connections instead of handshaking per client where the pooled lifetime bounds how
+	/// long a connection outlives a DNS change where clients built on it never dispose it
+	/// </summary>
+	private static readonly SocketsHttpHandler SharedHandler = new SocketsHttpHandler {
+		PooledConnectionLifetime       = TimeSpan.FromMinutes(5),
+		PooledConnectionIdleTimeout    = TimeSpan.FromSeconds(75),
+		MaxConnectionsPerServer        = 32,
+		ConnectTimeout                 = TimeSpan.FromSeconds(10),
+		EnableMultipleHttp2Connections = true
+	};
+
 	public HttpLLM(HttpClient client, IConfiguration configuration) {
 		_client        = client;
 		_configuration = configuration;
 		_logger        = RatLog.Get<HttpLLM>();
 	}
 
-	public override async Task<string> CompleteAsync(string prompt, LLMOptions? options = null) {
-		options ??= new LLMOptions();
+	/// <summary>
+	/// Builds a client over the shared pool where provider headers travel per request so clients
+	/// never carry provider state of their own where HTTP/2 is requested so concurrent completions to one provider multiplex over a
+	/// single TLS connection (falling back to HTTP/1.1 for plain-http hosts like local Ollama)
+	/// where the timeout is widened past HttpClient's 100s default for long completions
+	/// </summary>
+	public HttpLLM(IConfiguration configuration)
+		: this(new HttpClient(SharedHandler, disposeHandler: false) {
+			Timeout               = TimeSpan.FromMinutes(5),
+			DefaultRequestVersion = HttpVersion.Version20,
+			DefaultVersionPolicy  = HttpVersionPolicy.RequestVersionOrLower
+		}, configuration) { }
 
-		string provider = _configuration["LLM:Provider"] ?? throw new InvalidOperationException("LLM:Provider configuration is required");
+	private enum Provider { OpenAI, Anthropic, Ollama, OpenRouter }
 
-		return provider.ToLowerInvariant() switch {
-			"openai"     => await CompleteOpenAI(prompt, options),
-			"anthropic"  => await CompleteAnthropic(prompt, options),
-			"ollama"     => await CompleteOllamaAsync(prompt, options),
-			"openrouter" => await CompleteOpenRouterAsync(prompt, options),
-			_            => throw new NotSupportedException($"Provider {provider} not supported")
-		};
-	}
+	/// <summary>
+	/// Everything about the configured provider that is fixed for the life of this instance where
+	/// the completion URL is parsed once and auth/attribution headers are looked up once instead of
+	/// per request where they ride on each HttpRequestMessage rather than mutating the client's
+	/// DefaultRequestHeaders so concurrent requests never race on shared header state
+	/// </summary>
+	private sealed record Endpoint(Provider Provider, Uri Url, KeyValuePair<string, string>[] Headers);
 
-	public override async Task<string> CompleteWithSystemAsync(string systemPrompt, string userPrompt, LLMOptions? options = null) {
-		options ??= new LLMOptions();
+	private Endpoint? _endpoint;
+
+	/// <summary>
+	/// LLM:Provider and its endpoint resolved once on first use where every call then switches on
+	/// an enum instead of re-reading configuration and lower-casing the name where a missing or
+	/// unknown provider still throws on the first request rather than at construction
+	/// </summary>
+	private Endpoint ResolvedEndpoint => _endpoint ??= ResolveEndpoint();
+
+	private Provider ResolvedProvider => ResolvedEndpoint.Provider;
 
+	private Endpoint ResolveEndpoint() {
 		string provider = _configuration["LLM:Provider"] ?? throw new InvalidOperationException("LLM:Provider configuration is required");
 
-		return provider.ToLowerInvariant() switch {
-			"openai"     => await CompleteOpenAIWithSystem(systemPrompt, userPrompt, options),
-			"anthropic"  => await CompleteAnthropicWithSystemAsync(systemPrompt, userPrompt, options),
-			"ollama"     => await CompleteOllamaWithSystemAsync(systemPrompt, userPrompt, options),
-			"openrouter" => await CompleteOpenRouterWithSystemAsync(systemPrompt, userPrompt, options),
+		Provider kind = provider.ToLowerInvariant() switch {
+			"openai"     => Provider.OpenAI,
+			"anthropic"  => Provider.Anthropic,
+			"ollama"     => Provider.Ollama,
+			"openrouter" => Provider.OpenRouter,
 			_            => throw new NotSupportedException($"Provider {provider} not supported")
 		};
-	}
 
-	public override async Task<IAsyncEnumerable<string>> StreamCompleteAsync(string prompt, LLMOptions? options = null) {
-		options ??= new LLMOptions();
+		string baseUrl = _configuration["LLM:BaseUrl"] ?? throw new InvalidOperationException($"LLM:BaseUrl configuration is required for {kind} provider");
+		string path    = kind switch {
+			Provider.Anthropic => "/messages",
+			Provider.Ollama    => "/api/generate",
+			_                  => "/chat/completions"
+		};
 
-		string provider = _configuration["LLM:Provider"] ?? throw new InvalidOperationException("LLM:Provider configuration is required");
+		List<KeyValuePair<string, string>> headers = [];
+		switch (kind) {
+			case Provider.OpenAI:
+				if (GLB.API_KEY_OPENAI is { Length: > 0 } openAIKey)
+					headers.Add(new("Authorization", $"Bearer {openAIKey}"));
+				break;
+			case Provider.Anthropic:
+				if (GLB.API_KEY_ANTHROPIC is { Length: > 0 } anthropicKey)
+					headers.Add(new("x-api-key", anthropicKey));
+				headers.Add(new("anthropic-version", "2023-06-01"));
+				break;
+			case Provider.OpenRouter:
+				if (GLB.API_KEY_OPENROUTER is { Length: > 0 } openRouterKey)
+					headers.Add(new("Authorization", $"Bearer {openRouterKey}"));
+				headers.Add(new("HTTP-Referer", _configuration["LLM:SiteUrl"] ?? "https://github.com/your-repo/thaum"));
+				headers.Add(new("X-Title", _configuration["LLM:AppName"] ?? "Thaum"));
+				break;
+		}
 
-		return provider.ToLowerInvariant() switch {
-			"openai"     => await StreamOpenAIAsync(prompt, options),
-			"anthropic"  => await StreamAnthropicAsync(prompt, options),
-			"ollama"     => await StreamOllamaAsync(prompt, options),
-			"openrouter" => await StreamOpenRouterAsync(prompt, options),
-			_            => throw new NotSupportedException($"Provider {provider} streaming not supported")
-		};
+		return new Endpoint(kind, new Uri($"{baseUrl}{path}"), headers.ToArray());
 	}
 
-	private async Task<string> CompleteOpenAI(string prompt, LLMOptions options) {
-		OpenAIRequest request = new OpenAIRequest {
-			Model = options.Model,
-			Messages = [
-				new OpenAIMessage { Role = "user", Content = prompt }
-			],
-			Temperature = options.Temperature,
-			MaxTokens   = options.MaxTokens,
-			Stop        = options.StopSequences?.ToArray()
-		};
-
-		return await SendOpenAIRequest(request);
+	/// <summary>
+	/// Serializes a request straight to UTF-8 through its source-generated contract where the
+	/// old string + StringContent round trip encoded every body twice where a byte[] body still
+	/// carries a Content-Length so providers never see a chunked upload
+	/// </summary>
+	private static ByteArrayContent JsonBody<T>(T request, JsonTypeInfo<T> typeInfo) {
+		ByteArrayContent content = new ByteArrayContent(JsonSerializer.SerializeToUtf8Bytes(request, typeInfo));
+		content.Headers.ContentType = new MediaTypeHeaderValue("application/json");
+		return content;
 	}
 
-	private async Task<string> CompleteOpenAIWithSystem(string systemPrompt, string userPrompt, LLMOptions options) {
-		OpenAIRequest request = new OpenAIRequest {
-			Model = options.Model,
-			Messages = [
-				new OpenAIMessage { Role = "system", Content = systemPrompt },
-				new OpenAIMessage { Role = "user", Content   = userPrompt }
-			],
-			Temperature = options.Temperature,
-			MaxTokens   = options.MaxTokens,
-			Stop        = options.StopSequences?.ToArray()
+	/// <summary>
+	/// POST to the resolved endpoint with the precomputed headers where the client's HTTP version
+	/// preference is copied over since SendAsync does not apply it to hand-built messages
+	/// </summary>
+	private HttpRequestMessage NewRequest(HttpContent content) {
+		Endpoint           endpoint = ResolvedEndpoint;
+		HttpRequestMessage request  = new HttpRequestMessage(HttpMethod.Post, endpoint.Url) {
+			Content       = content,
+			Version       = _client.DefaultRequestVersion,
+			VersionPolicy = _client.DefaultVersionPolicy
 		};
+		foreach (KeyValuePair<string, string> header in endpoint.Headers) {
+			request.Headers.TryAddWithoutValidation(header.Key, header.Value);
+		}
+		return request;
+	}
 
-		return await SendOpenAIRequest(request);
+	public override async Task<string> CompleteAsync(string prompt, LLMOptions? options = null) {
+		return await Complete(null, prompt, options ?? new LLMOptions());
 	}
 
-	[RequiresUnreferencedCode("Calls System.Text.Json.JsonSerializer.Serialize<TValue>(TValue, JsonSerializerOptions)")]
-	private async Task<string> SendOpenAIRequest(OpenAIRequest request) {
-		string        baseUrl = _configuration["LLM:BaseUrl"] ?? throw new InvalidOperationException("LLM:BaseUrl configuration is required for OpenAI provider");
-		string        json    = JsonSerializer.Serialize(request, JsonOptions.Default);
-		StringContent content = new StringContent(json, Encoding.UTF8, "application/json");
-
-		// Set OpenAI-specific headers
-		_client.DefaultRequestHeaders.Remove("Authorization");
-		string? apiKey = GLB.API_KEY_OPENAI;
-		if (!string.IsNullOrEmpty(apiKey)) {
-			_client.DefaultRequestHeaders.Add("Authorization", $"Bearer {apiKey}");
-		}
+	public override async Task<string> CompleteWithSystemAsync(string systemPrompt, string userPrompt, LLMOptions? options = null) {
+		return await Complete(systemPrompt, userPrompt, options ?? new LLMOptions());
+	}
 
-		try {
-			HttpResponseMessage response = await _client.PostAsync($"{baseUrl}/chat/completions", content);
-			response.EnsureSuccessStatusCode();
+	public override async Task<IAsyncEnumerable<string>> StreamCompleteAsync(string prompt, LLMOptions? options = null) {
+		options ??= new LLMOptions();
 
-			string          responseJson   = await response.Content.ReadAsStringAsync();
-			OpenAIResponse? openAIResponse = JsonSerializer.Deserialize<OpenAIResponse>(responseJson, JsonOptions.Default);
+		return ResolvedProvider switch {
+			Provider.OpenAI or Provider.OpenRouter => await StreamChatAsync(prompt, options),
+			Provider.Anthropic                     => await StreamAnthropicAsync(prompt, options),
+			Provider.Ollama                        => await StreamOllamaAsync(prompt, options),
+			_                                      => throw new UnreachableException()
+		};
+	}
 
-			return openAIResponse?.Choices?.FirstOrDefault()?.Message?.Content ?? "";
+	private async Task<string> Complete(string? systemPrompt, string userPrompt, LLMOptions options) {
+		try {
+			return ResolvedProvider switch {
+				Provider.OpenAI     => await CompleteOpenAIAsync(systemPrompt, userPrompt, options),
+				Provider.Anthropic  => await CompleteAnthropicAsync(systemPrompt, userPrompt, options),
+				Provider.Ollama     => await CompleteOllamaAsync(systemPrompt, userPrompt, options),
+				Provider.OpenRouter => await CompleteOpenRouterAsync(systemPrompt, userPrompt, options),
+				_                   => throw new UnreachableException()
+			};
 		} catch (Exception ex) {
-			err(ex, "Failed to complete OpenAI request");
+			err(ex, "Failed to complete {Provider} request", ResolvedProvider);
 			throw;
 		}
 	}
 
-	[RequiresUnreferencedCode("Calls System.Text.Json.JsonSerializer.Serialize<TValue>(TValue, JsonSerializerOptions)")]
-	private async Task<string> CompleteAnthropic(string prompt, LLMOptions options) {
-		AnthropicRequest request = new AnthropicRequest {
-			Model = options.Model.Replace("gpt-4", "claude-3-sonnet-20240229"),
-			Messages = [
-				new AnthropicMessage { Role = "user", Content = prompt }
-			],
-			Temperature = options.Temperature,
-			MaxTokens   = options.MaxTokens
-		};
-
-		string        baseUrl = _configuration["LLM:BaseUrl"] ?? throw new InvalidOperationException("LLM:BaseUrl configuration is required for Anthropic provider");
-		string        json    = JsonSerializer.Serialize(request, JsonOptions.Default);
-		StringContent content = new StringContent(json, Encoding.UTF8, "application/json");
-
-		// Add Anthropic-specific headers
-		_client.DefaultRequestHeaders.Remove("x-api-key");
-		string? apiKey = GLB.API_KEY_ANTHROPIC;
-		if (!string.IsNullOrEmpty(apiKey)) {
-			_client.DefaultRequestHeaders.Add("x-api-key", apiKey);
-			_client.DefaultRequestHeaders.Add("anthropic-version", "2023-06-01");
-		}
+	/// <summary>
+	/// Sends a typed JSON body to the provider endpoint where any non-success status is logged with
+	/// its body and thrown so every provider reports failures the same way where the response is
+	/// handed back undisposed for the caller to read or stream from
+	/// </summary>
+	private async Task<HttpResponseMessage> SendJsonAsync<TRequest>(TRequest request, JsonTypeInfo<TRequest> requestInfo, HttpCompletionOption completion = HttpCompletionOption.ResponseContentRead) {
+		HttpResponseMessage response = await _client.SendAsync(NewRequest(JsonBody(request, requestInfo)), completion);
+		if (response.IsSuccessStatusCode)
+			return response;
 
-		try {
-			HttpResponseMessage response = await _client.PostAsync($"{baseUrl}/messages", content);
-			response.EnsureSuccessStatusCode();
+		HttpStatusCode status       = response.StatusCode;
+		string         errorContent = await response.Content.ReadAsStringAsync();
+		response.Dispose();
 
-			string             responseJson      = await response.Content.ReadAsStringAsync();
-			AnthropicResponse? anthropicResponse = JsonSerializer.Deserialize<AnthropicResponse>(responseJson, JsonOptions.Default);
+		err("{Provider} API error {StatusCode}: {ErrorContent}", ResolvedProvider, status, errorContent);
+		throw new HttpRequestException($"{ResolvedProvider} API error {status}: {errorContent}", null, status);
+	}
 
-			return anthropicResponse?.Content?.FirstOrDefault()?.Text ?? "";
-		} catch (Exception ex) {
-			err(ex, "Failed to complete Anthropic request");
-			throw;
-		}
+	private async Task<TResponse?> PostJsonAsync<TRequest, TResponse>(TRequest request, JsonTypeInfo<TRequest> requestInfo, JsonTypeInfo<TResponse> responseInfo) {
+		using HttpResponseMessage response = await SendJsonAsync(request, requestInfo);
+		return await response.Content.ReadFromJsonAsync(responseInfo);
 	}
 
-	private async Task<string> CompleteAnthropicWithSystemAsync(string systemPrompt, string userPrompt, LLMOptions options) {
-		AnthropicRequest request = new AnthropicRequest {
-			Model  = options.Model.Replace("gpt-4", "claude-3-sonnet-20240229"),
-			System = systemPrompt,
-			Messages = [
-				new AnthropicMessage { Role = "user", Content = userPrompt }
-			],
-			Temperature = options.Temperature,
-			MaxTokens   = options.MaxTokens
-		};
+	private static OpenAIMessage[] ChatMessages(string? systemPrompt, string userPrompt) {
+		OpenAIMessage user = new OpenAIMessage { Role = "user", Content = userPrompt };
+		if (systemPrompt == null) return [user];
+		return [new OpenAIMessage { Role = "system", Content = systemPrompt }, user];
+	}
 
-		string        baseUrl = _configuration["LLM:BaseUrl"] ?? throw new InvalidOperationException("LLM:BaseUrl configuration is required for Anthropic provider");
-		string        json    = JsonSerializer.Serialize(request, JsonOptions.Default);
-		StringContent content = new StringContent(json, Encoding.UTF8, "application/json");
+	private static OpenAIRequest ChatRequest(string? systemPrompt, string userPrompt, LLMOptions options) => new OpenAIRequest {
+		Model       = options.Model,
+		Messages    = ChatMessages(systemPrompt, userPrompt),
+		Temperature = options.Temperature,
+		MaxTokens   = options.MaxTokens,
+		Stop        = options.StopSequences?.ToArray()
+	};
 
-		// Add Anthropic-specific headers
-		_client.DefaultRequestHeaders.Remove("x-api-key");
-		string? apiKey = GLB.API_KEY_ANTHROPIC;
-		if (!string.IsNullOrEmpty(apiKey)) {
-			_client.DefaultRequestHeaders.Add("x-api-key", apiKey);
-			_client.DefaultRequestHeaders.Add("anthropic-version", "2023-06-01");
-		}
+	private async Task<string> CompleteOpenAIAsync(string? systemPrompt, string userPrompt, LLMOptions options) {
+		OpenAIResponse? response = await PostJsonAsync(ChatRequest(systemPrompt, userPrompt, options), JsonOptions.OpenAIRequest, JsonOptions.OpenAIResponse);
+		return response?.Choices?.FirstOrDefault()?.Message?.Content ?? "";
+	}
 
-		try {
-			HttpResponseMessage response = await _client.PostAsync($"{baseUrl}/messages", content);
-			response.EnsureSuccessStatusCode();
+	private static AnthropicRequest AnthropicRequestFor(string? systemPrompt, string userPrompt, LLMOptions options, bool stream = false) => new AnthropicRequest {
+		Model  = options.Model.Replace("gpt-4", "claude-3-sonnet-20240229"),
+		System = systemPrompt != null ? AnthropicSystemBlock.From(systemPrompt) : null,
+		Messages = [
+			new AnthropicMessage { Role = "user", Content = userPrompt }
+		],
+		Temperature = options.Temperature,
+		MaxTokens   = options.MaxTokens,
+		Stream      = stream ? true : null
+	};
 
-			string             responseJson      = await response.Content.ReadAsStringAsync();
-			AnthropicResponse? anthropicResponse = JsonSerializer.Deserialize<AnthropicResponse>(responseJson, JsonOptions.Default);
+	private async Task<string> CompleteAnthropicAsync(string? systemPrompt, string userPrompt, LLMOptions options) {
+		AnthropicResponse? response = await PostJsonAsync(AnthropicRequestFor(systemPrompt, userPrompt, options), JsonOptions.AnthropicRequest, JsonOptions.AnthropicResponse);
+		if (response?.Usage is { } u) LogAnthropicUsage(response.Model ?? options.Model ?? "", u);
+		return response?.Content?.FirstOrDefault()?.Text ?? "";
+	}
 
-			return anthropicResponse?.Content?.FirstOrDefault()?.Text ?? "";
-		} catch (Exception ex) {
-			err(ex, "Failed to complete Anthropic request");
-			throw;
-		}
+	/// <summary>
+	/// Token usage including the prompt-cache split where cache_read is what the cache_control
+	/// breakpoint saved and cache_creation is what this call paid to write the cached prefix
+	/// </summary>
+	private void LogAnthropicUsage(string model, AnthropicUsage u) {
+		info("Anthropic usage model={Model} input={Input} output={Output} cacheRead={CacheRead} cacheCreation={CacheCreation}", model, u.InputTokens, u.OutputTokens, u.CacheReadInputTokens, u.CacheCreationInputTokens);
 	}
 
-	private async Task<string> CompleteOllamaAsync(string prompt, LLMOptions options) {
+	private async Task<string> CompleteOllamaAsync(string? systemPrompt, string userPrompt, LLMOptions options) {
 		OllamaRequest request = new OllamaRequest {
 			Model  = options.Model,
-			Prompt = prompt,
+			Prompt = systemPrompt != null ? $"System: {systemPrompt}\n\nUser: {userPrompt}" : userPrompt,
 			Stream = false,
 			Options = new OllamaOptions {
 				Temperature = options.Temperature,
@@ -205,151 +251,65 @@ public partial class HttpLLM : LLM {
 			}
 		};
 
-		string        baseUrl = _configuration["LLM:BaseUrl"] ?? throw new InvalidOperationException("LLM:BaseUrl configuration is required for Ollama provider");
-		string        json    = JsonSerializer.Serialize(request, JsonOptions.Default);
-		StringContent content = new StringContent(json, Encoding.UTF8, "application/json");
-
-		try {
-			HttpResponseMessage response = await _client.PostAsync($"{baseUrl}/api/generate", content);
-			response.EnsureSuccessStatusCode();
-
-			string          responseJson   = await response.Content.ReadAsStringAsync();
-			OllamaResponse? ollamaResponse = JsonSerializer.Deserialize<OllamaResponse>(responseJson, JsonOptions.Default);
-
-			return ollamaResponse?.Response ?? "";
-		} catch (Exception ex) {
-			err(ex, "Failed to complete Ollama request");
-			throw;
-		}
-	}
-
-	private async Task<string> CompleteOllamaWithSystemAsync(string systemPrompt, string userPrompt, LLMOptions options) {
-		string fullPrompt = $"System: {systemPrompt}\n\nUser: {userPrompt}";
-		return await CompleteOllamaAsync(fullPrompt, options);
-	}
-
-	private async Task<string> CompleteOpenRouterAsync(string prompt, LLMOptions options) {
-		string? model = options.Model;
-		OpenAIRequest request = new OpenAIRequest {
-			Model = model,
-			Messages = [
-				new OpenAIMessage { Role = "user", Content = prompt }
-			],
-			Temperature = options.Temperature,
-			MaxTokens   = options.MaxTokens,
-			Stop        = options.StopSequences?.ToArray()
-		};
-
-		return await SendOpenRouterRequestAsync(request);
-	}
-
-	private async Task<string> CompleteOpenRouterWithSystemAsync(string systemPrompt, string userPrompt, LLMOptions options) {
-		string? model = options.Model;
-		OpenAIRequest request = new OpenAIRequest {
-			Model = model,
-			Messages = [
-				new OpenAIMessage { Role = "system", Content = systemPrompt },
-				new OpenAIMessage { Role = "user", Content   = userPrompt }
-			],
-			Temperature = options.Temperature,
-			MaxTokens   = options.MaxTokens,
-			Stop        = options.StopSequences?.ToArray()
-		};
-
-		return await SendOpenRouterRequestAsync(request);
+		OllamaResponse? response = await PostJsonAsync(request, JsonOptions.OllamaRequest, JsonOptions.OllamaResponse);
+		return response?.Response ?? "";
 	}
 
-	private async Task<string> SendOpenRouterRequestAsync(OpenAIRequest request) {
-		string        baseUrl = _configuration["LLM:BaseUrl"] ?? throw new InvalidOperationException("LLM:BaseUrl configuration is required for OpenRouter provider");
-		string        json    = JsonSerializer.Serialize(request, JsonOptions.Default);
-		StringContent content = new StringContent(json, Encoding.UTF8, "application/json");
+	private async Task<string> CompleteOpenRouterAsync(string? systemPrompt, string userPrompt, LLMOptions options) {
+		OpenAIRequest request = ChatRequest(systemPrompt, userPrompt, options);
 
-		// Add OpenRouter-specific headers
-		string? apiKey  = GLB.API_KEY_OPENROUTER;
-		string  appName = _configuration["LLM:AppName"] ?? "Thaum";
-		string  siteUrl = _configuration["LLM:SiteUrl"] ?? "https://github.com/your-repo/thaum";
+		using HttpResponseMessage response       = await SendJsonAsync(request, JsonOptions.OpenAIRequest);
+		OpenAIResponse?           openAIResponse = await response.Content.ReadFromJsonAsync(JsonOptions.OpenAIResponse);
 
-		_client.DefaultRequestHeaders.Remove("Authorization");
-		_client.DefaultRequestHeaders.Remove("HTTP-Referer");
-		_client.DefaultRequestHeaders.Remove("X-Title");
-
-		if (!string.IsNullOrEmpty(apiKey)) {
-			_client.DefaultRequestHeaders.Add("Authorization", $"Bearer {apiKey}");
-		}
-		_client.DefaultRequestHeaders.Add("HTTP-Referer", siteUrl);
-		_client.DefaultRequestHeaders.Add("X-Title", appName);
-
-		try {
-			HttpResponseMessage response = await _client.PostAsync($"{baseUrl}/chat/completions", content);
-
-			if (!response.IsSuccessStatusCode) {
-				string errorContent = await response.Content.ReadAsStringAsync();
-				err("OpenRouter API error {StatusCode}: {ErrorContent}", response.StatusCode, errorContent);
-				throw new HttpRequestException($"OpenRouter API error {response.StatusCode}: {errorContent}");
+		// Try to emit token usage and cost estimation if available
+		if (openAIResponse?.Usage is { } u) {
+			(double cost, bool havePrice) = TryEstimateOpenRouterCost(request.Model, u.PromptTokens, u.CompletionTokens);
+			if (havePrice) {
+				info("OpenRouter usage model={Model} prompt={Prompt} completion={Completion} total={Total} estCost=${Cost:F6}", request.Model, u.PromptTokens, u.CompletionTokens, u.TotalTokens, cost);
+			} else {
+				info("OpenRouter usage model={Model} prompt={Prompt} completion={Completion} total={Total}", request.Model, u.PromptTokens, u.CompletionTokens, u.TotalTokens);
 			}
+		} else {
+			// Fallback to any cost-related headers if OpenRouter provided them
+			LogOpenRouterHeaders(response);
+		}
 
-			string          responseJson   = await response.Content.ReadAsStringAsync();
-			OpenAIResponse? openAIResponse = JsonSerializer.Deserialize<OpenAIResponse>(responseJson, JsonOptions.Default);
+		return openAIResponse?.Choices?.FirstOrDefault()?.Message?.Content ?? "";
+	}
 
-			// Try to emit token usage and cost estimation if available
-			if (openAIResponse?.Usage is { } u) {
-				(double cost, bool havePrice) = TryEstimateOpenRouterCost(request.Model, u.PromptTokens, u.CompletionTokens);
-				if (havePrice) {
-					info("OpenRouter usage model={Model} prompt={Prompt} completion={Completion} total={Total} estCost=${Cost:F6}", request.Model, u.PromptTokens, u.CompletionTokens, u.TotalTokens, cost);
-				} else {
-					info("OpenRouter usage model={Model} prompt={Prompt} completion={Completion} total={Total}", request.Model, u.PromptTokens, u.CompletionTokens, u.TotalTokens);
-				}
-			} else {
-				// Fallback to any cost-related headers if OpenRouter provided them
-				foreach (KeyValuePair<string, IEnumerable<string>> h in response.Headers) {
-					if (h.Key.StartsWith("x-openrouter", StringComparison.OrdinalIgnoreCase)) {
-						info("{Header}: {Value}", h.Key, string.Join(",", h.Value));
-					}
-				}
+	private void LogOpenRouterHeaders(HttpResponseMessage response) {
+		foreach (KeyValuePair<string, IEnumerable<string>> h in response.Headers) {
+			if (h.Key.StartsWith("x-openrouter", StringComparison.OrdinalIgnoreCase)) {
+				info("{Header}: {Value}", h.Key, string.Join(",", h.Value));
 			}
-
-			return openAIResponse?.Choices?.FirstOrDefault()?.Message?.Content ?? "";
-		} catch (Exception ex) {
-			err(ex, "Failed to complete OpenRouter request");
-			throw;
 		}
 	}
 
-	private async Task<IAsyncEnumerable<string>> StreamOpenAIAsync(string prompt, LLMOptions options) {
+	/// <summary>
+	/// OpenAI-compatible chat streaming shared by OpenAI and OpenRouter where the two differ only in
+	/// the precomputed endpoint headers and OpenRouter's usage/cost response headers
+	/// </summary>
+	private async Task<IAsyncEnumerable<string>> StreamChatAsync(string prompt, LLMOptions options) {
 		OpenAIStreamRequest request = new OpenAIStreamRequest {
-			Model = options.Model,
-			Messages = [
-				new OpenAIMessage { Role = "user", Content = prompt }
-			],
+			Model       = options.Model,
+			Messages    = ChatMessages(null, prompt),
 			Temperature = options.Temperature,
 			MaxTokens   = options.MaxTokens,
 			Stream      = true
 		};
 
-		string        baseUrl = _configuration["LLM:BaseUrl"] ?? throw new InvalidOperationException("LLM:BaseUrl configuration is required for OpenAI provider");
-		string        json    = JsonSerializer.Serialize(request, JsonOptions.Default);
-		StringContent content = new StringContent(json, Encoding.UTF8, "application/json");
-
-		HttpRequestMessage httpRequest = new HttpRequestMessage(HttpMethod.Post, $"{baseUrl}/chat/completions") {
-			Content = content
-		};
-
-		// Add OpenAI authorization header
-		string? apiKey = GLB.API_KEY_OPENAI;
-		if (!string.IsNullOrEmpty(apiKey)) {
-			httpRequest.Headers.Add("Authorization", $"Bearer {apiKey}");
+		HttpResponseMessage response = await SendJsonAsync(request, JsonOptions.OpenAIStreamRequest, HttpCompletionOption.ResponseHeadersRead);
+		if (ResolvedProvider == Provider.OpenRouter) {
+			LogOpenRouterHeaders(response);
 		}
 
-		HttpResponseMessage response = await _client.SendAsync(httpRequest, HttpCompletionOption.ResponseHeadersRead);
-		response.EnsureSuccessStatusCode();
-
 		return StreamResponseTokens(response);
 	}
 
 	private async Task<IAsyncEnumerable<string>> StreamAnthropicAsync(string prompt, LLMOptions options) {
-		// Anthropic streaming - fallback to batch for now
-		string result = await CompleteAnthropic(prompt, options);
-		return AsyncEnumerableFromSingle(result);
+		AnthropicRequest    request  = AnthropicRequestFor(null, prompt, options, stream: true);
+		HttpResponseMessage response = await SendJsonAsync(request, JsonOptions.AnthropicRequest, HttpCompletionOption.ResponseHeadersRead);
+		return StreamAnthropicTokens(response);
 	}
 
 	private async Task<IAsyncEnumerable<string>> StreamOllamaAsync(string prompt, LLMOptions options) {
@@ -363,68 +323,10 @@ public partial class HttpLLM : LLM {
 			}
 		};
 
-		string        baseUrl = _configuration["LLM:BaseUrl"] ?? throw new InvalidOperationException("LLM:BaseUrl configuration is required for Ollama provider");
-		string        json    = JsonSerializer.Serialize(request, JsonOptions.Default);
-		StringContent content = new StringContent(json, Encoding.UTF8, "application/json");
-
-		HttpRequestMessage httpRequest = new HttpRequestMessage(HttpMethod.Post, $"{baseUrl}/api/generate") {
-			Content = content
-		};
-		HttpResponseMessage response = await _client.SendAsync(httpRequest, HttpCompletionOption.ResponseHeadersRead);
-		response.EnsureSuccessStatusCode();
-
+		HttpResponseMessage response = await SendJsonAsync(request, JsonOptions.OllamaRequest, HttpCompletionOption.ResponseHeadersRead);
 		return StreamOllamaTokens(response);
 	}
 
-	private async Task<IAsyncEnumerable<string>> StreamOpenRouterAsync(string prompt, LLMOptions options) {
-		string? model = options.Model;
-		OpenAIStreamRequest request = new OpenAIStreamRequest {
-			Model = model,
-			Messages = [
-				new OpenAIMessage { Role = "user", Content = prompt }
-			],
-			Temperature = options.Temperature,
-			MaxTokens   = options.MaxTokens,
-			Stream      = true
-		};
-
-		string        baseUrl = _configuration["LLM:BaseUrl"] ?? throw new InvalidOperationException("LLM:BaseUrl configuration is required for OpenRouter provider");
-		string        json    = JsonSerializer.Serialize(request, JsonOptions.Default);
-		StringContent content = new StringContent(json, Encoding.UTF8, "application/json");
-
-		// Add OpenRouter-specific headers to the request
-		string? apiKey  = GLB.API_KEY_OPENROUTER;
-		string  appName = _configuration["LLM:AppName"] ?? "Thaum";
-		string  siteUrl = _configuration["LLM:SiteUrl"] ?? "https://github.com/your-repo/thaum";
-
-		HttpRequestMessage httpRequest = new HttpRequestMessage(HttpMethod.Post, $"{baseUrl}/chat/completions") {
-			Content = content
-		};
-
-		if (!string.IsNullOrEmpty(apiKey)) {
-			httpRequest.Headers.Add("Authorization", $"Bearer {apiKey}");
-		}
-		httpRequest.Headers.Add("HTTP-Referer", siteUrl);
-		httpRequest.Headers.Add("X-Title", appName);
-
-		HttpResponseMessage response = await _client.SendAsync(httpRequest, HttpCompletionOption.ResponseHeadersRead);
-
-		if (!response.IsSuccessStatusCode) {
-			string errorContent = await response.Content.ReadAsStringAsync();
-			err("OpenRouter streaming API error {StatusCode}: {ErrorContent}", response.StatusCode, errorContent);
-			throw new HttpRequestException($"OpenRouter streaming API error {response.StatusCode}: {errorContent}");
-		}
-
-		// Headers may contain OpenRouter-specific usage/cost info; log if present
-		foreach (KeyValuePair<string, IEnumerable<string>> h in response.Headers) {
-			if (h.Key.StartsWith("x-openrouter", StringComparison.OrdinalIgnoreCase)) {
-				info("{Header}: {Value}", h.Key, string.Join(",", h.Value));
-			}
-		}
-
-		return StreamResponseTokens(response);
-	}
-
 	/// <summary>
 	/// Attempts to estimate OpenRouter request cost in USD using either configured pricing or defaults.
 	/// Pricing source (in order): environment OPENROUTER_PRICING_JSON, appsettings LLM:OpenRouterPrices, otherwise unknown.
@@ -462,40 +364,94 @@ public partial class HttpLLM : LLM {
 	}
 
 	private static async IAsyncEnumerable<string> StreamResponseTokens(HttpResponseMessage response) {
-		using Stream       stream = await response.Content.ReadAsStreamAsync();
-		using StreamReader reader = new StreamReader(stream);
-
-		string? line;
-		while ((line = await reader.ReadLineAsync()) != null) {
-			if (line.StartsWith("data: ")) {
-				string data = line[6..]; // Remove "data: " prefix
-				if (data == "[DONE]") break;
-
-				OpenAIStreamChunk? chunk = null;
-				try {
-					chunk = JsonSerializer.Deserialize<OpenAIStreamChunk>(data, JsonOptions.Default);
-				} catch (JsonException) {
-					// Skip invalid JSON lines
-					continue;
-				}
+		await using Stream stream = await response.Content.ReadAsStreamAsync();
 
-				string? delta = chunk?.Choices?.FirstOrDefault()?.Delta?.Content;
-				if (!string.IsNullOrEmpty(delta)) {
-					yield return delta;
-				}
+		await foreach (ReadOnlyMemory<byte> data in ServerSentEvents.ReadDataAsync(stream)) {
+			string? delta;
+			try {
+				delta = ReadOpenAIDelta(data.Span);
+			} catch (JsonException) {
+				// Skip invalid JSON lines
+				continue;
+			}
+
+			if (!string.IsNullOrEmpty(delta)) {
+				yield return delta;
+			}
+		}
+	}
+
+	/// <summary>
+	/// Pulls choices[0].delta.content out of one chat chunk with a forward-only reader where this
+	/// runs once per generated token so no chunk/choice/delta objects are materialized where every
+	/// other property (ids, roles, finish reasons, usage) is skipped without decoding
+	/// </summary>
+	private static string? ReadOpenAIDelta(ReadOnlySpan<byte> json) {
+		Utf8JsonReader reader = new Utf8JsonReader(json);
+		if (!reader.Read() || reader.TokenType != JsonTokenType.StartObject) return null;
+
+		if (!SeekProperty(ref reader, "choices"u8) || !reader.Read() || reader.TokenType != JsonTokenType.StartArray) return null;
+		if (!reader.Read() || reader.TokenType != JsonTokenType.StartObject) return null;
+		if (!SeekProperty(ref reader, "delta"u8) || !reader.Read() || reader.TokenType != JsonTokenType.StartObject) return null;
+		if (!SeekProperty(ref reader, "content"u8) || !reader.Read() || reader.TokenType != JsonTokenType.String) return null;
+
+		return reader.GetString();
+	}
+
+	/// <summary>
+	/// Advances through the current object to the named property where sibling values are skipped
+	/// whole where false means the object ended without it
+	/// </summary>
+	private static bool SeekProperty(ref Utf8JsonReader reader, ReadOnlySpan<byte> name) {
+		while (reader.Read() && reader.TokenType == JsonTokenType.PropertyName) {
+			if (reader.ValueTextEquals(name)) return true;
+			reader.Skip();
+		}
+		return false;
+	}
+
+	/// <summary>
+	/// Anthropic Messages SSE where only content_block_delta events carry text and message_stop
+	/// ends the stream where the event type is read from the data payload itself so the separate
+	/// event: lines can be skipped by the shared reader where a mid-stream error event is logged
+	/// and ends enumeration instead of being mistaken for an empty delta
+	/// </summary>
+	private async IAsyncEnumerable<string> StreamAnthropicTokens(HttpResponseMessage response) {
+		await using Stream stream = await response.Content.ReadAsStreamAsync();
+
+		await foreach (ReadOnlyMemory<byte> data in ServerSentEvents.ReadDataAsync(stream)) {
+			AnthropicStreamEvent? evt;
+			try {
+				evt = JsonSerializer.Deserialize(data.Span, JsonOptions.AnthropicStreamEvent);
+			} catch (JsonException) {
+				// Skip invalid JSON lines
+				continue;
+			}
+
+			switch (evt?.Type) {
+				case "message_start":
+					// Input-side usage (including the prompt-cache split) arrives once up front
+					if (evt?.Message is { Usage: { } u } message) LogAnthropicUsage(message.Model ?? "", u);
+					break;
+				case "content_block_delta":
+					if (evt?.Delta?.Text is { Length: > 0 } text) yield return text;
+					break;
+				case "message_stop":
+					yield break;
+				case "error":
+					err("Anthropic stream error: {Payload}", Encoding.UTF8.GetString(data.Span));
+					yield break;
 			}
 		}
 	}
 
 	private static async IAsyncEnumerable<string> StreamOllamaTokens(HttpResponseMessage response) {
-		using Stream       stream = await response.Content.ReadAsStreamAsync();
-		using StreamReader reader = new StreamReader(stream);
+		await using Stream stream = await response.Content.ReadAsStreamAsync();
 
-		string? line;
-		while ((line = await reader.ReadLineAsync()) != null) {
-			OllamaStreamChunk? chunk = null;
+		await foreach (ReadOnlyMemory<byte> line in ServerSentEvents.ReadLinesAsync(stream)) {
+			OllamaStreamChunk? chunk;
 			try {
-				chunk = JsonSerializer.Deserialize<OllamaStreamChunk>(line, JsonOptions.Default);
+				chunk = JsonSerializer.Deserialize(line.Span, JsonOptions.OllamaStreamChunk);
 			} catch (JsonException) {
 				// Skip invalid JSON lines
 				continue;
@@ -508,11 +464,6 @@ public partial class HttpLLM : LLM {
 		}
 	}
 
-	private static async IAsyncEnumerable<string> AsyncEnumerableFromSingle(string value) {
-		yield return value;
-		await Task.CompletedTask;
-	}
-
 	// HttpClient is managed by DI container, don't dispose
 }
 
@@ -587,28 +538,13 @@ internal record OpenAIUsage {
 	public int TotalTokens { get; init; }
 }
 
-internal record OpenAIStreamChunk {
-	[JsonPropertyName("choices")]
-	public OpenAIStreamChoice[]? Choices { get; init; }
-}
-
-internal record OpenAIStreamChoice {
-	[JsonPropertyName("delta")]
-	public OpenAIStreamDelta? Delta { get; init; }
-}
-
-internal record OpenAIStreamDelta {
-	[JsonPropertyName("content")]
-	public string? Content { get; init; }
-}
-
 // Anthropic API Models
 internal record AnthropicRequest {
 	[JsonPropertyName("model")]
 	public string Model { get; init; } = "";
 
 	[JsonPropertyName("system")]
-	public string? System { get; init; }
+	public AnthropicSystemBlock[]? System { get; init; }
 
 	[JsonPropertyName("messages")]
 	public AnthropicMessage[] Messages { get; init; } = [];
@@ -618,6 +554,41 @@ internal record AnthropicRequest {
 
 	[JsonPropertyName("max_tokens")]
 	public int MaxTokens { get; init; }
+
+	[JsonPropertyName("stream")]
+	public bool? Stream { get; init; }
+}
+
+/// <summary>
+/// System prompt sent as a content block where prompts long enough to be worth caching (roughly
+/// the 1024-token minimum Anthropic caches) carry an ephemeral cache_control breakpoint so
+/// repeated calls sharing the same system prompt are billed and processed from the prompt cache
+/// </summary>
+internal record AnthropicSystemBlock {
+	private const int CACHE_MIN_CHARS = 4000;
+
+	[JsonPropertyName("type")]
+	public string Type { get; init; } = "text";
+
+	[JsonPropertyName("text")]
+	public string Text { get; init; } = "";
+
+	[JsonPropertyName("cache_control")]
+	public AnthropicCacheControl? CacheControl { get; init; }
+
+	public static AnthropicSystemBlock[] From(string systemPrompt) => [
+		new AnthropicSystemBlock {
+			Text         = systemPrompt,
+			CacheControl = systemPrompt.Length > CACHE_MIN_CHARS ? AnthropicCacheControl.Ephemeral : null
+		}
+	];
+}
+
+internal record AnthropicCacheControl {
+	public static readonly AnthropicCacheControl Ephemeral = new AnthropicCacheControl();
+
+	[JsonPropertyName("type")]
+	public string Type { get; init; } = "ephemeral";
 }
 
 internal record AnthropicMessage {
@@ -629,8 +600,28 @@ internal record AnthropicMessage {
 }
 
 internal record AnthropicResponse {
+	[JsonPropertyName("model")]
+	public string? Model { get; init; }
+
 	[JsonPropertyName("content")]
 	public AnthropicContent[]? Content { get; init; }
+
+	[JsonPropertyName("usage")]
+	public AnthropicUsage? Usage { get; init; }
+}
+
+internal record AnthropicUsage {
+	[JsonPropertyName("input_tokens")]
+	public int InputTokens { get; init; }
+
+	[JsonPropertyName("output_tokens")]
+	public int OutputTokens { get; init; }
+
+	[JsonPropertyName("cache_read_input_tokens")]
+	public int CacheReadInputTokens { get; init; }
+
+	[JsonPropertyName("cache_creation_input_tokens")]
+	public int CacheCreationInputTokens { get; init; }
 }
 
 internal record AnthropicContent {
@@ -638,6 +629,23 @@ internal record AnthropicContent {
 	public string? Text { get; init; }
 }
 
+internal record AnthropicStreamEvent {
+	[JsonPropertyName("type")]
+	public string? Type { get; init; }
+
+	[JsonPropertyName("delta")]
+	public AnthropicStreamDelta? Delta { get; init; }
+
+	// Only set on message_start where it carries the model and input usage
+	[JsonPropertyName("message")]
+	public AnthropicResponse? Message { get; init; }
+}
+
+internal record AnthropicStreamDelta {
+	[JsonPropertyName("text")]
+	public string? Text { get; init; }
+}
+
 // Ollama API Models
 internal record OllamaRequest {
 	[JsonPropertyName("model")]
@@ -680,4 +688,18 @@ internal static class JsonOptions {
 		DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
 		TypeInfoResolver       = JsonContext.Default
 	};
+
+	// Source-generated metadata resolved once where request bodies, per-token stream parsing and
+	// response reads go straight to the typed contract instead of looking the type up per call
+	public static readonly JsonTypeInfo<OpenAIRequest>        OpenAIRequest        = Info<OpenAIRequest>();
+	public static readonly JsonTypeInfo<OpenAIStreamRequest>  OpenAIStreamRequest  = Info<OpenAIStreamRequest>();
+	public static readonly JsonTypeInfo<AnthropicRequest>     AnthropicRequest     = Info<AnthropicRequest>();
+	public static readonly JsonTypeInfo<OllamaRequest>        OllamaRequest        = Info<OllamaRequest>();
+	public static readonly JsonTypeInfo<OpenAIResponse>       OpenAIResponse       = Info<OpenAIResponse>();
+	public static readonly JsonTypeInfo<AnthropicResponse>    AnthropicResponse    = Info<AnthropicResponse>();
+	public static readonly JsonTypeInfo<AnthropicStreamEvent> AnthropicStreamEvent = Info<AnthropicStreamEvent>();
+	public static readonly JsonTypeInfo<OllamaResponse>       OllamaResponse       = Info<OllamaResponse>();
+	public static readonly JsonTypeInfo<OllamaStreamChunk>    OllamaStreamChunk    = Info<OllamaStreamChunk>();
+
+	private static JsonTypeInfo<T> Info<T>() => (JsonTypeInfo<T>)Default.GetTypeInfo(typeof(T));
 }
\ No newline at end of file
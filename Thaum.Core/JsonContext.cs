@@ -8,18 +8,20 @@ namespace Thaum.Core;
 [JsonSerializable(typeof(OpenAIResponse))]
 [JsonSerializable(typeof(OpenAIChoice))]
 [JsonSerializable(typeof(OpenAIMessage))]
-[JsonSerializable(typeof(OpenAIStreamChunk))]
-[JsonSerializable(typeof(OpenAIStreamChoice))]
-[JsonSerializable(typeof(OpenAIStreamDelta))]
 [JsonSerializable(typeof(AnthropicRequest))]
 [JsonSerializable(typeof(AnthropicMessage))]
+[JsonSerializable(typeof(AnthropicSystemBlock))]
 [JsonSerializable(typeof(AnthropicResponse))]
 [JsonSerializable(typeof(AnthropicContent))]
+[JsonSerializable(typeof(AnthropicUsage))]
+[JsonSerializable(typeof(AnthropicStreamEvent))]
+[JsonSerializable(typeof(AnthropicStreamDelta))]
 [JsonSerializable(typeof(OllamaRequest))]
 [JsonSerializable(typeof(OllamaOptions))]
 [JsonSerializable(typeof(OllamaResponse))]
 [JsonSerializable(typeof(OllamaStreamChunk))]
 [JsonSerializable(typeof(CodeSymbol))]
+[JsonSerializable(typeof(List<CodeSymbol>))]
 [JsonSerializable(typeof(SymbolHierarchy))]
 [JsonSerializable(typeof(OptimizationContext))]
 [JsonSerializable(typeof(LLMOptions))]
@@ -7,46 +7,114 @@ namespace Thaum.Core;
 
 [LoggingIntrinsics]
 public partial class PromptLoader {
-	private readonly        ILogger<PromptLoader>                _logger;
-	private readonly        string                               _promptsDirectory;
-	private readonly        Dictionary<string, string>           _promptCache;
-	private static readonly ConcurrentDictionary<string, string> _sharedCache = new();
+	private readonly ILogger<PromptLoader> _logger;
+	private readonly string                _promptsDirectory;
+
+	private readonly record struct CachedPrompt(DateTime Mtime, string Content, long LoadedAt, long CheckedAt);
+
+	private const int  MAX_CACHED_PROMPTS   = 256;
+	private const long PROMPT_TTL_MS        = 10 * 60 * 1000;
+	private const long PROMPT_REVALIDATE_MS = 2 * 1000;
+
+	// Process-wide template cache keyed by full path where hits inside the revalidation interval are
+	// served from memory without touching the filesystem and older hits re-check the file's last
+	// write time so edited prompts are picked up within a session without re-reading unchanged ones
+	// where entries also expire after a TTL (covering coarse mtime resolution) and the oldest load
+	// is evicted past the cap so long sessions over many prompt directories stay bounded
+	private static readonly ConcurrentDictionary<string, CachedPrompt> _sharedCache = new();
 
 	public PromptLoader(string? directory = null) {
 		_logger           = RatLog.Get<PromptLoader>();
 		_promptsDirectory = directory ?? GLB.PromptsDir;
-		_promptCache      = new Dictionary<string, string>();
 	}
 
 	public async Task<string> LoadPrompt(string promptName) {
-		if (_promptCache.TryGetValue(promptName, out string? cached))
-			return cached;
-
-		if (_sharedCache.TryGetValue(promptName, out string? globalCached)) {
-			_promptCache[promptName] = globalCached;
-			return globalCached;
-		}
-
 		string path = Path.Combine(_promptsDirectory, $"{promptName}.txt");
+		long   now  = Environment.TickCount64;
+
+		bool hit = _sharedCache.TryGetValue(path, out CachedPrompt cached) && now - cached.LoadedAt < PROMPT_TTL_MS;
+		if (hit && now - cached.CheckedAt < PROMPT_REVALIDATE_MS)
+			return cached.Content;
 
-		if (!File.Exists(path)) {
+		// A single stat serves as both the existence check and the cache validator
+		FileInfo info = new FileInfo(path);
+		if (!info.Exists) {
 			throw new FileNotFoundException($"Prompt file not found: {path}");
 		}
 
+		DateTime mtime = info.LastWriteTimeUtc;
+		if (hit && cached.Mtime == mtime) {
+			_sharedCache[path] = cached with { CheckedAt = now };
+			return cached.Content;
+		}
+
 		try {
 			string content = await File.ReadAllTextAsync(path, Encoding.UTF8);
-			_promptCache[promptName] = content;
-			// Only log if we won the race to add to shared cache
-			if (_sharedCache.TryAdd(promptName, content)) {
-				trace("Loaded prompt: {PromptName} from {Path}", promptName, path);
-			}
-			return _sharedCache[promptName];
+			_sharedCache[path] = new CachedPrompt(mtime, content, now, now);
+			if (_sharedCache.Count > MAX_CACHED_PROMPTS)
+				EvictOldest();
+
+			trace("Loaded prompt: {PromptName} from {Path}", promptName, path);
+			return content;
 		} catch (Exception ex) {
 			err(ex, "Failed to load prompt: {PromptName}", promptName);
 			throw;
 		}
 	}
 
+	/// <summary>
+	/// Warms the shared cache with every template in the prompts directory concurrently where
+	/// pipelines that fan out over many prompts no longer stall on cold reads one at a time where
+	/// a template that fails to load is logged and left for LoadPrompt to surface on real use and
+	/// the returned task never faults so callers may start it without awaiting
+	/// </summary>
+	public async Task PreloadAsync() {
+		try {
+			if (!Directory.Exists(_promptsDirectory)) return;
+
+			IEnumerable<Task> loads = Directory.EnumerateFiles(_promptsDirectory, "*.txt")
+				.Select(async path => {
+					try {
+						await LoadPrompt(Path.GetFileNameWithoutExtension(path));
+					} catch (Exception) {
+						// Already logged by LoadPrompt
+					}
+				});
+
+			await Task.WhenAll(loads);
+		} catch (Exception ex) {
+			// Directory enumeration failures (removed or unreadable directory) only cost the warm-up
+			err(ex, "Failed to preload prompts from {Directory}", _promptsDirectory);
+		}
+	}
+
+	/// <summary>
+	/// Drops one prompt from the shared cache so its next load re-reads the file
+	/// </summary>
+	public void Invalidate(string promptName) {
+		_sharedCache.TryRemove(Path.Combine(_promptsDirectory, $"{promptName}.txt"), out _);
+	}
+
+	/// <summary>
+	/// Drops every cached prompt across all PromptLoader instances
+	/// </summary>
+	public static void Clear() {
+		_sharedCache.Clear();
+	}
+
+	private static void EvictOldest() {
+		string? oldestPath = null;
+		long    oldestAt   = long.MaxValue;
+		foreach (KeyValuePair<string, CachedPrompt> entry in _sharedCache) {
+			if (entry.Value.LoadedAt < oldestAt) {
+				oldestAt   = entry.Value.LoadedAt;
+				oldestPath = entry.Key;
+			}
+		}
+		if (oldestPath != null)
+			_sharedCache.TryRemove(oldestPath, out _);
+	}
+
 	public async Task<string> FormatPrompt(string promptName, Dictionary<string, object> env) {
 		string result = await LoadPrompt(promptName);
 		return PromptUtil.FormatPrompt(env, result);
@@ -1,3 +1,4 @@
+using System.Text;
 using Thaum.Core.Crawling;
 
 namespace Thaum.Core;
@@ -27,14 +28,58 @@ public static class StringUtil {
 }
 
 public static class PromptUtil {
+	/// <summary>
+	/// Line separating a template's static prefix from its dynamic suffix where providers cache
+	/// prompts from the first token forward so everything above it must stay byte-identical
+	/// </summary>
+	public const string DYNAMIC_SENTINEL = "---DYNAMIC---";
+
+	/// <summary>
+	/// Substitutes {placeholders} from env where templates containing a DYNAMIC_SENTINEL line keep
+	/// the prefix above it verbatim (no substitution) and only render the suffix below so per-call
+	/// values can never leak into the cacheable prefix where the sentinel line itself is dropped
+	/// where the suffix is rendered in one left-to-right pass so substituted values are never
+	/// rescanned and unknown placeholders are left as written
+	/// </summary>
 	public static string FormatPrompt(Dictionary<string, object> env, string result) {
-		foreach (KeyValuePair<string, object> kvp in env) {
-			string placeholder = $"{{{kvp.Key}}}";
-			string value       = kvp.Value.ToString() ?? string.Empty;
-			result = result.Replace(placeholder, value);
+		(string prefix, string dynamic) = SplitDynamic(result);
+
+		Dictionary<string, object>.AlternateLookup<ReadOnlySpan<char>> lookup = env.GetAlternateLookup<ReadOnlySpan<char>>();
+
+		StringBuilder      sb   = new StringBuilder(prefix, prefix.Length + dynamic.Length * 2);
+		ReadOnlySpan<char> rest = dynamic;
+		while (!rest.IsEmpty) {
+			int iOpen = rest.IndexOf('{');
+			if (iOpen < 0) break;
+
+			int iClose = rest[(iOpen + 1)..].IndexOfAny('{', '}');
+			if (iClose < 0) break;
+			iClose += iOpen + 1;
+
+			sb.Append(rest[..iOpen]);
+			if (rest[iClose] == '}' && lookup.TryGetValue(rest[(iOpen + 1)..iClose], out object? value)) {
+				sb.Append(value.ToString());
+				rest = rest[(iClose + 1)..];
+			} else {
+				// Not a known placeholder; keep the brace and resume right after it
+				sb.Append('{');
+				rest = rest[(iOpen + 1)..];
+			}
 		}
+		sb.Append(rest);
+
+		return sb.ToString();
+	}
+
+	private static (string prefix, string dynamic) SplitDynamic(string template) {
+		int iSentinel = template.IndexOf(DYNAMIC_SENTINEL, StringComparison.Ordinal);
+		if (iSentinel < 0) return ("", template);
+
+		int iSuffix = iSentinel + DYNAMIC_SENTINEL.Length;
+		if (iSuffix < template.Length && template[iSuffix] == '\r') iSuffix++;
+		if (iSuffix < template.Length && template[iSuffix] == '\n') iSuffix++;
 
-		return result;
+		return (template[..iSentinel], template[iSuffix..]);
 	}
 
 	public static async Task<string> BuildCustomPromptAsync(string promptName, CodeSymbol symbol, OptimizationContext context, string sourceCode) {
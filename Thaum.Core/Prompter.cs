@@ -60,13 +60,9 @@ public class Prompter {
 		// Get model from configuration
 		string model = GLB.DefaultModel;
 
-		// Setup services
-		HttpClient httpClient  = new();
-		HttpLLM    llmProvider = new HttpLLM(httpClient, GLB.AppConfig);
-
 		// Stream response (also capture for artifact persistence)
 		StringBuilder            sb             = new StringBuilder();
-		IAsyncEnumerable<string> streamResponse = await llmProvider.StreamCompleteAsync(prompt, GLB.CompressionOptions(model));
+		IAsyncEnumerable<string> streamResponse = await _llm.StreamCompleteAsync(prompt, GLB.CompressionOptions(model));
 		await foreach (string token in streamResponse) {
 			Write(token);
 			sb.Append(token);
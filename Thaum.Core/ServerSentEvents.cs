@@ -0,0 +1,79 @@
+using System.Buffers;
+using System.Runtime.CompilerServices;
+
+namespace Thaum.Core;
+
+/// <summary>
+/// Incremental line splitter over raw response bytes where a single pooled buffer is refilled
+/// from the network and lines are yielded as slices of it without decoding to strings where
+/// SSE data payloads and NDJSON lines both feed straight into UTF-8 JSON deserialization where
+/// a yielded slice is only valid until the consumer asks for the next one
+/// </summary>
+internal static class ServerSentEvents {
+	private const int INITIAL_BUFFER_SIZE = 16 * 1024;
+
+	private static ReadOnlySpan<byte> DataPrefix => "data:"u8;
+	private static ReadOnlySpan<byte> DoneMarker => "[DONE]"u8;
+
+	/// <summary>
+	/// Yields the payload of every SSE data: line and stops at the OpenAI-style [DONE] marker
+	/// where event:, id: and comment lines are skipped since no provider here needs them
+	/// </summary>
+	public static async IAsyncEnumerable<ReadOnlyMemory<byte>> ReadDataAsync(Stream stream, [EnumeratorCancellation] CancellationToken cancellationToken = default) {
+		await foreach (ReadOnlyMemory<byte> line in ReadLinesAsync(stream, cancellationToken)) {
+			if (!line.Span.StartsWith(DataPrefix)) continue;
+
+			ReadOnlyMemory<byte> payload = line[DataPrefix.Length..];
+			if (!payload.IsEmpty && payload.Span[0] == (byte)' ') payload = payload[1..];
+			if (payload.Span.SequenceEqual(DoneMarker)) yield break;
+
+			yield return payload;
+		}
+	}
+
+	/// <summary>
+	/// Yields each non-empty line with its \n or \r\n terminator removed where the buffer only
+	/// grows when a single line outlives it and is returned to the pool when enumeration ends
+	/// </summary>
+	public static async IAsyncEnumerable<ReadOnlyMemory<byte>> ReadLinesAsync(Stream stream, [EnumeratorCancellation] CancellationToken cancellationToken = default) {
+		byte[] buffer = ArrayPool<byte>.Shared.Rent(INITIAL_BUFFER_SIZE);
+		int    start  = 0;
+		int    end    = 0;
+		try {
+			while (true) {
+				int iNewline = buffer.AsSpan(start, end - start).IndexOf((byte)'\n');
+				if (iNewline >= 0) {
+					int lineEnd = start + iNewline;
+					int length  = lineEnd > start && buffer[lineEnd - 1] == (byte)'\r' ? iNewline - 1 : iNewline;
+					int lineAt  = start;
+					start = lineEnd + 1;
+
+					if (length > 0) yield return buffer.AsMemory(lineAt, length);
+					continue;
+				}
+
+				// No complete line buffered: slide the partial line to the front, grow if it fills the buffer
+				if (start > 0) {
+					Buffer.BlockCopy(buffer, start, buffer, 0, end - start);
+					end   -= start;
+					start =  0;
+				}
+				if (end == buffer.Length) {
+					byte[] larger = ArrayPool<byte>.Shared.Rent(buffer.Length * 2);
+					Buffer.BlockCopy(buffer, 0, larger, 0, end);
+					ArrayPool<byte>.Shared.Return(buffer);
+					buffer = larger;
+				}
+
+				int read = await stream.ReadAsync(buffer.AsMemory(end), cancellationToken);
+				if (read == 0) {
+					if (end > start) yield return buffer.AsMemory(start, end - start);
+					yield break;
+				}
+				end += read;
+			}
+		} finally {
+			ArrayPool<byte>.Shared.Return(buffer);
+		}
+	}
+}
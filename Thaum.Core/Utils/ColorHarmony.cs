@@ -8,69 +8,74 @@ public class ColorHarmony {
 	private readonly (float h, float s, float l) _baseHsl;
 	private readonly bool                        _isDarkBackground;
 
+	// Derived from the background hue which never changes after construction
+	private readonly float _greenHue;
+	private readonly float _orangeHue;
+	private readonly float _complementaryHue;
+	private readonly float _analogousHue;
+
 	public ColorHarmony((int r, int g, int b) backgroundColor) {
 		_baseColor        = backgroundColor;
 		_baseHsl          = RgbToHsl(backgroundColor);
 		_isDarkBackground = IsColorDark(backgroundColor);
+
+		_greenHue         = ComputeOptimalGreenHue(_baseHsl.h);
+		_orangeHue        = ComputeOptimalOrangeHue(_baseHsl.h);
+		_complementaryHue = (_baseHsl.h + 180) % 360;
+		_analogousHue     = ComputeAnalogousHue(_baseHsl.h);
 	}
 
 	/// <summary>
 	/// Generate green that harmonizes with background for classes
 	/// </summary>
 	public (int r, int g, int b) GenerateGreen() {
-		// Find the perceptually optimal green hue for this background
-		float optimalGreenHue = ComputeOptimalGreenHue();
-
 		// Much more subtle for better readability - like 15% opacity
 		float saturation = _isDarkBackground ? 0.4f : 0.6f;  // Lower saturation on dark
 		float lightness  = _isDarkBackground ? 0.25f : 0.7f; // Much darker on dark bg, lighter on light bg
 
-		return HslToRgb((optimalGreenHue, saturation, lightness));
+		return HslToRgb((_greenHue, saturation, lightness));
 	}
 
 	/// <summary>
 	/// Generate burnt orange/sienna that harmonizes with background for functions
 	/// </summary>
 	public (int r, int g, int b) GenerateBurntOrange() {
-		// Find the perceptually optimal orange hue for this background
-		float optimalOrangeHue = ComputeOptimalOrangeHue();
-
 		// Much more subtle for better readability - like 15% opacity
 		float saturation = _isDarkBackground ? 0.45f : 0.65f; // Lower saturation on dark
 		float lightness  = _isDarkBackground ? 0.3f : 0.65f;  // Much darker on dark bg, lighter on light bg
 
-		return HslToRgb((optimalOrangeHue, saturation, lightness));
+		return HslToRgb((_orangeHue, saturation, lightness));
 	}
 
 	/// <summary>
 	/// Generate complementary colors
 	/// </summary>
 	public (int r, int g, int b) GenerateComplementary(float saturationTarget) {
-		float complementaryHue = (_baseHsl.h + 180) % 360;
-		float saturation       = saturationTarget;
-		float lightness        = _isDarkBackground ? 0.65f : 0.35f;
+		float saturation = saturationTarget;
+		float lightness  = _isDarkBackground ? 0.65f : 0.35f;
 
-		return HslToRgb((complementaryHue, Math.Clamp(saturation, 0.3f, 0.8f), lightness));
+		return HslToRgb((_complementaryHue, Math.Clamp(saturation, 0.3f, 0.8f), lightness));
 	}
 
 	/// <summary>
 	/// Generate analogous colors
 	/// </summary>
 	public (int r, int g, int b) GenerateAnalogous(float saturationTarget) {
-		float analogousOffset      = 30f; // 30° offset
-		float finalHue             = (_baseHsl.h + analogousOffset) % 360;
-		if (finalHue < 0) finalHue += 360;
-
 		float saturation = saturationTarget;
 		float lightness  = _isDarkBackground ? 0.7f : 0.3f;
 
-		return HslToRgb((finalHue, saturation, lightness));
+		return HslToRgb((_analogousHue, saturation, lightness));
 	}
 
-	private float ComputeOptimalGreenHue() {
-		// Compute the green hue that provides optimal contrast with background
-		float bgHue = _baseHsl.h;
+	private static float ComputeAnalogousHue(float bgHue) {
+		float analogousOffset = 30f; // 30° offset
+		float finalHue        = (bgHue + analogousOffset) % 360;
+		if (finalHue < 0) finalHue += 360;
+		return finalHue;
+	}
 
+	private static float ComputeOptimalGreenHue(float bgHue) {
+		// Compute the green hue that provides optimal contrast with background
 		// Adjust green based on background color temperature
 		return bgHue switch {
 			>= 0 and <= 60    => 140, // Red/orange bg -> blue-green
@@ -82,10 +87,8 @@ public class ColorHarmony {
 		};
 	}
 
-	private float ComputeOptimalOrangeHue() {
+	private static float ComputeOptimalOrangeHue(float bgHue) {
 		// Compute the burnt orange/sienna hue that provides optimal contrast
-		float bgHue = _baseHsl.h;
-
 		// Adjust orange based on background, trending toward sienna/burnt orange
 		return bgHue switch {
 			>= 0 and <= 60    => 25, // Red bg -> burnt orange (slightly different hue)
@@ -97,9 +100,12 @@ public class ColorHarmony {
 		};
 	}
 
-	private static bool IsColorDark((int r, int g, int b) color) {
-		double luminance = 0.2126 * color.r + 0.7152 * color.g + 0.0722 * color.b;
-		return luminance < 128;
+	/// <summary>
+	/// Dark when BT.709 relative luminance falls below mid-grey where the weights are scaled by 256
+	/// to integers (54/183/19) so the test is three integer multiplies against 128 * 256
+	/// </summary>
+	internal static bool IsColorDark((int r, int g, int b) color) {
+		return color.r * 54 + color.g * 183 + color.b * 19 < 32768;
 	}
 
 	// Color space conversion utilities
@@ -128,21 +134,24 @@ public class ColorHarmony {
 	}
 
 	private static (int r, int g, int b) HslToRgb((float h, float s, float l) hsl) {
-		float c = (1 - Math.Abs(2 * hsl.l - 1)) * hsl.s;
-		float x = c * (1 - Math.Abs((hsl.h / 60) % 2 - 1));
-		float m = hsl.l - c / 2;
-
-		(float r, float g, float b) = (hsl.h / 60) switch {
-			>= 0 and < 1 => (c, x, 0f),
-			>= 1 and < 2 => (x, c, 0f),
-			>= 2 and < 3 => (0f, c, x),
-			>= 3 and < 4 => (0f, x, c),
-			>= 4 and < 5 => (x, 0f, c),
-			_            => (c, 0f, x)
+		float sectorf = hsl.h / 60;
+		float c       = (1 - MathF.Abs(2 * hsl.l - 1)) * hsl.s;
+		float x       = c * (1 - MathF.Abs(sectorf % 2 - 1));
+		float m       = hsl.l - c / 2;
+
+		// Hue sector resolved once to an integer so the permutation is a jump table rather than
+		// a ladder of paired float range compares where everything stays in single precision
+		(float r, float g, float b) = (int)MathF.Floor(sectorf) switch {
+			0 => (c, x, 0f),
+			1 => (x, c, 0f),
+			2 => (0f, c, x),
+			3 => (0f, x, c),
+			4 => (x, 0f, c),
+			_ => (c, 0f, x)
 		};
 
-		return ((int)Math.Round((r + m) * 255),
-			(int)Math.Round((g + m) * 255),
-			(int)Math.Round((b + m) * 255));
+		return ((int)MathF.Round((r + m) * 255),
+			(int)MathF.Round((g + m) * 255),
+			(int)MathF.Round((b + m) * 255));
 	}
 }
\ No newline at end of file
@@ -9,18 +9,32 @@ public record TerminalColorInfo((int r, int g, int b) BackgroundColor, bool IsDa
 /// optimized for any terminal background using color science principles
 /// </summary>
 public class PerceptualColorer {
-	private readonly TerminalColorInfo _terminalInfo;
-	private readonly ColorHarmony      _harmony;
+	private readonly TerminalColorInfo       _terminalInfo;
+	private readonly ColorHarmony            _harmony;
+	private readonly (int r, int g, int b)[] _semanticColors;
 
 	public PerceptualColorer() {
 		_terminalInfo = DetectTerminalColors();
 		_harmony      = new ColorHarmony(_terminalInfo.BackgroundColor);
+
+		// The color depends only on the type and the fixed background so each is computed once here
+		SemanticColorType[] types = Enum.GetValues<SemanticColorType>();
+		_semanticColors = new (int r, int g, int b)[types.Length];
+		foreach (SemanticColorType type in types) {
+			_semanticColors[(int)type] = ComputeSemanticColor(type);
+		}
 	}
 
 	/// <summary>
 	/// Generate a perceptually optimal color for the given semantic purpose
 	/// </summary>
 	public (int r, int g, int b) GenerateSemanticColor(string seed, SemanticColorType colorType) {
+		return (uint)colorType < (uint)_semanticColors.Length
+			? _semanticColors[(int)colorType]
+			: ComputeSemanticColor(colorType);
+	}
+
+	private (int r, int g, int b) ComputeSemanticColor(SemanticColorType colorType) {
 		return colorType switch {
 			SemanticColorType.Function  => _harmony.GenerateBurntOrange(),
 			SemanticColorType.Class     => _harmony.GenerateGreen(),
@@ -34,19 +48,27 @@ public class PerceptualColorer {
 		// Try to detect terminal background via OSC sequences
 		(int r, int g, int b)? bgColor = TryDetectBackgroundColor();
 
-		if (bgColor.HasValue) {
-			System.Diagnostics.Debug.WriteLine($"Detected background color: RGB({bgColor.Value.r}, {bgColor.Value.g}, {bgColor.Value.b})");
-		} else {
-			bgColor = EstimateFromEnvironment();
-			System.Diagnostics.Debug.WriteLine($"Using estimated background color: RGB({bgColor.Value.r}, {bgColor.Value.g}, {bgColor.Value.b})");
+		if (!bgColor.HasValue) {
+			TerminalColorInfo estimate = s_environmentEstimate.Value;
+			System.Diagnostics.Debug.WriteLine($"Using estimated background color: RGB({estimate.BackgroundColor.r}, {estimate.BackgroundColor.g}, {estimate.BackgroundColor.b})");
+			return estimate;
 		}
 
-		bool isDark = IsColorDark(bgColor.Value);
+		System.Diagnostics.Debug.WriteLine($"Detected background color: RGB({bgColor.Value.r}, {bgColor.Value.g}, {bgColor.Value.b})");
+
+		bool isDark = ColorHarmony.IsColorDark(bgColor.Value);
 		System.Diagnostics.Debug.WriteLine($"Background is {(isDark ? "dark" : "light")}");
 
 		return new TerminalColorInfo(bgColor.Value, isDark);
 	}
 
+	// Environment variables are fixed for the process lifetime so the estimate and its darkness are
+	// derived once on first use and shared by every colorer
+	private static readonly Lazy<TerminalColorInfo> s_environmentEstimate = new Lazy<TerminalColorInfo>(() => {
+		(int r, int g, int b) bgColor = EstimateFromEnvironment();
+		return new TerminalColorInfo(bgColor, ColorHarmony.IsColorDark(bgColor));
+	});
+
 	private (int r, int g, int b)? TryDetectBackgroundColor() {
 		try {
 			// Save current console state
@@ -154,7 +176,7 @@ public class PerceptualColorer {
 		return null;
 	}
 
-	private (int r, int g, int b) EstimateFromEnvironment() {
+	private static (int r, int g, int b) EstimateFromEnvironment() {
 		string term             = Environment.GetEnvironmentVariable("TERM")?.ToLowerInvariant() ?? "";
 		string colorterm        = Environment.GetEnvironmentVariable("COLORTERM")?.ToLowerInvariant() ?? "";
 		string termProgram      = Environment.GetEnvironmentVariable("TERM_PROGRAM")?.ToLowerInvariant() ?? "";
@@ -200,16 +222,10 @@ public class PerceptualColorer {
 		return (29, 32, 33); // Alacritty default dark
 	}
 
-	private (int r, int g, int b) DetectUrxvtTheme() {
+	private static (int r, int g, int b) DetectUrxvtTheme() {
 		// Check X resources or common urxvt themes
 		return (0, 0, 0); // urxvt typically dark
 	}
-
-	private static bool IsColorDark((int r, int g, int b) color) {
-		// Using relative luminance formula (ITU-R BT.709)
-		double luminance = 0.2126 * color.r + 0.7152 * color.g + 0.0722 * color.b;
-		return luminance < 128;
-	}
 }
 
 public enum SemanticColorType {
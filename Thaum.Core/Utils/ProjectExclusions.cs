@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Text.RegularExpressions;
 
 namespace Thaum.Core.Utils;
@@ -60,43 +61,82 @@ public static class ProjectExclusions {
 	/// Checks if a file or directory should be excluded based on .gitignore and project patterns
 	/// </summary>
 	public static bool ShouldExclude(string filePath, string projectRoot, string? language = null) {
-		string relativePath = Path.GetRelativePath(projectRoot, filePath);
+		return For(projectRoot).ShouldExclude(filePath, language);
+	}
 
-		// Normalize path separators for consistent matching
-		relativePath = relativePath.Replace('\\', '/');
+	/// <summary>
+	/// Resolves the exclusion rules of one project root where .gitignore is checked and parsed once
+	/// so a crawl testing every walked directory and file reuses the same patterns without a stat
+	/// per path where edits to .gitignore are picked up by the next crawl
+	/// </summary>
+	public static Rules For(string projectRoot) => new Rules(projectRoot, LoadGitignorePatterns(projectRoot));
 
-		// Check universal exclusions
-		if (IsExcludedByPatterns(relativePath, UniversalExclusions)) {
-			return true;
+	public sealed class Rules {
+		private readonly string                 _projectRoot;
+		private readonly List<GitignorePattern> _gitignorePatterns;
+
+		internal Rules(string projectRoot, List<GitignorePattern> gitignorePatterns) {
+			_projectRoot       = projectRoot;
+			_gitignorePatterns = gitignorePatterns;
 		}
 
-		// Check project-specific exclusions
-		if (language != null && DefaultExclusions.TryGetValue(language, out string[]? patterns)) {
-			if (IsExcludedByPatterns(relativePath, patterns)) {
+		public bool ShouldExclude(string filePath, string? language = null) {
+			string relativePath = Path.GetRelativePath(_projectRoot, filePath);
+
+			// Normalize path separators for consistent matching
+			relativePath = relativePath.Replace('\\', '/');
+
+			// Check universal exclusions
+			if (IsExcludedByPatterns(relativePath, UniversalExclusions)) {
 				return true;
 			}
-		}
 
-		// Check .gitignore patterns
-		List<GitignorePattern> gitignorePatterns = LoadGitignorePatterns(projectRoot);
-		if (IsExcludedByGitignorePatterns(relativePath, gitignorePatterns)) {
-			return true;
-		}
+			// Check project-specific exclusions
+			if (language != null && DefaultExclusions.TryGetValue(language, out string[]? patterns)) {
+				if (IsExcludedByPatterns(relativePath, patterns)) {
+					return true;
+				}
+			}
 
-		return false;
+			// Check .gitignore patterns
+			if (IsExcludedByGitignorePatterns(relativePath, _gitignorePatterns)) {
+				return true;
+			}
+
+			return false;
+		}
 	}
 
+	// Parsed .gitignore per project root where the file is only re-read and re-parsed when its
+	// last write time changes
+	private static readonly ConcurrentDictionary<string, (DateTime mtime, List<GitignorePattern> patterns)> s_gitignoreCache = new();
+
+	private static readonly List<GitignorePattern> NoPatterns = [];
+
 	/// <summary>
 	/// Loads and parses .gitignore patterns from the project root
 	/// </summary>
 	private static List<GitignorePattern> LoadGitignorePatterns(string projectRoot) {
-		List<GitignorePattern> patterns      = new List<GitignorePattern>();
-		string                 gitignorePath = Path.Combine(projectRoot, ".gitignore");
+		string   gitignorePath = Path.Combine(projectRoot, ".gitignore");
+		FileInfo info          = new FileInfo(gitignorePath);
 
-		if (!File.Exists(gitignorePath)) {
-			return patterns;
+		if (!info.Exists) {
+			return NoPatterns;
 		}
 
+		DateTime mtime = info.LastWriteTimeUtc;
+		if (s_gitignoreCache.TryGetValue(projectRoot, out (DateTime mtime, List<GitignorePattern> patterns) cached) && cached.mtime == mtime) {
+			return cached.patterns;
+		}
+
+		List<GitignorePattern> patterns = ParseGitignore(gitignorePath);
+		s_gitignoreCache[projectRoot] = (mtime, patterns);
+		return patterns;
+	}
+
+	private static List<GitignorePattern> ParseGitignore(string gitignorePath) {
+		List<GitignorePattern> patterns = new List<GitignorePattern>();
+
 		foreach (string line in File.ReadAllLines(gitignorePath)) {
 			string trimmed = line.Trim();
 
@@ -205,5 +245,5 @@ public static class ProjectExclusions {
 	/// <summary>
 	/// Represents a parsed gitignore pattern
 	/// </summary>
-	private record GitignorePattern(string Regex, bool IsNegation, bool IsDirectory);
+	internal record GitignorePattern(string Regex, bool IsNegation, bool IsDirectory);
 }
\ No newline at end of file
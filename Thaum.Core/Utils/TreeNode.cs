@@ -1,52 +1,99 @@
+using System.Runtime.InteropServices;
 using Spectre.Console;
 using Thaum.Core.Crawling;
 using static Thaum.Core.Utils.Tracer;
 
 namespace Thaum.Core.Utils;
 
-public class TreeNode {
-	public string         Name     { get; }
-	public SymbolKind     Kind     { get; }
-	public CodeSymbol?    Symbol   { get; }
-	public List<TreeNode> Children { get; } = new();
+public sealed class TreeNode {
+	// Icon table indexed by SymbolKind ordinal where order must mirror the enum declaration
+	private static readonly string[] SymbolIcons = [
+		"ƒ",   // Function
+		"ƒ",   // Method
+		"?",   // Constructor
+		"C",   // Class
+		"I",   // Interface
+		"?",   // Enum
+		"?",   // EnumMember
+		"DIR", // Module
+		"N",   // Namespace
+		"P",   // Property
+		"F",   // Field
+		"V",   // Variable
+		"p"    // Parameter
+	];
+
+	// Tree drawing fragments where connectors precede an entry and pads extend the prefix for its
+	// children where the Last variants close a branch so nothing continues beneath it
+	public const string ConnectorMid  = "├── ";
+	public const string ConnectorLast = "└── ";
+	public const string PadMid        = "│   ";
+	public const string PadLast       = "    ";
+
+	public static string Connector(bool isLast) => isLast ? ConnectorLast : ConnectorMid;
+	public static string Pad(bool isLast)       => isLast ? PadLast : PadMid;
+
+	// Shared fallback so nodes built without an explicit colorer don't each re-probe the terminal
+	private static PerceptualColorer? _defaultColorer;
+
+	public string      Name   { get; }
+	public SymbolKind  Kind   { get; }
+	public CodeSymbol? Symbol { get; }
+
+	// File nodes keep their raw symbols and only build child nodes when first asked where a
+	// shallow --depth never materializes them and DisplayHierarchy drops them once printed
+	public List<TreeNode> Children => _children ??= BuildPendingChildren();
 
 	private readonly PerceptualColorer _colorer;
+	private          List<TreeNode>?   _children;
+	private          List<CodeSymbol>? _pendingSymbols;
 
 	public TreeNode(string name, SymbolKind kind, CodeSymbol? symbol, PerceptualColorer? colorEngine = null) {
 		Name     = name;
 		Kind     = kind;
 		Symbol   = symbol;
-		_colorer = colorEngine ?? new PerceptualColorer();
+		_colorer = colorEngine ?? (_defaultColorer ??= new PerceptualColorer());
 	}
 
 	public static List<TreeNode> BuildHierarchy(List<CodeSymbol> symbols, PerceptualColorer colorer) {
-		List<TreeNode>                             nodes         = new List<TreeNode>();
-		IEnumerable<IGrouping<string, CodeSymbol>> symbolsByFile = symbols.GroupBy(s => s.FilePath);
+		// Bucket symbols by file with a single hash op per symbol; file nodes are only built for non-empty buckets
+		Dictionary<string, List<CodeSymbol>> symbolsByFile = new Dictionary<string, List<CodeSymbol>>();
+		foreach (CodeSymbol symbol in symbols) {
+			// Include all meaningful symbol types (for both code and assembly inspection)
+			if (symbol.Kind is not (SymbolKind.Class or SymbolKind.Interface or SymbolKind.Enum or SymbolKind.EnumMember or SymbolKind.Namespace or SymbolKind.Function or SymbolKind.Method or SymbolKind.Constructor or SymbolKind.Property or SymbolKind.Field))
+				continue;
 
-		foreach (IGrouping<string, CodeSymbol> fileGroup in symbolsByFile) {
-			string   relativePath = Path.GetRelativePath(Directory.GetCurrentDirectory(), fileGroup.Key);
-			TreeNode fileNode     = new TreeNode(relativePath, SymbolKind.Module, null, colorer);
+			ref List<CodeSymbol>? bucket = ref CollectionsMarshal.GetValueRefOrAddDefault(symbolsByFile, symbol.FilePath, out _);
+			(bucket ??= []).Add(symbol);
+		}
 
-			// Include all meaningful symbol types (for both code and assembly inspection)
-			List<CodeSymbol> filteredSymbols = fileGroup.Where(s =>
-				s.Kind is SymbolKind.Class or SymbolKind.Interface or SymbolKind.Enum or SymbolKind.EnumMember or SymbolKind.Namespace or SymbolKind.Function or SymbolKind.Method or SymbolKind.Constructor or SymbolKind.Property or SymbolKind.Field).ToList();
+		string         cwd   = Directory.GetCurrentDirectory();
+		List<TreeNode> nodes = new List<TreeNode>(symbolsByFile.Count);
 
-			if (filteredSymbols.Any()) {
-				foreach (CodeSymbol symbol in filteredSymbols.OrderBy(s => s.StartCodeLoc.Line)) {
-					TreeNode symbolNode = new TreeNode(symbol.Name, symbol.Kind, symbol, colorer);
-					fileNode.Children.Add(symbolNode);
+		foreach ((string filePath, List<CodeSymbol> fileSymbols) in symbolsByFile) {
+			nodes.Add(new TreeNode(Path.GetRelativePath(cwd, filePath), SymbolKind.Module, null, colorer) {
+				_pendingSymbols = fileSymbols
+			});
+		}
+
+		return nodes.OrderBy(n => n.Name).ToList();
+	}
 
-					// Add nested symbols if any (only classes and functions)
-					if (symbol.Children?.Any() == true) {
-						AddChildSymbols(symbolNode, symbol.Children, colorer);
-					}
-				}
+	private List<TreeNode> BuildPendingChildren() {
+		List<TreeNode> children = new List<TreeNode>(_pendingSymbols?.Count ?? 0);
+		if (_pendingSymbols == null) return children;
 
-				nodes.Add(fileNode);
+		foreach (CodeSymbol symbol in _pendingSymbols.OrderBy(s => s.StartCodeLoc.Line)) {
+			TreeNode symbolNode = new TreeNode(symbol.Name, symbol.Kind, symbol, _colorer);
+			children.Add(symbolNode);
+
+			// Add nested symbols if any (only classes and functions)
+			if (symbol.Children?.Any() == true) {
+				AddChildSymbols(symbolNode, symbol.Children, _colorer);
 			}
 		}
 
-		return nodes.OrderBy(n => n.Name).ToList();
+		return children;
 	}
 
 	private static void AddChildSymbols(TreeNode parent, List<CodeSymbol> children, PerceptualColorer colorer) {
@@ -67,26 +114,27 @@ public class TreeNode {
 	public static void DisplayHierarchy(List<TreeNode> nodes, int maxDepth) {
 		foreach (TreeNode node in nodes) {
 			node.DisplayNodeGrouped("", true, maxDepth, 0);
+
+			// Release the file's symbol nodes once printed where the raw symbols can rebuild them
+			if (node._pendingSymbols != null) node._children = null;
 		}
 	}
 
 	private void DisplayNodeGrouped(string prefix, bool isLast, int maxDepth, int depth) {
 		if (depth >= maxDepth) return;
 
-		string connector = isLast ? "└── " : "├── ";
-		string symbol    = GetSymbolIcon(Kind);
+		println($"{prefix}{Connector(isLast)}{GetSymbolIcon(Kind)} {Name}");
 
-		println($"{prefix}{connector}{symbol} {Name}");
-
-		if (Children.Any()) {
-			string newPrefix = prefix + (isLast ? "    " : "│   ");
+		// Children below the depth limit would never print so don't force them into existence
+		if (depth + 1 < maxDepth && Children.Count > 0) {
+			string newPrefix = prefix + Pad(isLast);
 
 			// Group children by type
 			List<IGrouping<SymbolKind, TreeNode>> groupedChildren = Children.GroupBy(c => c.Kind).ToList();
 
-			foreach (IGrouping<SymbolKind, TreeNode> group in groupedChildren) {
-				bool isLastGroup = group == groupedChildren.Last();
-				DisplaySymbolGroup(group.Key, group.ToList(), newPrefix, isLastGroup, maxDepth, depth + 1);
+			for (int i = 0; i < groupedChildren.Count; i++) {
+				IGrouping<SymbolKind, TreeNode> group = groupedChildren[i];
+				DisplaySymbolGroup(group.Key, group.ToList(), newPrefix, i == groupedChildren.Count - 1, maxDepth, depth + 1);
 			}
 		}
 	}
@@ -94,7 +142,7 @@ public class TreeNode {
 	private void DisplaySymbolGroup(SymbolKind kind, List<TreeNode> symbols, string prefix, bool isLast, int maxDepth, int depth, bool noColors = false) {
 		if (depth >= maxDepth || !symbols.Any()) return;
 
-		string connector = isLast ? "└── " : "├── ";
+		string connector = Connector(isLast);
 		string icon      = GetSymbolIcon(kind);
 		string kindName  = GetKindDisplayName(kind);
 
@@ -157,19 +205,8 @@ public class TreeNode {
 	}
 
 	private static string GetSymbolIcon(SymbolKind kind) {
-		return kind switch {
-			SymbolKind.Function  => "ƒ",
-			SymbolKind.Method    => "ƒ",
-			SymbolKind.Class     => "C",
-			SymbolKind.Interface => "I",
-			SymbolKind.Module    => "DIR",
-			SymbolKind.Namespace => "N",
-			SymbolKind.Property  => "P",
-			SymbolKind.Field     => "F",
-			SymbolKind.Variable  => "V",
-			SymbolKind.Parameter => "p",
-			_                    => "?"
-		};
+		int i = (int)kind;
+		return (uint)i < (uint)SymbolIcons.Length ? SymbolIcons[i] : "?";
 	}
 
 	private static string GetKindDisplayName(SymbolKind kind) {
@@ -0,0 +1,83 @@
+using Xunit;
+using FluentAssertions;
+using Thaum.Core.Cache;
+
+namespace Thaum.Tests;
+
+public class CacheTests : IDisposable {
+	private readonly string _dir = Path.Combine(Path.GetTempPath(), $"thaum-cache-tests-{Guid.NewGuid():N}");
+	private readonly Cache  _cache;
+
+	public CacheTests() {
+		_cache = new Cache(Path.Combine(_dir, "cache.db"));
+	}
+
+	public void Dispose() {
+		_cache.Dispose();
+		Microsoft.Data.Sqlite.SqliteConnection.ClearAllPools();
+		Directory.Delete(_dir, recursive: true);
+	}
+
+	[Fact]
+	public async Task ClearAsync_ThenSetAndGet_ShouldRoundTrip() {
+		// Arrange
+		await _cache.SetAsync("optimization_before", "old", modelName: "model", providerName: "provider");
+
+		// Act
+		await _cache.ClearAsync();
+		await _cache.SetAsync("optimization_after", "new", promptName: "compress", promptContent: "prompt text", modelName: "model", providerName: "provider");
+
+		// Assert
+		(await _cache.GetAsync<string>("optimization_before")).Should().BeNull();
+		(await _cache.GetAsync<string>("optimization_after")).Should().Be("new");
+		(await _cache.GetSizeAsync()).Should().Be(1);
+	}
+
+	[Fact]
+	public async Task InvalidatePatternAsync_ShouldRemoveMatchingKeysFromBothTiers() {
+		// Arrange
+		await _cache.SetAsync("optimization_Foo_/src/a.cs_1_1", "foo");
+		await _cache.SetAsync("optimization_Bar_/src/b.cs_2_1", "bar");
+		await _cache.SetAsync("optimizationXFoo", "literal underscore must not match");
+		await _cache.SetAsync("key_L1_abc", "key");
+
+		// Act
+		await _cache.InvalidatePatternAsync("OPTIMIZATION_*");
+
+		// Assert
+		(await _cache.GetAsync<string>("optimization_Foo_/src/a.cs_1_1")).Should().BeNull();
+		(await _cache.GetAsync<string>("optimization_Bar_/src/b.cs_2_1")).Should().BeNull();
+		(await _cache.GetAsync<string>("optimizationXFoo")).Should().Be("literal underscore must not match");
+		(await _cache.GetAsync<string>("key_L1_abc")).Should().Be("key");
+		(await _cache.GetSizeAsync()).Should().Be(2);
+	}
+
+	[Fact]
+	public async Task InvalidatePatternAsync_WindowsPath_ShouldEvictHotAndStoredEntries() {
+		// Arrange: the Get primes the hot tier so a miss afterwards proves both tiers were cleared
+		const string KEY = @"optimization_Foo_C:\src\a.cs_1_1";
+		await _cache.SetAsync(KEY, "foo");
+		(await _cache.GetAsync<string>(KEY)).Should().Be("foo");
+
+		// Act
+		await _cache.InvalidatePatternAsync(@"*C:\src\a.cs*");
+
+		// Assert
+		(await _cache.GetAsync<string>(KEY)).Should().BeNull();
+		(await _cache.GetSizeAsync()).Should().Be(0);
+	}
+
+	[Fact]
+	public async Task ClearAsync_ShouldEmptyCacheIncludingHotTier() {
+		// Arrange
+		await _cache.SetAsync("optimization_Foo", "foo");
+		(await _cache.GetAsync<string>("optimization_Foo")).Should().Be("foo");
+
+		// Act
+		await _cache.ClearAsync();
+
+		// Assert
+		(await _cache.GetAsync<string>("optimization_Foo")).Should().BeNull();
+		(await _cache.GetSizeAsync()).Should().Be(0);
+	}
+}
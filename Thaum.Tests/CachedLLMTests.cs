@@ -0,0 +1,105 @@
+using Xunit;
+using FluentAssertions;
+using Thaum.Core;
+using Thaum.Core.Cache;
+
+namespace Thaum.Tests;
+
+public class CachedLLMTests : IDisposable {
+	private readonly string _dir = Path.Combine(Path.GetTempPath(), $"thaum-llm-tests-{Guid.NewGuid():N}");
+	private readonly Cache  _cache;
+
+	public CachedLLMTests() {
+		_cache = new Cache(Path.Combine(_dir, "cache.db"));
+	}
+
+	public void Dispose() {
+		_cache.Dispose();
+		Microsoft.Data.Sqlite.SqliteConnection.ClearAllPools();
+		Directory.Delete(_dir, recursive: true);
+	}
+
+	[Fact]
+	public async Task StreamCompleteAsync_RepeatedDeterministicRequest_ShouldHitCache() {
+		// Arrange: same call shape as compress-batch but pinned to temperature 0
+		CountingLLM inner   = new CountingLLM("topology", " morphism");
+		CachedLLM   llm     = new CachedLLM(inner, _cache, provider: "test");
+		LLMOptions  options = GLB.CompressionOptions("model") with { Temperature = 0 };
+
+		// Act
+		string first  = await Collect(await llm.StreamCompleteAsync("compress Foo", options));
+		string second = await Collect(await llm.StreamCompleteAsync("compress Foo", options));
+
+		// Assert
+		first.Should().Be("topology morphism");
+		second.Should().Be(first);
+		inner.Calls.Should().Be(1);
+	}
+
+	[Fact]
+	public async Task StreamCompleteAsync_CompressionTemperature_ShouldBypassCache() {
+		// Arrange: re-rolls and fusion rollouts resend the identical prompt and expect a fresh draw
+		CountingLLM inner = new CountingLLM("topology");
+		CachedLLM   llm   = new CachedLLM(inner, _cache, provider: "test");
+
+		// Act
+		await Collect(await llm.StreamCompleteAsync("compress Foo", GLB.CompressionOptions("model")));
+		await Collect(await llm.StreamCompleteAsync("compress Foo", GLB.CompressionOptions("model")));
+
+		// Assert
+		inner.Calls.Should().Be(2);
+		(await _cache.GetSizeAsync()).Should().Be(0);
+	}
+
+	[Fact]
+	public async Task CompleteAsync_DifferentTemperature_ShouldMissCache() {
+		// Arrange
+		CountingLLM inner = new CountingLLM("answer");
+		CachedLLM   llm   = new CachedLLM(inner, _cache, provider: "test");
+
+		// Act
+		await llm.CompleteAsync("prompt", new LLMOptions(Temperature: 0.0, Model: "model"));
+		await llm.CompleteAsync("prompt", new LLMOptions(Temperature: 0.0, Model: "model"));
+		await llm.CompleteAsync("prompt", new LLMOptions(Temperature: 0.1, Model: "model"));
+
+		// Assert
+		inner.Calls.Should().Be(2);
+	}
+
+	private static async Task<string> Collect(IAsyncEnumerable<string> stream) {
+		System.Text.StringBuilder sb = new System.Text.StringBuilder();
+		await foreach (string token in stream) sb.Append(token);
+		return sb.ToString();
+	}
+
+	private sealed class CountingLLM : LLM {
+		private readonly string[] _tokens;
+
+		public int Calls;
+
+		public CountingLLM(params string[] tokens) {
+			_tokens = tokens;
+		}
+
+		public override Task<string> CompleteAsync(string prompt, LLMOptions? options = null) {
+			Interlocked.Increment(ref Calls);
+			return Task.FromResult(string.Concat(_tokens));
+		}
+
+		public override Task<string> CompleteWithSystemAsync(string systemPrompt, string userPrompt, LLMOptions? options = null) {
+			return CompleteAsync(userPrompt, options);
+		}
+
+		public override Task<IAsyncEnumerable<string>> StreamCompleteAsync(string prompt, LLMOptions? options = null) {
+			Interlocked.Increment(ref Calls);
+			return Task.FromResult(Stream());
+		}
+
+		private async IAsyncEnumerable<string> Stream() {
+			foreach (string token in _tokens) {
+				await Task.Yield();
+				yield return token;
+			}
+		}
+	}
+}
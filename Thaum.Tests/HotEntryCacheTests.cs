@@ -0,0 +1,86 @@
+using Xunit;
+using FluentAssertions;
+using Thaum.Core.Cache;
+
+namespace Thaum.Tests;
+
+public class HotEntryCacheTests {
+	[Fact]
+	public void RemoveMatching_WildcardPattern_ShouldEvictOnlyMatchingKeys() {
+		// Arrange
+		HotEntryCache hot = new HotEntryCache(capacity: 8);
+		hot.Set("optimization_Foo_a.cs_1_1", "\"foo\"", null);
+		hot.Set("optimization_Bar_b.cs_2_1", "\"bar\"", null);
+		hot.Set("key_L1_abc", "\"key\"", null);
+
+		// Act
+		hot.RemoveMatching("OPTIMIZATION_Foo*");
+
+		// Assert
+		hot.TryGet("optimization_Foo_a.cs_1_1", 0, out _).Should().BeFalse();
+		hot.TryGet("optimization_Bar_b.cs_2_1", 0, out _).Should().BeTrue();
+		hot.TryGet("key_L1_abc", 0, out _).Should().BeTrue();
+	}
+
+	[Fact]
+	public void RemoveMatching_BackslashInPattern_ShouldMatchLiterally() {
+		// Arrange: Defragmentor builds optimization_{name}_{filePath}* from Windows paths
+		HotEntryCache hot = new HotEntryCache(capacity: 8);
+		hot.Set(@"optimization_Foo_C:\src\a.cs_1_1", "\"foo\"", null);
+		hot.Set(@"optimization_Foo_C:\src\b.cs_1_1", "\"bar\"", null);
+
+		// Act
+		hot.RemoveMatching(@"optimization_Foo_C:\src\a.cs*");
+
+		// Assert
+		hot.TryGet(@"optimization_Foo_C:\src\a.cs_1_1", 0, out _).Should().BeFalse();
+		hot.TryGet(@"optimization_Foo_C:\src\b.cs_1_1", 0, out _).Should().BeTrue();
+	}
+
+	[Fact]
+	public void Remove_And_Clear_ShouldInvalidateEntries() {
+		// Arrange
+		HotEntryCache hot = new HotEntryCache(capacity: 8);
+		hot.Set("a", "1", null);
+		hot.Set("b", "2", null);
+
+		// Act
+		hot.Remove("a");
+
+		// Assert
+		hot.TryGet("a", 0, out _).Should().BeFalse();
+		hot.TryGet("b", 0, out string json).Should().BeTrue();
+		json.Should().Be("2");
+
+		hot.Clear();
+		hot.TryGet("b", 0, out _).Should().BeFalse();
+	}
+
+	[Fact]
+	public void TryGet_ExpiredEntry_ShouldMiss() {
+		// Arrange
+		HotEntryCache hot = new HotEntryCache(capacity: 8);
+		hot.Set("ttl", "1", expiresAt: 100);
+
+		// Act & Assert
+		hot.TryGet("ttl", 99, out _).Should().BeTrue();
+		hot.TryGet("ttl", 100, out _).Should().BeFalse();
+	}
+
+	[Fact]
+	public void Set_PastCapacity_ShouldEvictLeastRecentlyUsed() {
+		// Arrange
+		HotEntryCache hot = new HotEntryCache(capacity: 2);
+		hot.Set("a", "1", null);
+		hot.Set("b", "2", null);
+		hot.TryGet("a", 0, out _);
+
+		// Act
+		hot.Set("c", "3", null);
+
+		// Assert
+		hot.TryGet("a", 0, out _).Should().BeTrue();
+		hot.TryGet("b", 0, out _).Should().BeFalse();
+		hot.TryGet("c", 0, out _).Should().BeTrue();
+	}
+}
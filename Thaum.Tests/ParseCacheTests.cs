@@ -0,0 +1,57 @@
+using System.Text;
+using Xunit;
+using FluentAssertions;
+using Thaum.Core.Crawling;
+
+namespace Thaum.Tests;
+
+public class ParseCacheTests : IDisposable {
+	private readonly string _dir = Path.Combine(Path.GetTempPath(), $"thaum-parse-tests-{Guid.NewGuid():N}");
+
+	public void Dispose() {
+		Microsoft.Data.Sqlite.SqliteConnection.ClearAllPools();
+		Directory.Delete(_dir, recursive: true);
+	}
+
+	private static List<CodeSymbol> Symbols(string path) => [
+		new CodeSymbol("Foo", SymbolKind.Class, path, new CodeLoc(1, 0), new CodeLoc(10, 1)),
+		new CodeSymbol("Bar", SymbolKind.Method, path, new CodeLoc(3, 4), new CodeLoc(5, 5))
+	];
+
+	[Fact]
+	public void SetFlushTryGet_SameHash_ShouldRoundTripAcrossReopen() {
+		// Arrange
+		string dbPath = Path.Combine(_dir, "parse.db");
+		byte[] hash   = ParseCache.Hash(Encoding.UTF8.GetBytes("class Foo { void Bar() {} }"));
+
+		using (ParseCache writer = ParseCache.TryOpen(dbPath)!) {
+			writer.Set("/src/foo.cs", hash, Symbols("/src/foo.cs"));
+			writer.Flush();
+		}
+
+		// Act
+		using ParseCache reader = ParseCache.TryOpen(dbPath)!;
+		bool             hit    = reader.TryGet("/src/foo.cs", hash, out List<CodeSymbol> symbols);
+
+		// Assert
+		hit.Should().BeTrue();
+		symbols.Should().BeEquivalentTo(Symbols("/src/foo.cs"));
+	}
+
+	[Fact]
+	public void TryGet_ChangedContent_ShouldMiss() {
+		// Arrange
+		using ParseCache cache = ParseCache.TryOpen(Path.Combine(_dir, "parse.db"))!;
+		byte[]           v1    = ParseCache.Hash(Encoding.UTF8.GetBytes("class Foo {}"));
+		byte[]           v2    = ParseCache.Hash(Encoding.UTF8.GetBytes("class Foo { int x; }"));
+		cache.Set("/src/foo.cs", v1, Symbols("/src/foo.cs"));
+		cache.Flush();
+
+		// Act
+		bool hit = cache.TryGet("/src/foo.cs", v2, out List<CodeSymbol> symbols);
+
+		// Assert
+		hit.Should().BeFalse();
+		symbols.Should().BeEmpty();
+	}
+}
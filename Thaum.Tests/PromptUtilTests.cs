@@ -0,0 +1,40 @@
+using Xunit;
+using FluentAssertions;
+using Thaum.Core;
+
+namespace Thaum.Tests;
+
+public class PromptUtilTests {
+	[Fact]
+	public void FormatPrompt_DynamicSentinel_ShouldKeepPrefixVerbatimAndRenderSuffix() {
+		// Arrange
+		string template = "You compress {language} code.\n" +
+		                  $"{PromptUtil.DYNAMIC_SENTINEL}\r\n" +
+		                  "Symbol: {symbolName}\nKeys: {unknown}";
+		Dictionary<string, object> env = new Dictionary<string, object> {
+			["language"]   = "csharp",
+			["symbolName"] = "Foo"
+		};
+
+		// Act
+		string result = PromptUtil.FormatPrompt(env, template);
+
+		// Assert
+		result.Should().Be("You compress {language} code.\nSymbol: Foo\nKeys: {unknown}");
+	}
+
+	[Fact]
+	public void FormatPrompt_NoSentinel_ShouldRenderWholeTemplateWithoutRescanningValues() {
+		// Arrange
+		Dictionary<string, object> env = new Dictionary<string, object> {
+			["name"]  = "{other}",
+			["other"] = "leaked"
+		};
+
+		// Act
+		string result = PromptUtil.FormatPrompt(env, "Hello {name} and {other}");
+
+		// Assert
+		result.Should().Be("Hello {other} and leaked");
+	}
+}
@@ -0,0 +1,58 @@
+using System.Text;
+using Xunit;
+using FluentAssertions;
+using Thaum.Core;
+
+namespace Thaum.Tests;
+
+public class ServerSentEventsTests {
+	private static async Task<List<string>> ReadData(Stream stream) {
+		List<string> payloads = [];
+		await foreach (ReadOnlyMemory<byte> payload in ServerSentEvents.ReadDataAsync(stream)) {
+			payloads.Add(Encoding.UTF8.GetString(payload.Span));
+		}
+		return payloads;
+	}
+
+	[Fact]
+	public async Task ReadDataAsync_MixedFraming_ShouldYieldDataPayloadsUntilDone() {
+		// Arrange
+		const string BODY = "event: message\r\n" +
+		                    "data: {\"a\":1}\r\n" +
+		                    "\r\n" +
+		                    ": keep-alive comment\n" +
+		                    "data:{\"b\":2}\n" +
+		                    "\n" +
+		                    "data: [DONE]\n" +
+		                    "data: {\"after\":true}\n";
+
+		// Act
+		List<string> payloads = await ReadData(new MemoryStream(Encoding.UTF8.GetBytes(BODY)));
+
+		// Assert
+		payloads.Should().Equal("{\"a\":1}", "{\"b\":2}");
+	}
+
+	[Fact]
+	public async Task ReadLinesAsync_LinesSplitAcrossReads_ShouldReassemble() {
+		// Arrange: one byte per read forces every line to straddle buffer refills
+		string        longLine = new string('x', 40 * 1024);
+		byte[]        body     = Encoding.UTF8.GetBytes($"first\r\n{longLine}\nlast");
+		OneByteStream stream   = new OneByteStream(body);
+
+		// Act
+		List<string> lines = [];
+		await foreach (ReadOnlyMemory<byte> line in ServerSentEvents.ReadLinesAsync(stream)) {
+			lines.Add(Encoding.UTF8.GetString(line.Span));
+		}
+
+		// Assert
+		lines.Should().Equal("first", longLine, "last");
+	}
+
+	private sealed class OneByteStream(byte[] data) : MemoryStream(data) {
+		public override ValueTask<int> ReadAsync(Memory<byte> buffer, CancellationToken cancellationToken = default) {
+			return base.ReadAsync(buffer[..Math.Min(1, buffer.Length)], cancellationToken);
+		}
+	}
+}